@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""Benchmark decoding of a large activities page.
+
+Compares the previous path (response.json(), manual datetime parsing and one
+model constructor call per item) against decoding the whole page from bytes
+with a cached TypeAdapter, for every JSON backend that is installed.
+
+Usage: python scripts/bench_decode.py [--items 10000] [--runs 20]
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime
+
+import httpx
+
+from vaulty import serialization
+from vaulty.models import ActivityResponse, PaginatedResponse
+
+
+def _page(items: int) -> bytes:
+    """Build an activities page body like the API returns."""
+    return json.dumps(
+        {
+            "items": [
+                {
+                    "id": f"act_{i}",
+                    "action": "get_secret",
+                    "method": "GET",
+                    "resource_type": "secret",
+                    "resource_id": f"sec_{i}",
+                    "customer_id": "cus_1",
+                    "project_id": "prj_1",
+                    "ip_address": "10.0.0.1",
+                    "user_agent": "vaulty-client/0.1.1",
+                    "created_at": "2026-10-16T12:00:00Z",
+                    "metadata": {"key": f"KEY_{i}", "status_code": 200},
+                }
+                for i in range(items)
+            ],
+            "total": items,
+            "page": 1,
+            "page_size": items,
+            "total_pages": 1,
+            "has_next": False,
+            "has_previous": False,
+        }
+    ).encode()
+
+
+def _previous_path(response: httpx.Response) -> PaginatedResponse[ActivityResponse]:
+    """Decoding as done before serialization.decode."""
+    data = response.json()
+    items = []
+    for item in data["items"]:
+        if isinstance(item.get("created_at"), str):
+            item["created_at"] = datetime.fromisoformat(item["created_at"].replace("Z", "+00:00"))
+        items.append(ActivityResponse(**item))
+    return PaginatedResponse[ActivityResponse](
+        items=items,
+        total=data["total"],
+        page=data["page"],
+        page_size=data["page_size"],
+        total_pages=data["total_pages"],
+        has_next=data["has_next"],
+        has_previous=data["has_previous"],
+    )
+
+
+def _timed(func, runs: int) -> float:
+    """Return the median duration of func() in milliseconds."""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000, help="Activities per page")
+    parser.add_argument("--runs", type=int, default=20, help="Iterations per scenario")
+    args = parser.parse_args()
+
+    # A fresh Response per run so httpx doesn't serve a cached parse
+    body = _page(args.items)
+    page_type = PaginatedResponse[ActivityResponse]
+
+    baseline_ms = _timed(lambda: _previous_path(httpx.Response(200, content=body)), args.runs)
+    print(f"{args.items} items, median of {args.runs} runs")
+    print(f"  {'previous (json + Model(**item))':34} {baseline_ms:8.1f} ms")
+
+    for backend in serialization.JSON_BACKENDS:
+        try:
+            serialization.set_json_backend(backend)
+        except ValueError:
+            print(f"  {'decode, ' + backend:34} {'not installed':>11}")
+            continue
+        decode_ms = _timed(
+            lambda: serialization.decode(httpx.Response(200, content=body), page_type), args.runs
+        )
+        print(f"  {'decode, ' + backend:34} {decode_ms:8.1f} ms  ({baseline_ms / decode_ms:.1f}x)")
+
+    serialization.set_json_backend("pydantic")
+
+
+if __name__ == "__main__":
+    main()
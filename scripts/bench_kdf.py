@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Benchmark credentials key lookup for CLI startup.
+
+Compares running PBKDF2 on every lookup (old behaviour) against the
+per-process memo and the runtime-dir key file used by a fresh process.
+
+Usage: python scripts/bench_kdf.py [--runs 20]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from vaulty.cli import config
+
+
+def _timed(func, runs: int) -> float:
+    """Return the median duration of func() in milliseconds."""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Iterations per scenario")
+    args = parser.parse_args()
+
+    machine_id = "bench-host-bench-user"
+
+    with tempfile.TemporaryDirectory() as runtime_dir:
+        os.environ["XDG_RUNTIME_DIR"] = runtime_dir
+        os.environ.pop("VAULTY_KEY_CACHE", None)
+
+        kdf_ms = _timed(lambda: config._derive_key(machine_id), args.runs)
+
+        def fresh_process_lookup():
+            # A new CLI process starts with an empty memo but finds the key file
+            config._derived_keys.clear()
+            config._get_machine_key(machine_id)
+
+        config._get_machine_key(machine_id)  # populate the key file
+        file_ms = _timed(fresh_process_lookup, args.runs)
+
+        config._get_machine_key(machine_id)
+        memo_ms = _timed(lambda: config._get_machine_key(machine_id), args.runs)
+
+    print(f"PBKDF2 derivation (per lookup, old): {kdf_ms:8.3f} ms")
+    print(f"Runtime-dir key file (new process):  {file_ms:8.3f} ms")
+    print(f"Per-process memo (repeat lookup):    {memo_ms:8.3f} ms")
+    print(f"Startup saving per lookup:           {kdf_ms - file_ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Benchmark CLI cold start using `python -X importtime`.
+
+Imports each module in a fresh interpreter, reports the median cumulative
+import time and the slowest imports, and fails if a budget is exceeded.
+
+Usage: python scripts/bench_startup.py [--runs 5] [--budget-ms 100] [--top 10]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Module imported on every CLI invocation -> budget in milliseconds
+BUDGETS_MS = {
+    "vaulty.cli.main": 100.0,
+}
+
+# Modules that must not be loaded by the CLI entry point itself
+HEAVY_MODULES = ("httpx", "pydantic", "rich", "yaml", "cryptography")
+
+
+def _importtime(module: str) -> dict[str, float]:
+    """Import a module in a fresh interpreter; return cumulative ms per imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        # Lines look like "import time: <self us> | <cumulative us> | <module>"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        timings[name.strip()] = int(cumulative) / 1000
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument("--budget-ms", type=float, help="Override the budget for every module")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to show")
+    args = parser.parse_args()
+
+    over_budget = False
+    for module, default_budget_ms in BUDGETS_MS.items():
+        budget_ms = args.budget_ms if args.budget_ms is not None else default_budget_ms
+        runs = [_importtime(module) for _ in range(args.runs)]
+        total_ms = statistics.median(run[module] for run in runs)
+
+        status = "ok" if total_ms <= budget_ms else "OVER BUDGET"
+        print(f"{module}: {total_ms:.1f} ms (budget {budget_ms:.0f} ms) {status}")
+        over_budget |= total_ms > budget_ms
+
+        loaded = runs[-1]
+        heavy = [name for name in HEAVY_MODULES if name in loaded]
+        if heavy:
+            print(f"  heavy modules loaded: {', '.join(heavy)}")
+            over_budget = True
+
+        slowest = sorted(
+            (item for item in loaded.items() if item[0] != module),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        for name, cumulative_ms in slowest[: args.top]:
+            print(f"  {cumulative_ms:8.1f} ms  {name}")
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ try:
 
     import click.testing
 
+    # Command modules load lazily; import them before tests patch their dependencies
+    from vaulty.cli.commands import activities, auth, health, projects, secrets  # noqa: F401
     from vaulty.cli.main import cli
 
     CLI_AVAILABLE = True
@@ -139,3 +141,541 @@ def test_cli_health_check(cli_runner):
         result = cli_runner.invoke(cli, ["health"])
 
         assert result.exit_code in [0, 1, 2]
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_secrets_export_concurrent(cli_runner):
+    """Test 'vaulty secrets export' keeps key order and reports per-key failures."""
+    from unittest.mock import AsyncMock
+
+    from vaulty import VaultyBulkError, VaultyNotFoundError
+
+    async def iter_all(project_name):  # noqa: ARG001
+        for key in ["A", "B", "C"]:
+            yield MagicMock(key=key)
+
+    mock_client = MagicMock()
+    mock_client.secrets.iter_all = MagicMock(side_effect=iter_all)
+    mock_client.secrets.get_many = AsyncMock(
+        side_effect=VaultyBulkError(
+            "Failed to fetch 1 of 3 secrets",
+            results={"C": MagicMock(value="value-C"), "A": MagicMock(value="value-A")},
+            errors={"B": VaultyNotFoundError("Resource not found", 404, "missing")},
+        )
+    )
+
+    with patch("vaulty.cli.commands.secrets.get_client", return_value=mock_client):
+        result = cli_runner.invoke(
+            cli, ["secrets", "export", "--project", "test-project", "--concurrency", "2"]
+        )
+
+    assert result.exit_code == 1
+    assert result.stdout.splitlines() == [
+        "export VAULTY_SECRET_A=value-A",
+        "export VAULTY_SECRET_C=value-C",
+    ]
+    assert "Failed to fetch secret 'B'" in result.stderr
+    mock_client.secrets.iter_all.assert_called_once_with(project_name="test-project")
+    mock_client.secrets.get_many.assert_awaited_once_with(
+        "test-project", ["A", "B", "C"], concurrency=2
+    )
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_entry_point_imports_are_lazy():
+    """Test importing the CLI doesn't load command modules or heavy dependencies."""
+    import subprocess
+    import sys
+
+    heavy = ["httpx", "pydantic", "rich", "yaml", "cryptography", "vaulty.cli.commands.secrets"]
+    code = (
+        f"import sys, vaulty.cli.main; print([name for name in {heavy!r} if name in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_lists_lazy_command_groups(cli_runner):
+    """Test lazily loaded command groups show up in help and are invocable."""
+    result = cli_runner.invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name in ["activities", "auth", "customers", "health", "projects", "secrets", "tokens"]:
+        assert name in result.output
+
+    result = cli_runner.invoke(cli, ["secrets", "--help"])
+    assert result.exit_code == 0
+    assert "Secret management commands." in result.output
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_secrets_get_uses_agent(cli_runner):
+    """Test 'vaulty get' is served by the agent without creating a client."""
+    mock_agent = MagicMock()
+    mock_agent.project.return_value = "test-project"
+    mock_agent.get_value.return_value = {"key": "API_KEY", "value": "secret-value"}
+
+    with (
+        patch("vaulty.cli.commands.secrets.AgentClient.from_env", return_value=mock_agent),
+        patch("vaulty.cli.commands.secrets.get_client") as mock_get_client,
+    ):
+        result = cli_runner.invoke(cli, ["get", "API_KEY", "--format", "plain"])
+
+    assert result.exit_code == 0
+    assert result.output.strip() == "secret-value"
+    mock_agent.get_value.assert_called_once_with("test-project", "API_KEY")
+    mock_get_client.assert_not_called()
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_secrets_get_many_passes_concurrency_to_agent(cli_runner):
+    """Test 'vaulty get --concurrency' applies when the agent serves the keys."""
+    mock_agent = MagicMock()
+    mock_agent.get_many.return_value = {
+        "A": {"key": "A", "value": "1"},
+        "B": {"key": "B", "value": "2"},
+    }
+
+    with (
+        patch("vaulty.cli.commands.secrets.AgentClient.from_env", return_value=mock_agent),
+        patch("vaulty.cli.commands.secrets.get_client") as mock_get_client,
+    ):
+        result = cli_runner.invoke(
+            cli, ["get", "A", "B", "--project", "test-project", "--format", "json", "-c", "3"]
+        )
+
+    assert result.exit_code == 0
+    mock_agent.get_many.assert_called_once_with("test-project", ["A", "B"], concurrency=3)
+    mock_get_client.assert_not_called()
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["set", "API_KEY", "v"],
+        ["update", "API_KEY", "v"],
+        ["delete", "API_KEY"],
+        ["secrets", "create", "API_KEY", "v"],
+        ["secrets", "update", "API_KEY", "v"],
+        ["secrets", "delete", "API_KEY"],
+    ],
+)
+def test_cli_secret_writes_invalidate_agent_cache(cli_runner, args):
+    """Test write commands drop the changed secret from a running agent's cache."""
+    from unittest.mock import AsyncMock
+
+    mock_agent = MagicMock()
+    mock_client = MagicMock()
+    for method in ("create", "update", "delete"):
+        setattr(mock_client.secrets, method, AsyncMock(return_value=MagicMock()))
+
+    with (
+        patch("vaulty.cli.agent.AgentClient.from_env", return_value=mock_agent),
+        patch("vaulty.cli.utils.get_client", return_value=mock_client),
+        patch("vaulty.cli.commands.secrets.get_client", return_value=mock_client),
+    ):
+        result = cli_runner.invoke(cli, [*args, "--project", "test-project"])
+
+    assert result.exit_code == 0, result.output
+    mock_agent.invalidate.assert_called_once_with("test-project", "API_KEY")
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_secrets_get_falls_back_without_agent(cli_runner):
+    """Test 'vaulty get' fetches directly when the agent socket is dead."""
+    from unittest.mock import AsyncMock
+
+    from vaulty.cli.agent import AgentUnavailableError
+
+    mock_agent = MagicMock()
+    mock_agent.get_value.side_effect = AgentUnavailableError("gone")
+    mock_client = MagicMock()
+    mock_value = MagicMock()
+    mock_value.dict.return_value = {"key": "API_KEY", "value": "direct-value"}
+    mock_client.secrets.get_value = AsyncMock(return_value=mock_value)
+
+    with (
+        patch("vaulty.cli.commands.secrets.AgentClient.from_env", return_value=mock_agent),
+        patch("vaulty.cli.commands.secrets.get_client", return_value=mock_client),
+    ):
+        result = cli_runner.invoke(
+            cli, ["get", "API_KEY", "--project", "test-project", "--format", "plain"]
+        )
+
+    assert result.exit_code == 0
+    assert result.output.strip() == "direct-value"
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_run_injects_secrets(cli_runner):
+    """Test 'vaulty run' fetches matching secrets and execs the command with them."""
+    from unittest.mock import AsyncMock
+
+    async def iter_all(project_name):  # noqa: ARG001
+        for key in ["DB_HOST", "DB_PASSWORD", "API_KEY"]:
+            yield MagicMock(key=key)
+
+    mock_client = MagicMock()
+    mock_client.close = AsyncMock()
+    mock_client.secrets.iter_all = MagicMock(side_effect=iter_all)
+    mock_client.secrets.get_many = AsyncMock(
+        return_value={
+            "DB_HOST": MagicMock(value="db.local"),
+            "DB_PASSWORD": MagicMock(value="hunter2"),
+        }
+    )
+
+    with (
+        patch("vaulty.cli.commands.run.get_client", return_value=mock_client),
+        patch("vaulty.cli.commands.run.os.execvpe") as mock_exec,
+    ):
+        result = cli_runner.invoke(
+            cli,
+            ["run", "-p", "test-project", "--prefix", "", "--match", "DB_*", "--", "env", "-0"],
+        )
+
+    assert result.exit_code == 0
+    mock_client.secrets.get_many.assert_awaited_once_with(
+        "test-project", ["DB_HOST", "DB_PASSWORD"], concurrency=10
+    )
+    file, argv, env = mock_exec.call_args.args
+    assert (file, argv) == ("env", ["env", "-0"])
+    assert env["DB_HOST"] == "db.local"
+    assert env["DB_PASSWORD"] == "hunter2"
+    assert "API_KEY" not in env
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_run_does_not_exec_on_failure(cli_runner):
+    """Test 'vaulty run' refuses to start the command when a secret is missing."""
+    from unittest.mock import AsyncMock
+
+    from vaulty import VaultyBulkError, VaultyNotFoundError
+
+    mock_client = MagicMock()
+    mock_client.close = AsyncMock()
+    mock_client.secrets.get_many = AsyncMock(
+        side_effect=VaultyBulkError(
+            "Failed to fetch 1 of 2 secrets",
+            results={"A": MagicMock(value="a")},
+            errors={"B": VaultyNotFoundError("Resource not found", 404)},
+        )
+    )
+
+    with (
+        patch("vaulty.cli.commands.run.get_client", return_value=mock_client),
+        patch("vaulty.cli.commands.run.os.execvpe") as mock_exec,
+    ):
+        result = cli_runner.invoke(
+            cli, ["run", "-p", "test-project", "-k", "A", "-k", "B", "--", "true"]
+        )
+
+    assert result.exit_code == 1
+    assert "Failed to fetch secret 'B'" in result.stderr
+    mock_client.secrets.iter_all.assert_not_called()
+    mock_exec.assert_not_called()
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_get_multiple_keys(cli_runner):
+    """Test 'vaulty get' with several keys fetches them in one batch."""
+    import json
+    from unittest.mock import AsyncMock
+
+    mock_client = MagicMock()
+    mock_client.secrets.get_many = AsyncMock(
+        return_value={
+            "DB_HOST": MagicMock(dict=MagicMock(return_value={"value": "db.local"})),
+            "DB_PASSWORD": MagicMock(dict=MagicMock(return_value={"value": "hunter2"})),
+        }
+    )
+
+    with patch("vaulty.cli.commands.secrets.get_client", return_value=mock_client):
+        result = cli_runner.invoke(
+            cli, ["get", "DB_HOST", "DB_PASSWORD", "-p", "test-project", "-f", "json"]
+        )
+        env_result = cli_runner.invoke(
+            cli,
+            ["g", "DB_HOST", "DB_PASSWORD", "-p", "test-project", "-f", "env", "--prefix", ""],
+        )
+
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {"DB_HOST": "db.local", "DB_PASSWORD": "hunter2"}
+    assert env_result.output.splitlines() == [
+        "export DB_HOST=db.local",
+        "export DB_PASSWORD=hunter2",
+    ]
+    mock_client.secrets.get_many.assert_awaited_with(
+        "test-project", ["DB_HOST", "DB_PASSWORD"], concurrency=10
+    )
+    mock_client.secrets.iter_all.assert_not_called()
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_get_match_reports_failures(cli_runner):
+    """Test 'vaulty get --match' prints fetched values and fails for the rest."""
+    from unittest.mock import AsyncMock
+
+    from vaulty import VaultyBulkError, VaultyNotFoundError
+
+    async def iter_all(project_name):  # noqa: ARG001
+        for key in ["DB_HOST", "API_KEY", "DB_PASSWORD"]:
+            yield MagicMock(key=key)
+
+    mock_client = MagicMock()
+    mock_client.secrets.iter_all = MagicMock(side_effect=iter_all)
+    mock_client.secrets.get_many = AsyncMock(
+        side_effect=VaultyBulkError(
+            "Failed to fetch 1 of 2 secrets",
+            results={"DB_HOST": MagicMock(dict=MagicMock(return_value={"value": "db.local"}))},
+            errors={"DB_PASSWORD": VaultyNotFoundError("Resource not found", 404)},
+        )
+    )
+
+    with patch("vaulty.cli.commands.secrets.get_client", return_value=mock_client):
+        result = cli_runner.invoke(
+            cli, ["get", "--match", "DB_*", "-p", "test-project", "-f", "plain"]
+        )
+
+    assert result.exit_code == 1
+    assert result.stdout.splitlines() == ["db.local"]
+    assert "Failed to fetch secret 'DB_PASSWORD'" in result.stderr
+    mock_client.secrets.get_many.assert_awaited_once_with(
+        "test-project", ["DB_HOST", "DB_PASSWORD"], concurrency=10
+    )
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_get_match_reports_project_errors(cli_runner):
+    """Test listing failures in --match mode name the project, not a secret."""
+    from vaulty import VaultyAuthorizationError, VaultyNotFoundError
+
+    mock_client = MagicMock()
+    mock_client.secrets.iter_all = MagicMock(
+        side_effect=[
+            VaultyNotFoundError("Resource not found", 404),
+            VaultyAuthorizationError("Forbidden", 403),
+        ]
+    )
+
+    with patch("vaulty.cli.commands.secrets.get_client", return_value=mock_client):
+        missing = cli_runner.invoke(cli, ["get", "--match", "DB_*", "-p", "missing-project"])
+        forbidden = cli_runner.invoke(cli, ["get", "--match", "DB_*", "-p", "other-project"])
+
+    assert missing.exit_code == 1
+    assert missing.stderr.strip() == "Error: Project 'missing-project' not found"
+    assert forbidden.exit_code == 1
+    assert forbidden.stderr.strip() == (
+        "Error: Insufficient permissions to access secrets in project 'other-project'"
+    )
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_get_requires_key_or_match(cli_runner):
+    """Test 'vaulty get' without keys or --match is a usage error."""
+    result = cli_runner.invoke(cli, ["get"])
+
+    assert result.exit_code == 2
+    assert "at least one KEY or --match" in result.stderr
+
+
+def _activity_pages(total_pages, fail_on=None):
+    """Build an activities.list side effect serving RawPages of two activities."""
+    from vaulty.models import RawPage
+
+    async def list_activities(page, **kwargs):  # noqa: ARG001
+        if page == fail_on:
+            raise ConnectionError("connection reset")
+        items = [
+            {"id": f"a{page}-{i}", "action": "get_secret", "created_at": "2026-10-16T12:00:00Z"}
+            for i in range(2)
+        ]
+        return RawPage(items, 2 * total_pages, page, 2, total_pages, page < total_pages, page > 1)
+
+    return list_activities
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_activities_export_jsonl(cli_runner, tmp_path):
+    """Test 'vaulty activities export' writes every page and removes its checkpoint."""
+    import json
+    from unittest.mock import AsyncMock
+
+    out = tmp_path / "activities.jsonl"
+    mock_client = MagicMock()
+    mock_client.activities.list = AsyncMock(side_effect=_activity_pages(3))
+
+    with patch("vaulty.cli.commands.activities.get_client", return_value=mock_client):
+        result = cli_runner.invoke(
+            cli, ["activities", "export", "--since", "2026-10-01", "--out", str(out)]
+        )
+
+    assert result.exit_code == 0, result.output
+    ids = [json.loads(line)["id"] for line in out.read_text().splitlines()]
+    assert ids == ["a1-0", "a1-1", "a2-0", "a2-1", "a3-0", "a3-1"]
+    assert not (tmp_path / "activities.jsonl.checkpoint").exists()
+    assert "Exported 6 activities" in result.stderr
+
+    # Every page is requested with the same (snapshotted) time range, as plain dicts
+    end_dates = {call.kwargs["end_date"] for call in mock_client.activities.list.await_args_list}
+    assert len(end_dates) == 1
+    assert all(call.kwargs["raw"] for call in mock_client.activities.list.await_args_list)
+
+
+def _activity_source(activity_ids, descending=False, fail_after=None):
+    """Build an activities.list side effect paging through activities like the API.
+
+    Activity a-N is created at second N // 2, so pairs share a timestamp. The
+    start_date/end_date filters are inclusive.
+    """
+    from datetime import datetime
+
+    from vaulty.models import RawPage
+
+    activities = [
+        {
+            "id": f"a-{i}",
+            "action": "get_secret",
+            "created_at": f"2026-10-16T12:00:{i // 2:02}Z",
+        }
+        for i in activity_ids
+    ]
+    calls = 0
+
+    async def list_activities(page, page_size, start_date, end_date, **kwargs):  # noqa: ARG001
+        nonlocal calls
+        calls += 1
+        if calls == fail_after:
+            raise ConnectionError("connection reset")
+        matching = [
+            item
+            for item in activities
+            if start_date <= datetime.fromisoformat(item["created_at"]) <= end_date
+        ]
+        matching.sort(key=lambda item: (item["created_at"], item["id"]), reverse=descending)
+        total_pages = max(1, -(-len(matching) // page_size))
+        items = matching[(page - 1) * page_size : page * page_size]
+        return RawPage(
+            items, len(matching), page, page_size, total_pages, page < total_pages, page > 1
+        )
+
+    return list_activities
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+@pytest.mark.parametrize("descending", [False, True])
+def test_cli_activities_export_resume(cli_runner, tmp_path, descending):
+    """Test an interrupted CSV export resumes from the last written created_at."""
+    import json
+    from unittest.mock import AsyncMock
+
+    out = tmp_path / "activities.csv"
+    checkpoint_path = tmp_path / "activities.csv.checkpoint"
+    args = [
+        "activities",
+        "export",
+        "--since",
+        "2026-10-16T12:00:00",
+        "--out",
+        str(out),
+        "-f",
+        "csv",
+        "--page-size",
+        "3",
+    ]
+
+    mock_client = MagicMock()
+    mock_client.activities.list = AsyncMock(
+        side_effect=_activity_source(range(6), descending, fail_after=2)
+    )
+    with patch("vaulty.cli.commands.activities.get_client", return_value=mock_client):
+        result = cli_runner.invoke(cli, args)
+
+    # The first page split the pair created at second 1
+    assert result.exit_code == 1
+    checkpoint = json.loads(checkpoint_path.read_text())
+    assert checkpoint["order"] == ("desc" if descending else "asc")
+    assert checkpoint["last_created_at"] == "2026-10-16T12:00:01Z"
+    assert checkpoint["boundary_ids"] == (["a-3"] if descending else ["a-2"])
+
+    # Simulate a page that was half-written when the process died
+    with out.open("ab") as f:
+        f.write(b"a-9,get_sec")
+
+    # Meanwhile retention purged the oldest activity, shifting every page offset
+    mock_client.activities.list = AsyncMock(side_effect=_activity_source(range(1, 6), descending))
+    with patch("vaulty.cli.commands.activities.get_client", return_value=mock_client):
+        result = cli_runner.invoke(cli, [*args, "--resume"])
+
+    assert result.exit_code == 0, result.output
+    lines = out.read_text().splitlines()
+    assert lines[0].startswith("id,action,method")
+    # In descending order the purged activity hadn't been written yet
+    expected = [f"a-{i}" for i in range(5, 0, -1)] if descending else [f"a-{i}" for i in range(6)]
+    assert [line.split(",")[0] for line in lines[1:]] == expected
+    assert f"Exported {len(expected)} activities" in result.stderr
+
+    # The resumed export starts at the keyset, not at a page offset
+    first_call = mock_client.activities.list.await_args_list[0].kwargs
+    assert first_call["page"] == 1
+    boundary = "end_date" if descending else "start_date"
+    assert first_call[boundary].isoformat() == "2026-10-16T12:00:01+00:00"
+    assert not checkpoint_path.exists()
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_activities_export_resume_rejects_changed_options(cli_runner, tmp_path):
+    """Test --resume refuses a checkpoint written for other filters."""
+    out = tmp_path / "activities.jsonl"
+    (tmp_path / "activities.jsonl.checkpoint").write_text(
+        '{"format": "jsonl", "since": "2026-10-01T00:00:00+00:00", "until": "2026-10-17T00:00:00+00:00",'
+        ' "action": null, "method": null, "resource_id": null, "search": null, "page_size": 100}'
+    )
+
+    with patch("vaulty.cli.commands.activities.get_client") as mock_get_client:
+        result = cli_runner.invoke(
+            cli,
+            [
+                "activities",
+                "export",
+                "--since",
+                "2026-10-01",
+                "--out",
+                str(out),
+                "--action",
+                "get_secret",
+                "--resume",
+            ],
+        )
+
+    assert result.exit_code == 1
+    assert "different options (action)" in result.stderr
+    mock_get_client.assert_not_called()
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_cli_activities_tail(cli_runner):
+    """Test 'vaulty activities tail' prints one JSON line per activity."""
+    import json
+
+    async def tail(**kwargs):  # noqa: ARG001
+        for activity_id in ["a-1", "a-2"]:
+            yield {"id": activity_id, "action": "get_secret"}
+
+    mock_client = MagicMock()
+    mock_client.activities.tail = MagicMock(side_effect=tail)
+
+    with patch("vaulty.cli.commands.activities.get_client", return_value=mock_client):
+        result = cli_runner.invoke(cli, ["activities", "tail", "--since", "2026-10-16"])
+
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line)["id"] for line in result.stdout.splitlines()] == ["a-1", "a-2"]
+    kwargs = mock_client.activities.tail.call_args.kwargs
+    assert kwargs["start_date"].isoformat() == "2026-10-16T00:00:00"
+    assert kwargs["follow"] is False
+    assert kwargs["raw"] is True
@@ -0,0 +1,124 @@
+"""Tests for in-process caches."""
+
+from unittest.mock import patch
+
+import pytest
+
+from vaulty.cache import SecretCache
+from vaulty.exceptions import VaultyNotFoundError
+from vaulty.models import SecretValueResponse
+
+
+def _value(key: str, value: str = "v") -> SecretValueResponse:
+    return SecretValueResponse(key=key, value=value)
+
+
+def test_secret_cache_hit_and_miss():
+    """Test SecretCache counts hits and misses."""
+    cache = SecretCache()
+
+    assert cache.get("p", "K") is None
+    cache.set("p", "K", _value("K", "secret"))
+
+    cached = cache.get("p", "K")
+    assert cached.value == "secret"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["size"] == 1
+
+
+def test_secret_cache_ttl_expiry():
+    """Test SecretCache treats expired entries as misses."""
+    cache = SecretCache(ttl=10.0)
+
+    with patch("vaulty.cache.time.monotonic", return_value=100.0):
+        cache.set("p", "K", _value("K"))
+    with patch("vaulty.cache.time.monotonic", return_value=109.0):
+        assert cache.get("p", "K") is not None
+    with patch("vaulty.cache.time.monotonic", return_value=110.0):
+        assert cache.get("p", "K") is None
+
+
+def test_secret_cache_lru_eviction():
+    """Test SecretCache evicts the least recently used entry."""
+    cache = SecretCache(max_entries=2)
+    cache.set("p", "A", _value("A"))
+    cache.set("p", "B", _value("B"))
+    cache.get("p", "A")
+    cache.set("p", "C", _value("C"))
+
+    assert cache.get("p", "B") is None
+    assert cache.get("p", "A") is not None
+    assert cache.get("p", "C") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_secret_cache_negative_caching():
+    """Test SecretCache re-raises cached not-found results."""
+    cache = SecretCache()
+    cache.set_not_found("p", "K", VaultyNotFoundError("Resource not found", 404, "missing"))
+
+    with pytest.raises(VaultyNotFoundError) as exc_info:
+        cache.get("p", "K")
+    assert exc_info.value.detail == "missing"
+
+
+def test_secret_cache_negative_caching_disabled():
+    """Test SecretCache skips not-found results when negative_ttl is None."""
+    cache = SecretCache(negative_ttl=None)
+    cache.set_not_found("p", "K", VaultyNotFoundError("Resource not found", 404))
+
+    assert cache.get("p", "K") is None
+
+
+def test_secret_cache_invalidate():
+    """Test SecretCache.invalidate drops an entry."""
+    cache = SecretCache()
+    cache.set("p", "K", _value("K"))
+    cache.invalidate("p", "K")
+
+    assert cache.get("p", "K") is None
+    assert len(cache) == 0
+
+
+def test_secret_cache_drops_results_fetched_before_invalidation():
+    """Test set() ignores a value whose fetch started before an invalidate/clear."""
+    cache = SecretCache()
+    generation = cache.generation("p", "K")
+    other = cache.generation("p", "OTHER")
+    cache.invalidate("p", "K")
+
+    cache.set("p", "K", _value("K", "old"), generation)
+    cache.set("p", "OTHER", _value("OTHER"), other)
+    assert cache.get("p", "K") is None
+    assert cache.get("p", "OTHER").value == "v"
+
+    generation = cache.generation("p", "K")
+    cache.clear()
+    cache.set("p", "K", _value("K", "old"), generation)
+    assert len(cache) == 0
+
+
+def test_secret_cache_invalid_config():
+    """Test SecretCache rejects invalid configuration."""
+    with pytest.raises(ValueError, match="max_entries"):
+        SecretCache(max_entries=0)
+
+
+def test_secret_cache_get_stale_max_staleness():
+    """Test SecretCache serves expired values up to max_staleness past expiry."""
+    cache = SecretCache(ttl=10.0)
+
+    with patch("vaulty.cache.time.monotonic", return_value=100.0):
+        cache.set("p", "K", _value("K", "old"))
+    with patch("vaulty.cache.time.monotonic", return_value=115.0):
+        assert cache.get("p", "K") is None
+        assert cache.get_stale("p", "K", max_staleness=5.0).value == "old"
+        assert cache.get_stale("p", "K", max_staleness=4.0) is None
+        assert cache.get_stale("p", "K").value == "old"
+
+    assert cache.get_stale("p", "MISSING") is None
+    assert cache.stats()["stale_hits"] == 2
+
+    with pytest.raises(ValueError, match="stale windows"):
+        SecretCache(stale_if_error=-1)
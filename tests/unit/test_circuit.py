@@ -0,0 +1,115 @@
+"""Tests for per-endpoint circuit breaking."""
+
+from unittest.mock import patch
+
+import pytest
+
+from vaulty.circuit import CircuitBreaker, CircuitBreakerRegistry, route_template
+from vaulty.exceptions import VaultyCircuitOpenError
+
+
+@pytest.fixture
+def clock():
+    """Controllable monotonic clock for the breaker."""
+    now = [100.0]
+    with patch("vaulty.circuit.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+def test_route_template_replaces_identifiers():
+    """Test project names, secret keys and token IDs are templated."""
+    assert (
+        route_template("get", "/api/v1/projects/my%20app/secrets/API_KEY")
+        == "GET /api/v1/projects/{project}/secrets/{key}"
+    )
+    assert route_template("GET", "/api/v1/projects/p/secrets") == (
+        "GET /api/v1/projects/{project}/secrets"
+    )
+    assert route_template("DELETE", "/api/v1/tokens/42") == "DELETE /api/v1/tokens/{token_id}"
+    assert route_template("GET", "/api/v1/activities") == "GET /api/v1/activities"
+    assert route_template("GET", "/api/v1/customers/me") == "GET /api/v1/customers/me"
+
+
+def test_breaker_opens_after_consecutive_failures(clock):  # noqa: ARG001
+    """Test the circuit opens at the threshold and rejects calls."""
+    breaker = CircuitBreaker("GET /x", failure_threshold=3, recovery_timeout=10.0)
+
+    for _ in range(2):
+        breaker.allow()
+        breaker.record_failure()
+    breaker.allow()
+    breaker.record_success()  # Resets the consecutive count
+    for _ in range(3):
+        breaker.allow()
+        breaker.record_failure()
+
+    assert breaker.state == "open"
+    with pytest.raises(VaultyCircuitOpenError, match="Circuit open for GET /x") as exc_info:
+        breaker.allow()
+    assert exc_info.value.route == "GET /x"
+    assert exc_info.value.retry_after == 10.0
+    assert breaker.stats() == {"state": "open", "failures": 3, "rejected": 1}
+
+
+def test_breaker_half_open_probe_closes_circuit(clock):
+    """Test one probe is let through after the recovery timeout."""
+    breaker = CircuitBreaker("GET /x", failure_threshold=1, recovery_timeout=10.0)
+    breaker.allow()
+    breaker.record_failure()
+
+    clock[0] += 10.0
+    assert breaker.state == "half_open"
+    breaker.allow()
+    with pytest.raises(VaultyCircuitOpenError, match="Circuit open"):
+        breaker.allow()  # Only one probe at a time
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.allow()
+
+
+def test_breaker_failed_probe_reopens_circuit(clock):
+    """Test a failed probe opens the circuit for another recovery timeout."""
+    breaker = CircuitBreaker("GET /x", failure_threshold=1, recovery_timeout=10.0)
+    breaker.allow()
+    breaker.record_failure()
+
+    clock[0] += 10.0
+    breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock[0] += 5.0
+    with pytest.raises(VaultyCircuitOpenError, match="Circuit open"):
+        breaker.allow()
+
+
+def test_breaker_skipped_probe_frees_slot(clock):  # noqa: ARG001
+    """Test a cancelled probe lets the next call probe instead."""
+    breaker = CircuitBreaker("GET /x", failure_threshold=1, recovery_timeout=0.0)
+    breaker.allow()
+    breaker.record_failure()
+
+    breaker.allow()
+    breaker.record_skipped()
+    breaker.allow()
+    assert breaker.state == "half_open"
+
+
+def test_registry_creates_one_breaker_per_route():
+    """Test requests to the same route template share a breaker."""
+    registry = CircuitBreakerRegistry(failure_threshold=2)
+    first = registry.get("GET", "/api/v1/projects/a/secrets/K1")
+    second = registry.get("GET", "/api/v1/projects/b/secrets/K2")
+    other = registry.get("GET", "/api/v1/activities")
+
+    assert first is second
+    assert other is not first
+    assert first.failure_threshold == 2
+    assert set(registry.stats()) == {
+        "GET /api/v1/projects/{project}/secrets/{key}",
+        "GET /api/v1/activities",
+    }
+
+    with pytest.raises(ValueError, match="failure_threshold"):
+        CircuitBreakerRegistry(failure_threshold=0)
@@ -0,0 +1,190 @@
+"""Tests for the local secrets agent."""
+
+import asyncio
+import os
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Skip CLI tests if CLI dependencies not available
+try:
+    from vaulty.cache import SecretCache
+    from vaulty.cli.agent import (
+        AgentClient,
+        AgentCredentialsError,
+        AgentServer,
+        AgentUnavailableError,
+        decode_error,
+        encode_error,
+        invalidate_agent_cache,
+    )
+    from vaulty.exceptions import (
+        VaultyBulkError,
+        VaultyNotFoundError,
+        VaultyRateLimitError,
+    )
+    from vaulty.models import SecretValueResponse
+
+    CLI_AVAILABLE = True
+except ImportError:
+    CLI_AVAILABLE = False
+
+
+def _secret(key: str) -> "SecretValueResponse":
+    now = datetime(2024, 1, 1, tzinfo=UTC)
+    return SecretValueResponse(
+        key=key, value=f"value-{key}", project_id="p-1", created_at=now, updated_at=now
+    )
+
+
+@pytest.fixture
+async def agent():
+    """Serve a mocked client on a temporary socket; yield (client mock, AgentClient)."""
+    client = MagicMock()
+    client.close = AsyncMock()
+    with tempfile.TemporaryDirectory() as socket_dir:
+        server = AgentServer(client, Path(socket_dir) / "agent.sock")
+        ready = asyncio.Event()
+        task = asyncio.create_task(server.serve(on_ready=ready.set))
+        await ready.wait()
+        yield client, AgentClient(server.socket_path, timeout=5)
+        server.stop()
+        await task
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_error_round_trip():
+    """Test API errors keep their type and fields across the socket."""
+    error = decode_error(encode_error(VaultyNotFoundError("Resource not found", 404, "missing")))
+    assert isinstance(error, VaultyNotFoundError)
+    assert (str(error), error.status_code, error.detail) == ("Resource not found", 404, "missing")
+
+    error = decode_error(encode_error(VaultyRateLimitError("Slow down", 429, retry_after=7)))
+    assert isinstance(error, VaultyRateLimitError)
+    assert error.retry_after == 7
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+async def test_agent_serves_secret_values(agent):
+    """Test get and get_many are answered from the agent's client."""
+    client, agent_client = agent
+    client.secrets.get_value = AsyncMock(return_value=_secret("API_KEY"))
+    client.secrets.get_many = AsyncMock(
+        side_effect=VaultyBulkError(
+            "Failed to fetch 1 of 2 secrets",
+            results={"A": _secret("A")},
+            errors={"B": VaultyNotFoundError("Resource not found", 404)},
+        )
+    )
+
+    assert await asyncio.to_thread(agent_client.ping) == os.getpid()
+
+    value = await asyncio.to_thread(agent_client.get_value, "my-project", "API_KEY")
+    assert value["value"] == "value-API_KEY"
+    client.secrets.get_value.assert_awaited_once_with("my-project", "API_KEY")
+
+    with pytest.raises(VaultyBulkError) as exc_info:
+        await asyncio.to_thread(agent_client.get_many, "my-project", ["A", "B"])
+    assert exc_info.value.results["A"]["value"] == "value-A"
+    assert isinstance(exc_info.value.errors["B"], VaultyNotFoundError)
+    client.secrets.get_many.assert_awaited_once_with("my-project", ["A", "B"])
+
+    client.secrets.get_many = AsyncMock(return_value={"A": _secret("A")})
+    await asyncio.to_thread(agent_client.get_many, "my-project", ["A"], 3)
+    client.secrets.get_many.assert_awaited_once_with("my-project", ["A"], concurrency=3)
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+async def test_agent_checks_env_credentials(agent, monkeypatch):
+    """Test the agent refuses requests for another VAULTY_API_TOKEN / VAULTY_API_URL."""
+    client, agent_client = agent
+    client.http_client.api_token = "agent-token"
+    client.http_client.base_url = "https://api.vaulty.com"
+    client.secrets.get_value = AsyncMock(return_value=_secret("API_KEY"))
+    monkeypatch.setenv("VAULTY_AGENT_SOCK", agent_client.socket_path)
+
+    monkeypatch.setenv("VAULTY_API_TOKEN", "agent-token")
+    monkeypatch.setenv("VAULTY_API_URL", "https://api.vaulty.com/api/")
+    env_client = AgentClient.from_env()
+    value = await asyncio.to_thread(env_client.get_value, "my-project", "API_KEY")
+    assert value["value"] == "value-API_KEY"
+
+    monkeypatch.setenv("VAULTY_API_TOKEN", "other-token")
+    with pytest.raises(AgentCredentialsError, match="VAULTY_API_TOKEN"):
+        await asyncio.to_thread(AgentClient.from_env().get_value, "my-project", "API_KEY")
+
+    monkeypatch.delenv("VAULTY_API_TOKEN")
+    monkeypatch.setenv("VAULTY_API_URL", "https://staging.vaulty.com")
+    with pytest.raises(AgentUnavailableError, match="VAULTY_API_URL"):
+        await asyncio.to_thread(AgentClient.from_env().get_value, "my-project", "API_KEY")
+
+    # Ping and stop don't touch the API, so they work regardless
+    assert await asyncio.to_thread(AgentClient.from_env().ping) == os.getpid()
+    client.secrets.get_value.assert_awaited_once()
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+async def test_agent_invalidate_drops_cached_value(agent, monkeypatch):
+    """Test invalidate requests drop a secret from the agent's value cache."""
+    client, agent_client = agent
+    client.secrets.cache = SecretCache(ttl=300)
+    client.secrets.cache.set("my-project", "API_KEY", _secret("API_KEY"))
+    client.secrets.cache.set("my-project", "OTHER", _secret("OTHER"))
+    monkeypatch.setenv("VAULTY_AGENT_SOCK", agent_client.socket_path)
+    monkeypatch.setenv("VAULTY_API_TOKEN", "not-the-agent-token")
+
+    await asyncio.to_thread(invalidate_agent_cache, "my-project", "API_KEY")
+
+    assert client.secrets.cache.get("my-project", "API_KEY") is None
+    assert client.secrets.cache.get("my-project", "OTHER") is not None
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_invalidate_agent_cache_is_best_effort(tmp_path, monkeypatch):
+    """Test a missing or dead agent doesn't fail the write command."""
+    monkeypatch.delenv("VAULTY_AGENT_SOCK", raising=False)
+    invalidate_agent_cache("my-project", "API_KEY")
+
+    monkeypatch.setenv("VAULTY_AGENT_SOCK", str(tmp_path / "missing.sock"))
+    invalidate_agent_cache("my-project", "API_KEY")
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+async def test_agent_reports_errors(agent):
+    """Test API errors and bad requests are raised on the client side."""
+    client, agent_client = agent
+    client.secrets.get_value = AsyncMock(side_effect=VaultyNotFoundError("Resource not found", 404))
+
+    with pytest.raises(VaultyNotFoundError):
+        await asyncio.to_thread(agent_client.get_value, "my-project", "MISSING")
+    with pytest.raises(ValueError, match="Unknown agent operation"):
+        await asyncio.to_thread(agent_client.request, {"op": "nope"})
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+async def test_agent_stop_request():
+    """Test a stop request shuts the agent down and removes its socket."""
+    client = MagicMock()
+    client.close = AsyncMock()
+    with tempfile.TemporaryDirectory() as socket_dir:
+        server = AgentServer(client, Path(socket_dir) / "agent.sock")
+        ready = asyncio.Event()
+        task = asyncio.create_task(server.serve(on_ready=ready.set))
+        await ready.wait()
+        assert oct(server.socket_path.stat().st_mode & 0o777) == oct(0o600)
+
+        await asyncio.to_thread(AgentClient(server.socket_path).stop)
+        await asyncio.wait_for(task, timeout=5)
+
+        assert not server.socket_path.exists()
+        client.close.assert_awaited_once()
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_agent_client_unavailable(tmp_path):
+    """Test connecting to a missing socket raises AgentUnavailableError."""
+    with pytest.raises(AgentUnavailableError):
+        AgentClient(tmp_path / "missing.sock").ping()
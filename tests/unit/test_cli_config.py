@@ -0,0 +1,71 @@
+"""Tests for CLI configuration."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+# Skip CLI tests if CLI dependencies not available
+try:
+    from vaulty.cli import config as cli_config
+
+    CLI_AVAILABLE = True
+except ImportError:
+    CLI_AVAILABLE = False
+
+
+@pytest.fixture
+def runtime_dir(tmp_path):
+    """Isolated runtime dir and empty key memo."""
+    with patch.dict(os.environ, {"XDG_RUNTIME_DIR": str(tmp_path), "VAULTY_KEY_CACHE": "1"}):
+        cli_config._derived_keys.clear()
+        yield tmp_path
+        cli_config._derived_keys.clear()
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+@pytest.mark.usefixtures("runtime_dir")
+def test_machine_key_memoized_per_process():
+    """Test the KDF runs once per process for repeated lookups."""
+    with patch.object(cli_config, "_derive_key", wraps=cli_config._derive_key) as mock_derive:
+        first = cli_config._get_machine_key("host-user")
+        second = cli_config._get_machine_key("host-user")
+
+    assert first == second
+    assert mock_derive.call_count == 1
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_machine_key_reused_from_runtime_dir(runtime_dir):
+    """Test a new process reads the derived key from the runtime dir."""
+    key = cli_config._get_machine_key("host-user")
+    key_files = list((runtime_dir / "vaulty").iterdir())
+    assert len(key_files) == 1
+    assert key_files[0].stat().st_mode & 0o777 == 0o600
+
+    cli_config._derived_keys.clear()
+    with patch.object(cli_config, "_derive_key") as mock_derive:
+        assert cli_config._get_machine_key("host-user") == key
+        mock_derive.assert_not_called()
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_machine_key_ignores_insecure_runtime_file(runtime_dir):
+    """Test a key file readable by other users is not trusted."""
+    key = cli_config._get_machine_key("host-user")
+    key_file = next((runtime_dir / "vaulty").iterdir())
+    key_file.chmod(0o644)
+
+    cli_config._derived_keys.clear()
+    with patch.object(cli_config, "_derive_key", return_value=key) as mock_derive:
+        cli_config._get_machine_key("host-user")
+        mock_derive.assert_called_once()
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_machine_key_cache_disabled(runtime_dir):
+    """Test VAULTY_KEY_CACHE=0 keeps the key out of the runtime dir."""
+    with patch.dict(os.environ, {"VAULTY_KEY_CACHE": "0"}):
+        cli_config._get_machine_key("host-user")
+
+    assert not (runtime_dir / "vaulty").exists()
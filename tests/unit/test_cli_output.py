@@ -0,0 +1,62 @@
+"""Tests for CLI output formatting."""
+
+import subprocess
+
+import pytest
+
+# Skip CLI tests if CLI dependencies not available
+try:
+    from vaulty.cli.output import OutputFormatter
+
+    CLI_AVAILABLE = True
+except ImportError:
+    CLI_AVAILABLE = False
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_output_formatter_reuses_console():
+    """Test the rich console is created once per formatter."""
+    formatter = OutputFormatter(format="table")
+
+    assert formatter.console is formatter.console
+    assert OutputFormatter().console is not formatter.console
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_output_formatter_table():
+    """Test table output renders every row with titled columns."""
+    formatter = OutputFormatter(format="table")
+    data = {"items": [{"key": "A", "secret_id": "s-1"}, {"key": "B", "secret_id": "s-2"}]}
+
+    output = formatter.format_output(data)
+
+    assert "Secret Id" in output
+    assert "s-1" in output
+    assert "s-2" in output
+    assert formatter.format_output({"items": []}) == "No items found."
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+def test_output_formatter_env_quotes_values(tmp_path):
+    """Test env exports quote values so eval doesn't split or execute them."""
+    formatter = OutputFormatter(format="env")
+    data = {
+        "items": [
+            {"key": "PLAIN", "value": "db.local"},
+            {"key": "TRICKY", "value": "a b $(touch pwned) 'q'\nline"},
+        ]
+    }
+
+    output = formatter.format_env(data, prefix="")
+
+    assert output.splitlines()[0] == "export PLAIN=db.local"
+    assert output.startswith("export PLAIN=db.local\nexport TRICKY='a b $(touch pwned) '")
+    result = subprocess.run(
+        ["sh", "-c", f'{output}\nprintf %s "$TRICKY"'],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tmp_path,
+    )
+    assert result.stdout == "a b $(touch pwned) 'q'\nline"
+    assert not (tmp_path / "pwned").exists()
@@ -155,3 +155,71 @@ def test_detect_cicd_gitlab_ci():
     """Test detect_cicd detects GitLab CI."""
     with patch.dict(os.environ, {"GITLAB_CI": "true"}):
         assert detect_cicd() is True
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+@pytest.mark.asyncio
+async def test_get_project_from_token_scope_uses_client_cache():
+    """Test get_project_from_token_scope resolves once per client and token."""
+    client = VaultyClient(base_url="https://api.test.com", api_token="test-token")
+
+    mock_token = MagicMock()
+    mock_token.scope = "project:p-12345:read"
+    mock_result = MagicMock()
+    mock_result.items = [mock_token]
+
+    with (
+        patch.dict(os.environ, {"VAULTY_SCOPE_CACHE_TTL": "0"}),
+        patch.object(client.tokens, "list", AsyncMock(return_value=mock_result)) as mock_list,
+    ):
+        first = await get_project_from_token_scope(client)
+        second = await get_project_from_token_scope(client)
+
+        assert first == second == {"id": "p-12345", "name": "p-12345"}
+        assert mock_list.call_count == 1
+        assert client.project_scope.get(client.http_client.auth_header) == first
+
+        # A different token must resolve again
+        client.http_client.auth_header = "Bearer other-token"
+        await get_project_from_token_scope(client)
+        assert mock_list.call_count == 2
+
+    await client.close()
+
+
+@pytest.mark.skipif(not CLI_AVAILABLE, reason="CLI dependencies not available")
+@pytest.mark.asyncio
+async def test_get_project_from_token_scope_disk_cache(tmp_path):
+    """Test token scope resolution is reused across CLI invocations via disk cache."""
+    mock_token = MagicMock()
+    mock_token.scope = "project:p-12345:read"
+    mock_result = MagicMock()
+    mock_result.items = [mock_token]
+
+    with (
+        patch("vaulty.cli.config.Path.home", return_value=tmp_path),
+        patch.dict(os.environ, {"VAULTY_SCOPE_CACHE_TTL": "3600"}),
+    ):
+        # First "invocation" resolves over the network and writes the cache
+        client = VaultyClient(base_url="https://api.test.com", api_token="test-token")
+        with patch.object(client.tokens, "list", AsyncMock(return_value=mock_result)):
+            assert (await get_project_from_token_scope(client))["id"] == "p-12345"
+        await client.close()
+
+        cache_file = tmp_path / ".vaulty" / "scope_cache.json"
+        assert cache_file.exists()
+        assert "test-token" not in cache_file.read_text()
+
+        # Second "invocation" (fresh client) is served from disk
+        client = VaultyClient(base_url="https://api.test.com", api_token="test-token")
+        with patch.object(client.tokens, "list", AsyncMock()) as mock_list:
+            assert (await get_project_from_token_scope(client))["id"] == "p-12345"
+            mock_list.assert_not_called()
+        await client.close()
+
+        # Another token does not reuse the entry
+        client = VaultyClient(base_url="https://api.test.com", api_token="other-token")
+        with patch.object(client.tokens, "list", AsyncMock(return_value=mock_result)) as mock_list:
+            await get_project_from_token_scope(client)
+            mock_list.assert_called_once()
+        await client.close()
@@ -119,3 +119,132 @@ async def test_vaulty_client_close():
 
     await client.close()
     assert client.http_client._client is None
+
+
+@pytest.mark.asyncio
+async def test_vaulty_client_secret_cache_opt_in():
+    """Test VaultyClient only enables the secret cache when a TTL is given."""
+    client = VaultyClient(base_url="https://api.test.com", api_token="test-token")
+    assert client.secrets.cache is None
+    await client.close()
+
+    client = VaultyClient(
+        base_url="https://api.test.com",
+        api_token="test-token",
+        secret_cache_ttl=60,
+        secret_cache_max_entries=10,
+    )
+    assert client.secrets.cache.ttl == 60
+    assert client.secrets.cache.max_entries == 10
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_vaulty_client_apply_rate_limit_settings():
+    """Test the client-side rate limit follows the customer's settings."""
+    from unittest.mock import AsyncMock
+
+    from vaulty.models import CustomerSettingsResponse
+
+    client = VaultyClient(base_url="https://api.test.com", api_token="test-token")
+    assert client.http_client.rate_limiter is None
+
+    client.customers.get_settings = AsyncMock(
+        return_value=CustomerSettingsResponse(
+            rate_limit_enabled=True, rate_limit_requests_per_minute=300
+        )
+    )
+    await client.apply_rate_limit_settings()
+    assert client.http_client.rate_limiter.rate == 5.0
+
+    client.customers.get_settings.return_value = CustomerSettingsResponse(
+        rate_limit_enabled=False, rate_limit_requests_per_minute=300
+    )
+    await client.apply_rate_limit_settings()
+    assert client.http_client.rate_limiter is None
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_vaulty_client_rate_limit_per_minute():
+    """Test rate_limit_per_minute configures a shared token bucket."""
+    client = VaultyClient(
+        base_url="https://api.test.com",
+        api_token="test-token",
+        rate_limit_per_minute=600,
+        rate_limit_burst=20,
+    )
+    assert client.http_client.rate_limiter.rate == 10.0
+    assert client.http_client.rate_limiter.capacity == 20.0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_vaulty_client_adaptive_concurrency():
+    """Test adaptive_concurrency installs a limiter bounded by max_connections."""
+    client = VaultyClient(
+        base_url="https://api.test.com",
+        api_token="test-token",
+        adaptive_concurrency=True,
+        max_connections=50,
+    )
+    limiter = client.http_client.concurrency_limiter
+    assert limiter.limit == 10
+    assert limiter.max_limit == 50
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_vaulty_client_retry_budget_and_deadline():
+    """Test retry budget and request deadline are passed to the retry config."""
+    client = VaultyClient(
+        base_url="https://api.test.com", api_token="test-token", request_deadline=5.0
+    )
+    assert client.retry_config.deadline == 5.0
+    assert client.retry_config.budget.ratio == 0.2
+    await client.close()
+
+    client = VaultyClient(
+        base_url="https://api.test.com", api_token="test-token", retry_budget_ratio=None
+    )
+    assert client.retry_config.budget is None
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_vaulty_client_circuit_breaker():
+    """Test circuit_breaker installs a per-route breaker registry."""
+    client = VaultyClient(base_url="https://api.test.com", api_token="test-token")
+    assert client.http_client.circuit_breakers is None
+    await client.close()
+
+    client = VaultyClient(
+        base_url="https://api.test.com", api_token="test-token", circuit_breaker=True
+    )
+    assert client.http_client.circuit_breakers.failure_threshold == 5
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_vaulty_client_hedge_requests():
+    """Test hedge_requests installs a hedge policy sharing the retry budget."""
+    client = VaultyClient(
+        base_url="https://api.test.com", api_token="test-token", hedge_requests=True
+    )
+    assert client.http_client.hedge_policy.budget is client.retry_config.budget
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_vaulty_client_secret_cache_stale_windows():
+    """Test stale-while-revalidate and stale-if-error windows reach the cache."""
+    client = VaultyClient(
+        base_url="https://api.test.com",
+        api_token="test-token",
+        secret_cache_ttl=60,
+        secret_cache_stale_while_revalidate=30,
+        secret_cache_stale_if_error=3600,
+    )
+    assert client.secrets.cache.stale_while_revalidate == 30
+    assert client.secrets.cache.stale_if_error == 3600
+    await client.close()
@@ -0,0 +1,100 @@
+"""Tests for adaptive concurrency limiting."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from vaulty.concurrency import AdaptiveConcurrencyLimiter
+
+
+@pytest.fixture
+def clock():
+    """Controllable monotonic clock for the limiter."""
+    now = [100.0]
+    with patch("vaulty.concurrency.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+async def _run_wave(limiter, clock, latency):
+    """Run `limit` requests at once, each taking `latency` seconds."""
+    starts = [await limiter.acquire() for _ in range(limiter.limit)]
+    clock[0] += latency
+    for started_at in starts:
+        limiter.release(started_at)
+
+
+@pytest.mark.asyncio
+async def test_limiter_grows_while_latency_is_flat(clock):
+    """Test the limit increases additively under load with stable latency."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+
+    for _ in range(20):
+        await _run_wave(limiter, clock, 0.05)
+
+    assert limiter.limit == 8
+    assert limiter.stats()["increases"] == 4
+    assert limiter.stats()["decreases"] == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_decreases_once_per_round_trip_on_overload(clock):
+    """Test a burst of 429s started together shrinks the limit only once."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+
+    starts = [await limiter.acquire() for _ in range(10)]
+    clock[0] += 0.1
+    for started_at in starts:
+        limiter.release(started_at, overloaded=True)
+
+    assert limiter.limit == 7
+    assert limiter.decreases == 1
+
+    started_at = await limiter.acquire()
+    limiter.release(started_at, overloaded=True)
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_limiter_decreases_on_latency_spike(clock):
+    """Test latency far above the baseline is treated as saturation."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+    await _run_wave(limiter, clock, 0.05)
+
+    for _ in range(5):
+        started_at = await limiter.acquire()
+        clock[0] += 1.0
+        limiter.release(started_at)
+
+    assert limiter.limit < 10
+    assert limiter.stats()["latency"] > limiter.stats()["baseline_latency"] * 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_queues_beyond_limit():
+    """Test requests beyond the limit wait for a free slot."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=1)
+    first = await limiter.acquire()
+    await limiter.acquire()
+
+    waiter = asyncio.ensure_future(limiter.acquire())
+    cancelled = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert limiter.stats()["waiting"] == 2
+
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    limiter.release(first, sample=False)
+    await waiter
+
+    assert limiter.in_flight == 2
+    assert limiter.stats()["waiting"] == 0
+
+
+def test_limiter_validation():
+    """Test inconsistent limits are rejected."""
+    with pytest.raises(ValueError, match="limits must satisfy"):
+        AdaptiveConcurrencyLimiter(initial_limit=0)
+    with pytest.raises(ValueError, match="decrease_factor"):
+        AdaptiveConcurrencyLimiter(decrease_factor=1.5)
@@ -0,0 +1,51 @@
+"""Tests for hedged requests."""
+
+import pytest
+
+from vaulty.hedging import HedgePolicy
+from vaulty.retry import RetryBudget
+
+
+def test_hedge_delay_uses_initial_delay_until_enough_samples():
+    """Test the initial delay is used before min_samples latencies are known."""
+    policy = HedgePolicy(initial_delay=0.3, min_samples=5)
+    for _ in range(4):
+        policy.record(0.01)
+    assert policy.delay() == 0.3
+
+
+def test_hedge_delay_follows_percentile():
+    """Test the delay is the configured percentile of recent latencies."""
+    policy = HedgePolicy(percentile=90.0, min_samples=10, min_delay=0.0)
+    for latency in range(1, 11):
+        policy.record(latency / 100)
+    assert policy.delay() == 0.09
+
+    for _ in range(10):
+        policy.record(5.0)
+    assert policy.delay() == policy.max_delay  # Clamped
+
+
+def test_hedge_window_forgets_old_latencies():
+    """Test only the last `window` latencies count."""
+    policy = HedgePolicy(window=3, min_samples=3, min_delay=0.0)
+    for latency in (1.0, 1.0, 1.0, 0.1, 0.1, 0.1):
+        policy.record(latency)
+    assert policy.delay() == 0.1
+
+
+def test_hedges_are_taken_from_retry_budget():
+    """Test hedges stop once the retry budget is exhausted."""
+    policy = HedgePolicy(budget=RetryBudget(ratio=0.0, min_retries=1))
+    assert policy.try_hedge() is True
+    assert policy.try_hedge() is False
+    assert policy.stats()["hedges"] == 1
+    assert policy.stats()["rejected"] == 1
+
+
+def test_hedge_policy_validation():
+    """Test invalid policies are rejected."""
+    with pytest.raises(ValueError, match="percentile"):
+        HedgePolicy(percentile=0)
+    with pytest.raises(ValueError, match="min_delay"):
+        HedgePolicy(min_delay=2.0, max_delay=1.0)
@@ -1,5 +1,6 @@
 """Tests for HTTP client."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -274,3 +275,311 @@ async def test_http_client_path_normalization():
         assert call_kwargs["url"] == "/test"
 
     await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_coalesces_identical_gets():
+    """Test concurrent identical GET requests share one in-flight request."""
+    client = HTTPClient(base_url="https://api.test.com", api_token="test-token")
+
+    mock_response = MagicMock()
+    mock_response.is_success = True
+    mock_response.status_code = 200
+
+    async def slow_request(**_kwargs):
+        await asyncio.sleep(0.01)
+        return mock_response
+
+    with patch.object(client, "_get_client", return_value=AsyncMock()) as mock_get_client:
+        mock_httpx_client = await mock_get_client()
+        mock_httpx_client.request = AsyncMock(side_effect=slow_request)
+
+        responses = await asyncio.gather(
+            *(client.get("/api/v1/projects/p/secrets/K") for _ in range(5)),
+            client.get("/api/v1/projects/p/secrets/OTHER"),
+        )
+
+        assert all(response is mock_response for response in responses)
+        assert mock_httpx_client.request.call_count == 2
+        assert client._in_flight == {}
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_coalesced_error_propagates():
+    """Test every coalesced caller receives the shared request's exception."""
+    client = HTTPClient(base_url="https://api.test.com")
+
+    mock_response = MagicMock()
+    mock_response.is_success = False
+    mock_response.status_code = 404
+    mock_response.json.return_value = {"detail": "Not found"}
+
+    with patch.object(client, "_get_client", return_value=AsyncMock()) as mock_get_client:
+        mock_httpx_client = await mock_get_client()
+        mock_httpx_client.request = AsyncMock(return_value=mock_response)
+
+        results = await asyncio.gather(
+            client.get("/test"), client.get("/test"), return_exceptions=True
+        )
+
+        assert all(isinstance(result, VaultyNotFoundError) for result in results)
+        assert mock_httpx_client.request.call_count == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_does_not_coalesce_writes():
+    """Test non-GET requests and disabled coalescing always hit the network."""
+    client = HTTPClient(base_url="https://api.test.com", coalesce_requests=False)
+
+    mock_response = MagicMock()
+    mock_response.is_success = True
+    mock_response.status_code = 200
+
+    with patch.object(client, "_get_client", return_value=AsyncMock()) as mock_get_client:
+        mock_httpx_client = await mock_get_client()
+        mock_httpx_client.request = AsyncMock(return_value=mock_response)
+
+        await asyncio.gather(client.get("/test"), client.get("/test"))
+        assert mock_httpx_client.request.call_count == 2
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_pool_and_timeout_config():
+    """Test HTTPClient passes pool limits and per-phase timeouts to httpx."""
+    client = HTTPClient(
+        base_url="https://api.test.com",
+        timeout=30.0,
+        max_connections=200,
+        max_keepalive_connections=50,
+        keepalive_expiry=30.0,
+        connect_timeout=2.0,
+        pool_timeout=1.0,
+    )
+
+    with patch("vaulty.http.httpx.AsyncClient") as mock_async_client:
+        await client._get_client()
+
+    kwargs = mock_async_client.call_args.kwargs
+    assert kwargs["limits"].max_connections == 200
+    assert kwargs["limits"].max_keepalive_connections == 50
+    assert kwargs["limits"].keepalive_expiry == 30.0
+    assert kwargs["timeout"].connect == 2.0
+    assert kwargs["timeout"].read == 30.0
+    assert kwargs["timeout"].write == 30.0
+    assert kwargs["timeout"].pool == 1.0
+    assert kwargs["http2"] is False
+    client._client = None
+
+
+@pytest.mark.asyncio
+async def test_http_client_rate_limit_from_headers():
+    """Test X-RateLimit-* headers enable a client-side limiter and 429s pause it."""
+    client = HTTPClient(base_url="https://api.test.com", rate_limit_from_headers=True)
+
+    ok_response = MagicMock()
+    ok_response.is_success = True
+    ok_response.status_code = 200
+    ok_response.headers = {"X-RateLimit-Limit": "120", "X-RateLimit-Remaining": "100"}
+
+    limited_response = MagicMock()
+    limited_response.is_success = False
+    limited_response.status_code = 429
+    limited_response.json.return_value = {"detail": "Too many requests"}
+    limited_response.headers = {"Retry-After": "5"}
+
+    with patch.object(client, "_get_client", return_value=AsyncMock()) as mock_get_client:
+        mock_httpx_client = await mock_get_client()
+        mock_httpx_client.request = AsyncMock(side_effect=[ok_response, limited_response])
+
+        await client.get("/test")
+        assert client.rate_limiter is not None
+        assert client.rate_limiter.rate == 2.0
+
+        with (
+            patch.object(client.rate_limiter, "pause") as mock_pause,
+            pytest.raises(VaultyRateLimitError),
+        ):
+            await client.get("/other")
+        mock_pause.assert_called_once_with(5)
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_rate_limiter_acquired_per_request():
+    """Test a configured rate limiter is acquired once per request sent."""
+    limiter = MagicMock()
+    limiter.acquire = AsyncMock()
+    client = HTTPClient(base_url="https://api.test.com", rate_limiter=limiter)
+
+    mock_response = MagicMock()
+    mock_response.is_success = True
+    mock_response.status_code = 200
+
+    with patch.object(client, "_get_client", return_value=AsyncMock()) as mock_get_client:
+        mock_httpx_client = await mock_get_client()
+        mock_httpx_client.request = AsyncMock(return_value=mock_response)
+
+        await client.get("/a")
+        await client.post("/b", json={})
+
+    assert limiter.acquire.await_count == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_concurrency_limiter_sees_server_errors():
+    """Test 5xx responses are reported to the concurrency limiter as overload."""
+    from vaulty.concurrency import AdaptiveConcurrencyLimiter
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+    client = HTTPClient(base_url="https://api.test.com", concurrency_limiter=limiter)
+
+    mock_response = MagicMock()
+    mock_response.is_success = False
+    mock_response.status_code = 503
+    mock_response.json.return_value = {"detail": "Unavailable"}
+
+    with patch.object(client, "_get_client", return_value=AsyncMock()) as mock_get_client:
+        mock_httpx_client = await mock_get_client()
+        mock_httpx_client.request = AsyncMock(return_value=mock_response)
+
+        with pytest.raises(VaultyAPIError):
+            await client.get("/test")
+
+    assert limiter.limit == 7
+    assert limiter.in_flight == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_circuit_breaker_fails_fast():
+    """Test an open circuit rejects requests without sending them."""
+    from vaulty.circuit import CircuitBreakerRegistry
+    from vaulty.exceptions import VaultyCircuitOpenError
+
+    breakers = CircuitBreakerRegistry(failure_threshold=2, recovery_timeout=60.0)
+    client = HTTPClient(base_url="https://api.test.com", circuit_breakers=breakers)
+
+    mock_response = MagicMock()
+    mock_response.is_success = False
+    mock_response.status_code = 503
+    mock_response.json.return_value = {"detail": "Unavailable"}
+
+    with patch.object(client, "_get_client", return_value=AsyncMock()) as mock_get_client:
+        mock_httpx_client = await mock_get_client()
+        mock_httpx_client.request = AsyncMock(return_value=mock_response)
+
+        for _ in range(2):
+            with pytest.raises(VaultyAPIError, match="Unavailable"):
+                await client.get("/api/v1/projects/p/secrets/A")
+        with pytest.raises(VaultyCircuitOpenError, match="Circuit open"):
+            await client.get("/api/v1/projects/p/secrets/B")
+
+        # Other routes are unaffected
+        mock_response.is_success = True
+        mock_response.status_code = 200
+        await client.get("/api/v1/activities")
+
+    assert mock_httpx_client.request.await_count == 3
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_hedges_slow_get():
+    """Test a slow GET is hedged, the faster copy wins and the slow one is cancelled."""
+    from vaulty.hedging import HedgePolicy
+
+    policy = HedgePolicy(initial_delay=0.01, min_delay=0.01)
+    client = HTTPClient(base_url="https://api.test.com", hedge_policy=policy)
+
+    slow_response = MagicMock(is_success=True, status_code=200)
+    fast_response = MagicMock(is_success=True, status_code=200)
+    cancelled = asyncio.Event()
+    calls = 0
+
+    async def request(**_kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return slow_response
+        return fast_response
+
+    with patch.object(client, "_get_client", return_value=AsyncMock()) as mock_get_client:
+        mock_httpx_client = await mock_get_client()
+        mock_httpx_client.request = request
+
+        response = await client.get("/test")
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+    assert response is fast_response
+    assert policy.stats()["hedges"] == 1
+    assert policy.stats()["hedges_won"] == 1
+    # The cancelled slow copy is recorded too, so the tail isn't dropped
+    assert policy.stats()["samples"] == 2
+    assert max(policy._latencies) >= 0.01
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_hedging_ignores_time_queued_in_limiters():
+    """Test time waiting for the rate limiter neither triggers hedges nor counts as latency."""
+    from vaulty.hedging import HedgePolicy
+
+    policy = HedgePolicy(initial_delay=0.02, min_delay=0.02)
+    rate_limiter = MagicMock()
+
+    async def acquire():
+        await asyncio.sleep(0.1)
+
+    rate_limiter.acquire = acquire
+    client = HTTPClient(
+        base_url="https://api.test.com", hedge_policy=policy, rate_limiter=rate_limiter
+    )
+    mock_response = MagicMock(is_success=True, status_code=200)
+
+    with patch.object(client, "_get_client", return_value=AsyncMock()) as mock_get_client:
+        mock_httpx_client = await mock_get_client()
+        mock_httpx_client.request = AsyncMock(return_value=mock_response)
+
+        await client.get("/test")
+
+    assert mock_httpx_client.request.await_count == 1
+    assert policy.stats()["hedges"] == 0
+    assert policy.stats()["samples"] == 1
+    assert max(policy._latencies) < 0.02
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_hedging_skips_writes_and_fast_gets():
+    """Test writes are never hedged and fast GETs send a single request."""
+    from vaulty.hedging import HedgePolicy
+
+    policy = HedgePolicy(initial_delay=1.0)
+    client = HTTPClient(base_url="https://api.test.com", hedge_policy=policy)
+
+    mock_response = MagicMock(is_success=True, status_code=200)
+
+    with patch.object(client, "_get_client", return_value=AsyncMock()) as mock_get_client:
+        mock_httpx_client = await mock_get_client()
+        mock_httpx_client.request = AsyncMock(return_value=mock_response)
+
+        await client.get("/a")
+        await client.post("/b", json={})
+
+    assert mock_httpx_client.request.await_count == 2
+    assert policy.stats()["hedges"] == 0
+    assert policy.stats()["samples"] == 1
+    await client.close()
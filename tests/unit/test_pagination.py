@@ -0,0 +1,122 @@
+"""Tests for pagination helpers."""
+
+import asyncio
+
+import pytest
+
+from vaulty.models import PaginatedResponse
+from vaulty.pagination import fetch_all_pages, iterate_items, iterate_pages
+
+
+def _page(page: int, total_pages: int, page_size: int = 2) -> PaginatedResponse[int]:
+    start = (page - 1) * page_size
+    return PaginatedResponse[int](
+        items=list(range(start, start + page_size)),
+        total=total_pages * page_size,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        has_next=page < total_pages,
+        has_previous=page > 1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_iterate_items_all_pages():
+    """Test iterate_items yields items from every page in order."""
+    fetched = []
+
+    async def fetch_page(page):
+        fetched.append(page)
+        return _page(page, total_pages=3)
+
+    items = [item async for item in iterate_items(fetch_page)]
+
+    assert items == [0, 1, 2, 3, 4, 5]
+    assert fetched == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_iterate_pages_prefetches_next_page():
+    """Test iterate_pages requests the next page while the current one is consumed."""
+    started = []
+
+    async def fetch_page(page):
+        started.append(page)
+        await asyncio.sleep(0)
+        return _page(page, total_pages=3)
+
+    async for page in iterate_pages(fetch_page):
+        await asyncio.sleep(0.01)
+        if page.page < 3:
+            assert page.page + 1 in started
+
+
+@pytest.mark.asyncio
+async def test_iterate_pages_without_prefetch():
+    """Test iterate_pages only fetches a page once the previous one is consumed."""
+    started = []
+
+    async def fetch_page(page):
+        started.append(page)
+        return _page(page, total_pages=2)
+
+    async for page in iterate_pages(fetch_page, prefetch=False):
+        assert started[-1] == page.page
+
+
+@pytest.mark.asyncio
+async def test_iterate_pages_cancels_read_ahead_on_break():
+    """Test breaking out of iteration cancels the pending read-ahead request."""
+    pending = []
+
+    async def fetch_page(page):
+        if page > 1:
+            task = asyncio.current_task()
+            pending.append(task)
+            await asyncio.sleep(10)
+        return _page(page, total_pages=5)
+
+    pages = iterate_pages(fetch_page)
+    async for _page_result in pages:
+        await asyncio.sleep(0)
+        break
+    await pages.aclose()
+    await asyncio.sleep(0)
+
+    assert len(pending) == 1
+    assert pending[0].cancelled()
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_pages_concurrent_in_order():
+    """Test fetch_all_pages fetches remaining pages concurrently and keeps order."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fetch_page(page):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Later pages finish first to check reassembly order
+        await asyncio.sleep(0.01 * (6 - page))
+        in_flight -= 1
+        return _page(page, total_pages=5)
+
+    items = await fetch_all_pages(fetch_page, concurrency=3)
+
+    assert items == list(range(10))
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_pages_single_page():
+    """Test fetch_all_pages makes one request when there is a single page."""
+    calls = []
+
+    async def fetch_page(page):
+        calls.append(page)
+        return _page(page, total_pages=1)
+
+    assert await fetch_all_pages(fetch_page) == [0, 1]
+    assert calls == [1]
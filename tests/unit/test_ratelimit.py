@@ -0,0 +1,101 @@
+"""Tests for client-side rate limiting."""
+
+from unittest.mock import patch
+
+import pytest
+
+from vaulty.ratelimit import TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock advanced by the patched asyncio.sleep."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with (
+        patch("vaulty.ratelimit.time.monotonic", fake.monotonic),
+        patch("vaulty.ratelimit.asyncio.sleep", fake.sleep),
+    ):
+        yield fake
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_after_burst(clock):
+    """Test the bucket allows a burst up to capacity, then paces at the rate."""
+    bucket = TokenBucket(rate=2.0, capacity=2)
+
+    for _ in range(6):
+        await bucket.acquire()
+
+    # 2 immediate, then 4 more at 2/s
+    assert clock.now == pytest.approx(1002.0)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_per_minute(clock):
+    """Test per_minute converts to a per-second rate with a one second burst."""
+    bucket = TokenBucket.per_minute(120)
+    assert bucket.rate == 2.0
+    assert bucket.capacity == 2.0
+
+    for _ in range(4):
+        await bucket.acquire()
+    assert clock.now == pytest.approx(1001.0)
+
+
+def test_token_bucket_validation():
+    """Test invalid rates and capacities are rejected."""
+    with pytest.raises(ValueError, match="rate must be positive"):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError, match="capacity must be at least 1"):
+        TokenBucket(rate=1, capacity=0.5)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause(clock):
+    """Test pause holds requests and refilling starts afterwards."""
+    bucket = TokenBucket(rate=1.0, capacity=5)
+    bucket.pause(10)
+
+    await bucket.acquire()
+
+    assert clock.now == pytest.approx(1011.0)
+
+
+@pytest.mark.usefixtures("clock")
+def test_token_bucket_update_from_headers():
+    """Test X-RateLimit-* headers retune the rate and cap the local budget."""
+    bucket = TokenBucket(rate=100.0)
+
+    applied = bucket.update_from_headers({"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "0"})
+
+    assert applied
+    assert bucket.rate == 1.0
+    assert bucket.tokens == 0
+    assert not bucket.update_from_headers({"Content-Type": "application/json"})
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_reset_header_pauses(clock):
+    """Test an exhausted window holds requests until X-RateLimit-Reset."""
+    bucket = TokenBucket(rate=10.0)
+    bucket.update_from_headers(
+        {"X-RateLimit-Limit": "600", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}
+    )
+
+    await bucket.acquire()
+
+    assert clock.now >= 1030.0
@@ -0,0 +1,137 @@
+"""Tests for ActivityResource client."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from vaulty.http import HTTPClient
+from vaulty.models import ActivityResponse, PaginatedResponse, RawPage
+from vaulty.resources.activities import ActivityResource
+
+
+@pytest.fixture
+def http_client():
+    """Create HTTPClient for testing."""
+    return HTTPClient(base_url="https://api.test.com", api_token="test-token")
+
+
+@pytest.fixture
+def activity_resource(http_client):
+    """Create ActivityResource for testing."""
+    return ActivityResource(http_client)
+
+
+def _page(*activities):
+    """Build a single raw page of (id, created_at second) activities, newest first."""
+    items = [
+        {"id": activity_id, "action": "get_secret", "created_at": f"2026-10-16T12:00:{second:02}Z"}
+        for activity_id, second in activities
+    ]
+    return RawPage(items, len(items), 1, 100, 1, False, False)
+
+
+@pytest.mark.asyncio
+async def test_activity_resource_list(activity_resource, http_client):
+    """Test ActivityResource.list sends filters and decodes the page."""
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "items": [{"id": "a-1", "action": "get_secret", "created_at": "2026-10-16T12:00:00Z"}],
+        "total": 1,
+        "page": 1,
+        "page_size": 50,
+        "total_pages": 1,
+        "has_next": False,
+        "has_previous": False,
+    }
+
+    with patch.object(http_client, "get", return_value=mock_response):
+        result = await activity_resource.list(
+            action="get_secret", start_date=datetime(2026, 10, 16, tzinfo=UTC)
+        )
+
+        assert isinstance(result, PaginatedResponse)
+        assert isinstance(result.items[0], ActivityResponse)
+        params = http_client.get.call_args.kwargs["params"]
+        assert params["action"] == "get_secret"
+        assert params["start_date"] == "2026-10-16T00:00:00+00:00"
+
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_activity_resource_tail(activity_resource):
+    """Test tail yields new activities oldest first and dedupes the boundary."""
+    activity_resource.list = AsyncMock(
+        side_effect=[
+            _page(("a-2", 5), ("a-1", 1)),
+            # Boundary activity a-2 comes back with a newer one at the same second
+            _page(("a-3", 5), ("a-2", 5)),
+            _page(("a-3", 5)),
+            _page(("a-4", 9), ("a-3", 5)),
+        ]
+    )
+
+    with patch("vaulty.resources.activities.asyncio.sleep") as mock_sleep:
+        ids = []
+        async for activity in activity_resource.tail(
+            start_date=datetime.fromisoformat("2026-10-16T12:00:00"),
+            poll_interval=1.0,
+            raw=True,
+        ):
+            ids.append(activity["id"])
+            if len(ids) == 4:
+                break
+
+    assert ids == ["a-1", "a-2", "a-3", "a-4"]
+    start_dates = [call.kwargs["start_date"] for call in activity_resource.list.await_args_list]
+    assert start_dates == [
+        datetime(2026, 10, 16, 12, tzinfo=UTC),
+        datetime(2026, 10, 16, 12, 0, 5, tzinfo=UTC),
+        datetime(2026, 10, 16, 12, 0, 5, tzinfo=UTC),
+        datetime(2026, 10, 16, 12, 0, 5, tzinfo=UTC),
+    ]
+    # The wait grows after the idle third poll
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [1.0, 1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_activity_resource_tail_backoff_is_capped(activity_resource):
+    """Test idle polls back off up to max_poll_interval."""
+    activity_resource.list = AsyncMock(return_value=_page())
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 5:
+            raise RuntimeError("stop")
+
+    with (
+        patch("vaulty.resources.activities.asyncio.sleep", side_effect=sleep),
+        pytest.raises(RuntimeError, match="stop"),
+    ):
+        async for _ in activity_resource.tail(poll_interval=1.0, max_poll_interval=5.0):
+            pass
+
+    assert sleeps == [2.0, 4.0, 5.0, 5.0, 5.0]
+
+
+@pytest.mark.asyncio
+async def test_activity_resource_tail_without_follow(activity_resource):
+    """Test follow=False stops after one poll and yields models by default."""
+    activity_resource.list = AsyncMock(
+        return_value=PaginatedResponse[ActivityResponse](
+            items=[ActivityResponse(id="a-1", action="get_secret")],
+            total=1,
+            page=1,
+            page_size=100,
+            total_pages=1,
+            has_next=False,
+            has_previous=False,
+        )
+    )
+
+    activities = [activity async for activity in activity_resource.tail(follow=False)]
+
+    assert [activity.id for activity in activities] == ["a-1"]
+    activity_resource.list.assert_awaited_once()
@@ -1,12 +1,22 @@
 """Tests for SecretResource client."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
+from vaulty.cache import ProjectScopeCache, SecretCache
+from vaulty.exceptions import (
+    VaultyAuthorizationError,
+    VaultyBulkError,
+    VaultyCircuitOpenError,
+    VaultyNotFoundError,
+)
 from vaulty.http import HTTPClient
-from vaulty.models import PaginatedResponse, SecretResponse, SecretValueResponse
+from vaulty.models import PaginatedResponse, RawPage, SecretResponse, SecretValueResponse
 from vaulty.resources.secrets import SecretResource
+from vaulty.retry import RetryConfig
 
 
 @pytest.fixture
@@ -76,6 +86,38 @@ async def test_secret_resource_list(secret_resource, http_client):
     await http_client.close()
 
 
+@pytest.mark.asyncio
+async def test_secret_resource_list_raw(secret_resource, http_client):
+    """Test SecretResource.list with raw=True skips model construction."""
+    item = {
+        "id": "s-123",
+        "project_id": "p-456",
+        "key": "API_KEY",
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-01T00:00:00Z",
+    }
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "items": [item],
+        "total": 1,
+        "page": 1,
+        "page_size": 50,
+        "total_pages": 1,
+        "has_next": False,
+        "has_previous": False,
+    }
+
+    with patch.object(http_client, "get", return_value=mock_response):
+        result = await secret_resource.list("test-project", raw=True)
+        assert isinstance(result, RawPage)
+        assert result.items == [item]
+
+        items = [secret async for secret in secret_resource.iter_all("test-project", raw=True)]
+        assert items == [item]
+
+    await http_client.close()
+
+
 @pytest.mark.asyncio
 async def test_secret_resource_get(secret_resource, http_client):
     """Test SecretResource.get."""
@@ -177,3 +219,304 @@ async def test_secret_resource_url_encoding(secret_resource, http_client):
         assert "test%20project" in call_args[0][0] or "test+project" in call_args[0][0]
 
     await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_secret_resource_get_many(secret_resource, http_client):
+    """Test SecretResource.get_many fetches keys concurrently and keeps order."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_get(path):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        key = path.rsplit("/", 1)[-1]
+        response = MagicMock()
+        response.json.return_value = {"key": key, "value": f"value-{key}"}
+        return response
+
+    keys = ["K1", "K2", "K3", "K4", "K5", "K1"]
+    with patch.object(http_client, "get", side_effect=fake_get):
+        result = await secret_resource.get_many("test-project", keys, concurrency=2)
+
+    assert list(result) == ["K1", "K2", "K3", "K4", "K5"]
+    assert result["K3"].value == "value-K3"
+    assert max_in_flight == 2
+
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_secret_resource_get_many_collects_errors(secret_resource, http_client):
+    """Test SecretResource.get_many reports per-key errors with partial results."""
+
+    async def fake_get(path):
+        key = path.rsplit("/", 1)[-1]
+        if key == "MISSING":
+            raise VaultyNotFoundError("Resource not found", 404, "Secret not found")
+        response = MagicMock()
+        response.json.return_value = {"key": key, "value": f"value-{key}"}
+        return response
+
+    with patch.object(http_client, "get", side_effect=fake_get):
+        with pytest.raises(VaultyBulkError) as exc_info:
+            await secret_resource.get_many("test-project", ["API_KEY", "MISSING"])
+
+    assert list(exc_info.value.results) == ["API_KEY"]
+    assert isinstance(exc_info.value.errors["MISSING"], VaultyNotFoundError)
+
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_secret_resource_get_value_cached(http_client):
+    """Test SecretResource.get_value serves repeated reads from the cache."""
+    secret_resource = SecretResource(http_client, cache=SecretCache(ttl=60))
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"key": "API_KEY", "value": "decrypted-value"}
+
+    with patch.object(http_client, "get", return_value=mock_response) as mock_get:
+        first = await secret_resource.get_value("test-project", "API_KEY")
+        second = await secret_resource.get_value("test-project", "API_KEY")
+
+    assert first.value == second.value == "decrypted-value"
+    assert mock_get.call_count == 1
+    assert secret_resource.cache.stats()["hits"] == 1
+
+    with patch.object(http_client, "patch", return_value=MagicMock()) as mock_patch:
+        mock_patch.return_value.json.return_value = {"key": "API_KEY"}
+        await secret_resource.update("test-project", "API_KEY", "new-value")
+
+    assert len(secret_resource.cache) == 0
+
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_secret_resource_get_value_in_flight_during_update(http_client):
+    """Test a fetch in flight while the secret is updated doesn't cache the old value."""
+    secret_resource = SecretResource(http_client, cache=SecretCache(ttl=60))
+    release = asyncio.Event()
+    old_response = MagicMock()
+    old_response.json.return_value = {"key": "API_KEY", "value": "old"}
+
+    async def slow_get(*_args, **_kwargs):
+        await release.wait()
+        return old_response
+
+    with patch.object(http_client, "get", side_effect=slow_get):
+        fetch = asyncio.create_task(secret_resource.get_value("test-project", "API_KEY"))
+        await asyncio.sleep(0)
+
+        with patch.object(http_client, "patch", return_value=MagicMock()) as mock_patch:
+            mock_patch.return_value.json.return_value = {"key": "API_KEY"}
+            await secret_resource.update("test-project", "API_KEY", "new")
+
+        release.set()
+        assert (await fetch).value == "old"
+
+    assert len(secret_resource.cache) == 0
+
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_secret_resource_get_value_after_update_skips_in_flight_fetch():
+    """Test a get_value after an update doesn't join a fetch sent before the update."""
+    value = {"current": "old"}
+    release = asyncio.Event()
+    gets = []
+
+    async def handler(request):
+        if request.method == "PATCH":
+            value["current"] = "new"
+            return httpx.Response(200, json={"key": "K"})
+        gets.append(value["current"])
+        response = httpx.Response(200, json={"key": "K", "value": value["current"]})
+        if len(gets) == 1:
+            await release.wait()  # The first read is slow
+        return response
+
+    http_client = HTTPClient(base_url="https://api.test.com", api_token="test-token")
+    http_client._client = httpx.AsyncClient(
+        base_url="https://api.test.com", transport=httpx.MockTransport(handler)
+    )
+    secret_resource = SecretResource(http_client, cache=SecretCache(ttl=60))
+
+    slow_fetch = asyncio.create_task(secret_resource.get_value("p", "K"))
+    await asyncio.sleep(0.01)
+    await secret_resource.update("p", "K", "new")
+
+    latest = await asyncio.wait_for(secret_resource.get_value("p", "K"), timeout=5)
+    assert latest.value == "new"
+    release.set()
+    assert (await slow_fetch).value == "old"
+    assert (await secret_resource.get_value("p", "K")).value == "new"
+    assert gets == ["old", "new"]
+
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_secret_resource_get_value_negative_cache(http_client):
+    """Test SecretResource.get_value caches not-found results."""
+    secret_resource = SecretResource(http_client, cache=SecretCache(ttl=60))
+    error = VaultyNotFoundError("Resource not found", 404, "Secret not found")
+
+    with patch.object(http_client, "get", side_effect=error) as mock_get:
+        for _ in range(2):
+            with pytest.raises(VaultyNotFoundError):
+                await secret_resource.get_value("test-project", "MISSING")
+
+    assert mock_get.call_count == 1
+
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_secret_resource_get_value_stale_when_circuit_open(http_client):
+    """Test SecretResource.get_value serves an expired value while the circuit is open."""
+    secret_resource = SecretResource(http_client, cache=SecretCache(ttl=0, stale_if_error=60))
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"key": "API_KEY", "value": "decrypted-value"}
+
+    with patch.object(http_client, "get", return_value=mock_response):
+        await secret_resource.get_value("test-project", "API_KEY")
+
+    error = VaultyCircuitOpenError("Circuit open", route="GET /x")
+    with patch.object(http_client, "get", side_effect=error) as mock_get:
+        stale = await secret_resource.get_value("test-project", "API_KEY")
+        with pytest.raises(VaultyCircuitOpenError, match="Circuit open"):
+            await secret_resource.get_value("test-project", "OTHER_KEY")
+
+    assert stale.value == "decrypted-value"
+    assert mock_get.call_count == 2
+
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_secret_resource_get_value_circuit_open_respects_max_staleness(http_client):
+    """Test values past the stale_if_error window aren't served while the circuit is open."""
+    cache = SecretCache(ttl=0, stale_if_error=60)
+    secret_resource = SecretResource(http_client, cache=cache)
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"key": "API_KEY", "value": "decrypted-value"}
+
+    with patch.object(http_client, "get", return_value=mock_response):
+        await secret_resource.get_value("test-project", "API_KEY")
+    cache._entries[("test-project", "API_KEY")].expires_at -= 120
+
+    error = VaultyCircuitOpenError("Circuit open", route="GET /x")
+    with (
+        patch.object(http_client, "get", side_effect=error),
+        pytest.raises(VaultyCircuitOpenError, match="Circuit open"),
+    ):
+        await secret_resource.get_value("test-project", "API_KEY")
+
+    # Without stale_if_error nothing stale is served at all
+    secret_resource.cache = SecretCache(ttl=0)
+    with patch.object(http_client, "get", return_value=mock_response):
+        await secret_resource.get_value("test-project", "API_KEY")
+    with (
+        patch.object(http_client, "get", side_effect=error),
+        pytest.raises(VaultyCircuitOpenError, match="Circuit open"),
+    ):
+        await secret_resource.get_value("test-project", "API_KEY")
+
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_secret_resource_get_value_stale_while_revalidate(http_client):
+    """Test an expired value is served at once and refreshed in the background."""
+    cache = SecretCache(ttl=0, stale_while_revalidate=60)
+    secret_resource = SecretResource(http_client, cache=cache)
+    old_response = MagicMock()
+    old_response.json.return_value = {"key": "API_KEY", "value": "old"}
+    new_response = MagicMock()
+    new_response.json.return_value = {"key": "API_KEY", "value": "new"}
+
+    with patch.object(http_client, "get", return_value=old_response):
+        await secret_resource.get_value("test-project", "API_KEY")
+
+    with patch.object(http_client, "get", return_value=new_response) as mock_get:
+        first = await secret_resource.get_value("test-project", "API_KEY")
+        second = await secret_resource.get_value("test-project", "API_KEY")
+        await asyncio.gather(*secret_resource._revalidating.values())
+
+    # Both reads were served stale; a single refresh was sent
+    assert first.value == second.value == "old"
+    assert mock_get.call_count == 1
+    assert cache.get_stale("test-project", "API_KEY").value == "new"
+
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_secret_resource_get_value_stale_if_error(http_client):
+    """Test an expired value is served when the API is unavailable, not when it refuses."""
+    cache = SecretCache(ttl=0, stale_if_error=60)
+    secret_resource = SecretResource(http_client, RetryConfig(max_retries=0), cache=cache)
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"key": "API_KEY", "value": "decrypted-value"}
+
+    with patch.object(http_client, "get", return_value=mock_response):
+        await secret_resource.get_value("test-project", "API_KEY")
+
+    with patch.object(http_client, "get", side_effect=httpx.ConnectError("down")):
+        stale = await secret_resource.get_value("test-project", "API_KEY")
+    assert stale.value == "decrypted-value"
+
+    denied = VaultyAuthorizationError("Insufficient permissions", 403, "denied")
+    with (
+        patch.object(http_client, "get", side_effect=denied),
+        pytest.raises(VaultyAuthorizationError, match="Insufficient permissions"),
+    ):
+        await secret_resource.get_value("test-project", "API_KEY")
+
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_secret_resource_list_caches_scoped_project(http_client):
+    """Test SecretResource.list resolves the token's project once per client."""
+    secret_resource = SecretResource(http_client, project_scope=ProjectScopeCache())
+
+    projects_response = MagicMock()
+    projects_response.json.return_value = {"items": [{"id": "p-456", "name": "scoped"}]}
+    secrets_response = MagicMock()
+    secrets_response.json.return_value = {
+        "items": [],
+        "total": 0,
+        "page": 1,
+        "page_size": 50,
+        "total_pages": 0,
+        "has_next": False,
+        "has_previous": False,
+    }
+
+    async def fake_get(path, params=None):  # noqa: ARG001
+        return projects_response if path == "/api/v1/projects" else secrets_response
+
+    with patch.object(http_client, "get", side_effect=fake_get) as mock_get:
+        await secret_resource.list()
+        await secret_resource.list()
+
+        paths = [call.args[0] for call in mock_get.call_args_list]
+        assert paths.count("/api/v1/projects") == 1
+        assert paths.count("/api/v1/projects/scoped/secrets") == 2
+
+    # A 404 on the resolved project drops the cached resolution
+    with patch.object(
+        http_client, "get", side_effect=VaultyNotFoundError("Resource not found", 404)
+    ):
+        with pytest.raises(VaultyNotFoundError):
+            await secret_resource.list()
+
+    assert secret_resource.project_scope.get(http_client.auth_header) is None
+
+    await http_client.close()
@@ -0,0 +1,52 @@
+"""Tests for TokenResource client."""
+
+import httpx
+import pytest
+
+from vaulty.http import HTTPClient
+from vaulty.resources.tokens import TokenResource
+
+
+@pytest.fixture
+def http_client():
+    """Create HTTPClient whose server returns 250 tokens as a plain (unpaginated) list."""
+    tokens = [{"id": f"t-{i}", "scope": "read"} for i in range(250)]
+    client = HTTPClient(base_url="https://api.test.com", api_token="test-token")
+    client._client = httpx.AsyncClient(
+        base_url="https://api.test.com",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=tokens)),  # noqa: ARG005
+    )
+    return client
+
+
+@pytest.fixture
+def token_resource(http_client):
+    """Create TokenResource for testing."""
+    return TokenResource(http_client)
+
+
+@pytest.mark.asyncio
+async def test_token_resource_list_slices_direct_list(token_resource, http_client):
+    """Test a plain list response is sliced to the requested page."""
+    page = await token_resource.list(page=3, page_size=100)
+
+    assert [token.id for token in page.items] == [f"t-{i}" for i in range(200, 250)]
+    assert page.total == 250
+    assert page.total_pages == 3
+    assert page.has_next is False
+    assert page.has_previous is True
+
+    await http_client.close()
+
+
+@pytest.mark.asyncio
+async def test_token_resource_iter_all_direct_list_has_no_duplicates(token_resource, http_client):
+    """Test iter_all/fetch_all over a plain list yield every token exactly once."""
+    iterated = [token.id async for token in token_resource.iter_all(page_size=100)]
+    fetched = await token_resource.fetch_all(page_size=100, raw=True)
+
+    expected = [f"t-{i}" for i in range(250)]
+    assert iterated == expected
+    assert [token["id"] for token in fetched] == expected
+
+    await http_client.close()
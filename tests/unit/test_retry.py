@@ -5,8 +5,13 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from vaulty.exceptions import VaultyAPIError, VaultyRateLimitError
-from vaulty.retry import RetryConfig, retry_with_backoff
+from vaulty.exceptions import (
+    VaultyAPIError,
+    VaultyCircuitOpenError,
+    VaultyRateLimitError,
+    VaultyTimeoutError,
+)
+from vaulty.retry import RetryBudget, RetryConfig, deadline, get_deadline, retry_with_backoff
 
 
 @pytest.mark.asyncio
@@ -169,3 +174,107 @@ async def test_retry_respects_max_delay():
 
     # Second delay should be capped at max_delay (100 * 2 = 200, but max is 60)
     assert delays[1] <= 60.0
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_exhausted_stops_retries():
+    """Test retries stop once the shared budget is spent."""
+    budget = RetryBudget(ratio=0.0, min_retries=1)
+    config = RetryConfig(max_retries=3, initial_delay=0.01, jitter=False, budget=budget)
+    func = AsyncMock(side_effect=VaultyAPIError("Error", 500))
+
+    with pytest.raises(VaultyAPIError, match="Error"):
+        await retry_with_backoff(func, config)
+
+    # One retry from the budget, then the last error is re-raised
+    assert func.call_count == 2
+    assert budget.stats() == {"requests": 1, "retries": 1, "rejected": 1, "available": 0}
+
+
+def test_retry_budget_ratio_and_window():
+    """Test the budget scales with recent requests and forgets old ones."""
+    now = [100.0]
+    with patch("vaulty.retry.time.monotonic", side_effect=lambda: now[0]):
+        budget = RetryBudget(ratio=0.5, min_retries=0, window=10.0)
+        assert budget.try_acquire() is False
+
+        for _ in range(4):
+            budget.record_request()
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is False
+
+        now[0] += 11.0
+        assert budget.stats() == {"requests": 0, "retries": 0, "rejected": 2, "available": 0}
+
+
+def test_retry_budget_validation():
+    """Test invalid budget parameters are rejected."""
+    with pytest.raises(ValueError, match="window"):
+        RetryBudget(window=0)
+
+
+@pytest.mark.asyncio
+async def test_retry_deadline_cuts_attempt_short():
+    """Test a deadline() block bounds a slow attempt."""
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    with deadline(0.05):
+        assert get_deadline() is not None
+        with pytest.raises(VaultyTimeoutError, match="Deadline exceeded"):
+            await retry_with_backoff(slow, RetryConfig(max_retries=0))
+    assert get_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_retry_nested_deadline_keeps_earliest():
+    """Test an inner deadline can't extend an outer one."""
+    with deadline(1.0):
+        outer = get_deadline()
+        with deadline(60.0):
+            assert get_deadline() == outer
+
+
+@pytest.mark.asyncio
+async def test_retry_stops_when_backoff_passes_deadline():
+    """Test the last error is re-raised instead of sleeping past the deadline."""
+    func = AsyncMock(side_effect=VaultyAPIError("Error", 503))
+    config = RetryConfig(max_retries=3, initial_delay=5.0, jitter=False, deadline=1.0)
+
+    with patch("asyncio.sleep") as mock_sleep, pytest.raises(VaultyAPIError, match="Error"):
+        await retry_with_backoff(func, config)
+
+    assert func.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_retry_per_call_deadline_includes_retries():
+    """Test config.deadline caps attempts and sleeps together."""
+    calls = 0
+
+    async def flaky():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise VaultyAPIError("Error", 500)
+        await asyncio.sleep(10)
+
+    config = RetryConfig(max_retries=3, initial_delay=0.01, jitter=False, deadline=0.1)
+
+    with pytest.raises(VaultyTimeoutError, match="Deadline exceeded"):
+        await retry_with_backoff(flaky, config)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_does_not_retry_open_circuit():
+    """Test an open circuit fails the call without retries."""
+    func = AsyncMock(side_effect=VaultyCircuitOpenError("Circuit open", route="GET /x"))
+
+    with pytest.raises(VaultyCircuitOpenError, match="Circuit open"):
+        await retry_with_backoff(func, RetryConfig(max_retries=3))
+
+    assert func.call_count == 1
@@ -0,0 +1,99 @@
+"""Tests for response decoding."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from vaulty import serialization
+from vaulty.models import ActivityResponse, PaginatedResponse, RawPage, SecretResponse
+
+PAGE = {
+    "items": [{"id": "1", "action": "get_secret", "created_at": "2026-10-16T12:00:00Z"}],
+    "total": 1,
+    "page": 1,
+    "page_size": 50,
+    "total_pages": 1,
+    "has_next": False,
+    "has_previous": False,
+}
+
+
+@pytest.fixture(autouse=True)
+def _restore_backend():
+    yield
+    serialization.set_json_backend("pydantic")
+
+
+def test_decode_page_from_bytes():
+    """Test a whole page is validated from the raw body."""
+    response = httpx.Response(200, json=PAGE)
+    page = serialization.decode(response, PaginatedResponse[ActivityResponse])
+
+    assert isinstance(page.items[0], ActivityResponse)
+    assert page.items[0].created_at == datetime(2026, 10, 16, 12, tzinfo=UTC)
+    assert page.total == 1
+
+
+def test_decode_falls_back_to_json_method():
+    """Test objects without a bytes body (e.g. mocks) are decoded via json()."""
+    response = MagicMock()
+    response.json.return_value = {"key": "API_KEY"}
+
+    secret = serialization.decode(response, SecretResponse)
+    assert secret.key == "API_KEY"
+
+
+def test_type_adapters_are_cached():
+    """Test one TypeAdapter is built per type."""
+    first = serialization.type_adapter(PaginatedResponse[SecretResponse])
+    assert serialization.type_adapter(PaginatedResponse[SecretResponse]) is first
+
+
+def test_decode_page_raw():
+    """Test raw pages keep the API's plain dicts."""
+    response = httpx.Response(200, json=PAGE)
+    page = serialization.decode_page(response, ActivityResponse, raw=True)
+
+    assert isinstance(page, RawPage)
+    assert page.items == PAGE["items"]
+    assert page.has_next is False
+    assert page.to_dict() == PAGE
+
+
+def test_decode_page_validates_by_default():
+    """Test decode_page returns models unless raw is set."""
+    response = httpx.Response(200, json=PAGE)
+    page = serialization.decode_page(response, ActivityResponse)
+
+    assert isinstance(page, PaginatedResponse)
+    assert isinstance(page.items[0], ActivityResponse)
+
+
+def test_orjson_backend():
+    """Test decoding with the orjson backend."""
+    pytest.importorskip("orjson")
+    serialization.set_json_backend("orjson")
+    assert serialization.get_json_backend() == "orjson"
+
+    response = httpx.Response(200, json=PAGE)
+    page = serialization.decode(response, PaginatedResponse[ActivityResponse])
+    assert page.items[0].action == "get_secret"
+
+
+def test_unknown_backend_rejected():
+    """Test unknown backends raise ValueError and keep the current one."""
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        serialization.set_json_backend("simplejson")
+    assert serialization.get_json_backend() == "pydantic"
+
+
+def test_invalid_backend_env_falls_back(monkeypatch, caplog):
+    """Test a bad VAULTY_JSON_BACKEND logs a warning instead of failing the import."""
+    monkeypatch.setenv(serialization.JSON_BACKEND_ENV, "simplejson")
+
+    serialization._configure_from_env()
+
+    assert serialization.get_json_backend() == "pydantic"
+    assert "Ignoring VAULTY_JSON_BACKEND='simplejson'" in caplog.text
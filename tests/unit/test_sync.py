@@ -0,0 +1,98 @@
+"""Tests for the synchronous client."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from vaulty import SyncVaultyClient
+from vaulty.exceptions import VaultyNotFoundError
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Fake Vaulty API: one secret and two pages of activities."""
+    if request.url.path == "/api/v1/projects/p/secrets/API_KEY":
+        return httpx.Response(200, json={"key": "API_KEY", "value": "secret123"})
+    if request.url.path == "/api/v1/activities":
+        page = int(request.url.params["page"])
+        return httpx.Response(
+            200,
+            json={
+                "items": [{"id": str(page), "action": "create_secret"}],
+                "total": 2,
+                "page": page,
+                "page_size": 1,
+                "total_pages": 2,
+                "has_next": page < 2,
+                "has_previous": page > 1,
+            },
+        )
+    return httpx.Response(404, json={"detail": "Not found"})
+
+
+@pytest.fixture
+def sync_client():
+    """SyncVaultyClient whose HTTP client talks to the fake API."""
+    client = SyncVaultyClient(base_url="https://api.test.com", api_token="test-token")
+    client.http_client._client = httpx.AsyncClient(
+        base_url="https://api.test.com", transport=httpx.MockTransport(_handler)
+    )
+    yield client
+    client.close()
+
+
+def test_sync_client_resource_methods_block(sync_client):
+    """Test resource methods return results instead of coroutines."""
+    secret = sync_client.secrets.get_value("p", "API_KEY")
+    assert secret.value == "secret123"
+
+    with pytest.raises(VaultyNotFoundError, match="Resource not found"):
+        sync_client.secrets.get("p", "MISSING")
+
+
+def test_sync_client_keeps_connection_pool(sync_client):
+    """Test calls share one event loop and HTTP client."""
+    http_client = sync_client.http_client._client
+    sync_client.secrets.get_value("p", "API_KEY")
+    sync_client.secrets.get_value("p", "API_KEY")
+    assert sync_client.http_client._client is http_client
+
+
+def test_sync_client_iterates_async_generators(sync_client):
+    """Test iter_all returns a regular iterator over every page."""
+    activities = sync_client.activities.iter_all(page_size=1)
+    assert [activity.id for activity in activities] == ["1", "2"]
+
+
+def test_sync_client_is_thread_safe(sync_client):
+    """Test threads can share one client."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = list(
+            executor.map(lambda _: sync_client.secrets.get_value("p", "API_KEY").value, range(32))
+        )
+    assert values == ["secret123"] * 32
+
+
+def test_sync_client_close():
+    """Test close stops the loop thread and later calls fail."""
+    before = threading.active_count()
+    client = SyncVaultyClient(base_url="https://api.test.com", api_token="test-token")
+    assert threading.active_count() == before + 1
+
+    client.close()
+    client.close()  # Idempotent
+    assert threading.active_count() == before
+    with pytest.raises(RuntimeError, match="closed"):
+        client.secrets.get_value("p", "API_KEY")
+
+
+def test_sync_client_rejects_calls_from_its_loop(sync_client):
+    """Test calling the sync client from its own loop fails instead of deadlocking."""
+
+    async def nested():
+        sync_client.secrets.get_value("p", "API_KEY")
+
+    with pytest.raises(RuntimeError, match="own event loop"):
+        asyncio.run_coroutine_threadsafe(nested(), sync_client._runner.loop).result()
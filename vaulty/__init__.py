@@ -1,29 +1,54 @@
 """Vaulty Python SDK."""
 
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING
 
-from .client import VaultyClient
 from .exceptions import (
     VaultyAPIError,
     VaultyAuthenticationError,
     VaultyAuthorizationError,
+    VaultyBulkError,
+    VaultyCircuitOpenError,
     VaultyError,
     VaultyNotFoundError,
     VaultyRateLimitError,
+    VaultyTimeoutError,
     VaultyValidationError,
 )
 
+if TYPE_CHECKING:
+    from .client import VaultyClient
+    from .sync import SyncVaultyClient
+
 __all__ = [
+    "SyncVaultyClient",
     "VaultyAPIError",
     "VaultyAuthenticationError",
     "VaultyAuthorizationError",
+    "VaultyBulkError",
+    "VaultyCircuitOpenError",
     "VaultyClient",
     "VaultyError",
     "VaultyNotFoundError",
     "VaultyRateLimitError",
+    "VaultyTimeoutError",
     "VaultyValidationError",
 ]
 
+
+def __getattr__(name: str):
+    """Import heavy modules (httpx, pydantic) on first use, keeping CLI startup fast."""
+    if name == "VaultyClient":
+        from .client import VaultyClient
+
+        return VaultyClient
+    if name == "SyncVaultyClient":
+        from .sync import SyncVaultyClient
+
+        return SyncVaultyClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 try:
     __version__ = version("vaulty-client")
 except PackageNotFoundError:
@@ -0,0 +1,280 @@
+"""In-process caching for Vaulty SDK."""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from .exceptions import VaultyNotFoundError
+from .models import SecretValueResponse
+
+
+class _CacheEntry:
+    """Cached secret value or cached "not found" result."""
+
+    __slots__ = ("error", "expires_at", "stored_at", "value")
+
+    def __init__(
+        self,
+        value: SecretValueResponse | None,
+        error: VaultyNotFoundError | None,
+        stored_at: float,
+        expires_at: float,
+    ):
+        self.value = value
+        self.error = error
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+
+
+class SecretCache:
+    """TTL + LRU cache for decrypted secret values.
+
+    Entries are keyed by ``(project_name, key)``. The least recently used entry is
+    evicted once ``max_entries`` is reached. ``VaultyNotFoundError`` results can be
+    cached too (negative caching) with their own, usually shorter, TTL.
+
+    Expired values are kept until evicted so they can still be served:
+    for ``stale_while_revalidate`` seconds after expiry while a refresh runs in
+    the background, and for ``stale_if_error`` seconds after expiry when the API
+    can't be reached.
+
+    The cache is not thread-safe; it is meant to be used from a single event loop,
+    like the ``VaultyClient`` that owns it.
+
+    Example:
+        >>> client = VaultyClient(api_token="vaulty_abc123...", secret_cache_ttl=60)
+        >>> await client.secrets.get_value("my-project", "API_KEY")  # network
+        >>> await client.secrets.get_value("my-project", "API_KEY")  # memory
+        >>> client.secrets.cache.stats()
+        {'hits': 1, 'misses': 1, 'stale_hits': 0, 'evictions': 0, 'size': 1, 'max_entries': 1024}
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 300.0,
+        negative_ttl: float | None = 30.0,
+        stale_while_revalidate: float = 0.0,
+        stale_if_error: float = 0.0,
+    ):
+        """Initialize secret cache.
+
+        Args:
+            max_entries: Maximum number of cached entries (default: 1024)
+            ttl: Seconds a fetched value stays fresh (default: 300.0)
+            negative_ttl: Seconds a "not found" result stays cached. None or 0
+                disables negative caching (default: 30.0)
+            stale_while_revalidate: Seconds after expiry during which a value is
+                still served while it is refreshed in the background (default: 0.0)
+            stale_if_error: Seconds after expiry during which a value is served if
+                the API is unavailable or its circuit is open (default: 0.0)
+
+        Raises:
+            ValueError: If max_entries is less than 1 or a duration is negative
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if ttl < 0 or stale_while_revalidate < 0 or stale_if_error < 0:
+            raise ValueError("ttl and stale windows must not be negative")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[str, str], _CacheEntry] = OrderedDict()
+        # Bumped on invalidation so fetches started before it don't store old values
+        self._generations: dict[tuple[str, str], int] = {}
+        self._epoch = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, project_name: str, key: str) -> SecretValueResponse | None:
+        """Get a fresh cached value.
+
+        Args:
+            project_name: Project name
+            key: Secret key
+
+        Returns:
+            Copy of the cached SecretValueResponse, or None on a cache miss
+
+        Raises:
+            VaultyNotFoundError: If a fresh "not found" result is cached
+        """
+        entry = self._entries.get((project_name, key))
+        if entry is None or entry.expires_at <= time.monotonic():
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end((project_name, key))
+        self.hits += 1
+        if entry.error is not None:
+            raise VaultyNotFoundError(str(entry.error), entry.error.status_code, entry.error.detail)
+        return entry.value.model_copy() if entry.value is not None else None
+
+    def get_stale(
+        self, project_name: str, key: str, max_staleness: float | None = None
+    ) -> SecretValueResponse | None:
+        """Get a cached value even if it has expired.
+
+        Args:
+            project_name: Project name
+            key: Secret key
+            max_staleness: Seconds past expiry after which the value is no longer
+                served (default: None, any age)
+
+        Returns:
+            Copy of the cached SecretValueResponse, or None if no value is cached
+            or it expired more than max_staleness seconds ago
+        """
+        entry = self._entries.get((project_name, key))
+        if entry is None or entry.value is None:
+            return None
+        if max_staleness is not None and time.monotonic() - entry.expires_at > max_staleness:
+            return None
+        self.stale_hits += 1
+        return entry.value.model_copy()
+
+    def generation(self, project_name: str, key: str) -> tuple[int, int]:
+        """Get the invalidation generation of an entry, to pass to `set` after a fetch.
+
+        Args:
+            project_name: Project name
+            key: Secret key
+
+        Returns:
+            Opaque token that changes whenever the entry is invalidated or cleared
+        """
+        return self._epoch, self._generations.get((project_name, key), 0)
+
+    def set(
+        self,
+        project_name: str,
+        key: str,
+        value: SecretValueResponse,
+        generation: tuple[int, int] | None = None,
+    ):
+        """Cache a fetched value.
+
+        Args:
+            project_name: Project name
+            key: Secret key
+            value: Secret value response to cache
+            generation: `generation()` taken before the fetch started; the value is
+                dropped if the entry was invalidated meanwhile (default: None, always store)
+        """
+        if generation is not None and generation != self.generation(project_name, key):
+            return
+        self._store(project_name, key, _CacheEntry(value, None, *self._lifetime(self.ttl)))
+
+    def set_not_found(
+        self,
+        project_name: str,
+        key: str,
+        error: VaultyNotFoundError,
+        generation: tuple[int, int] | None = None,
+    ):
+        """Cache a "not found" result (no-op if negative caching is disabled).
+
+        Args:
+            project_name: Project name
+            key: Secret key
+            error: Error raised by the API
+            generation: `generation()` taken before the fetch started (see `set`)
+        """
+        if not self.negative_ttl:
+            return
+        if generation is not None and generation != self.generation(project_name, key):
+            return
+        self._store(project_name, key, _CacheEntry(None, error, *self._lifetime(self.negative_ttl)))
+
+    def invalidate(self, project_name: str, key: str):
+        """Drop a cached entry, and the result of any fetch of it still in flight.
+
+        Args:
+            project_name: Project name
+            key: Secret key
+        """
+        cache_key = (project_name, key)
+        self._entries.pop(cache_key, None)
+        self._generations[cache_key] = self._generations.get(cache_key, 0) + 1
+
+    def clear(self):
+        """Drop all cached entries (counters are kept)."""
+        self._entries.clear()
+        self._generations.clear()
+        self._epoch += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache counters for monitoring.
+
+        Returns:
+            Dict with hits, misses, stale_hits, evictions, size and max_entries
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+    def _lifetime(self, ttl: float) -> tuple[float, float]:
+        now = time.monotonic()
+        return now, now + ttl
+
+    def _store(self, project_name: str, key: str, entry: _CacheEntry):
+        cache_key = (project_name, key)
+        self._entries[cache_key] = entry
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+class ProjectScopeCache:
+    """Per-client cache of the project a project-scoped token resolves to.
+
+    Only one entry is kept, tied to the credentials it was resolved with: a token
+    change (e.g. after ``auth.login()``) makes the cached project a miss. Shared by
+    ``SecretResource.list`` and the CLI's token scope lookup.
+    """
+
+    def __init__(self):
+        self._auth_header: str | None = None
+        self._project: dict[str, str | None] | None = None
+
+    def get(self, auth_header: str | None) -> dict[str, str | None] | None:
+        """Get the resolved project for the given credentials.
+
+        Args:
+            auth_header: Authorization header the project was resolved with
+
+        Returns:
+            Dict with 'id' and 'name' keys, or None if not resolved yet
+        """
+        if self._project is None or auth_header != self._auth_header:
+            return None
+        return dict(self._project)
+
+    def set(self, auth_header: str | None, project: dict[str, str | None]):
+        """Store the resolved project for the given credentials.
+
+        Args:
+            auth_header: Authorization header the project was resolved with
+            project: Dict with 'id' and 'name' keys
+        """
+        self._auth_header = auth_header
+        self._project = {"id": project.get("id"), "name": project.get("name")}
+
+    def invalidate(self):
+        """Forget the resolved project."""
+        self._auth_header = None
+        self._project = None
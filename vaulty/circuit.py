@@ -0,0 +1,192 @@
+"""Per-endpoint circuit breaking for Vaulty SDK."""
+
+import time
+from typing import Any
+
+from .exceptions import VaultyCircuitOpenError
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Path segments following these collections are identifiers, not part of the route
+_ROUTE_PARAMS = {"projects": "{project}", "secrets": "{key}", "tokens": "{token_id}"}
+
+
+def route_template(method: str, path: str) -> str:
+    """Build the route template of a request, e.g. ``GET /api/v1/projects/{project}``.
+
+    Args:
+        method: HTTP method
+        path: Request path (without query string)
+
+    Returns:
+        Method and path with project names, secret keys and token IDs replaced
+    """
+    segments = path.strip("/").split("/")
+    template = []
+    for index, segment in enumerate(segments):
+        previous = segments[index - 1] if index else None
+        template.append(_ROUTE_PARAMS.get(previous, segment) if previous else segment)
+    return f"{method.upper()} /{'/'.join(template)}"
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for one route.
+
+    After `failure_threshold` consecutive failures (5xx, timeouts, connection
+    errors) the circuit opens and calls fail immediately with
+    VaultyCircuitOpenError. Once `recovery_timeout` seconds have passed it goes
+    half-open and lets `half_open_max_calls` probe requests through: a successful
+    probe closes the circuit, a failed one opens it again.
+    """
+
+    def __init__(
+        self,
+        route: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            route: Route template the breaker protects
+            failure_threshold: Consecutive failures that open the circuit (default: 5)
+            recovery_timeout: Seconds the circuit stays open before probing (default: 30.0)
+            half_open_max_calls: Probe requests allowed at once while half-open (default: 1)
+
+        Raises:
+            ValueError: If a threshold is less than 1 or recovery_timeout is negative
+        """
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError("failure_threshold and half_open_max_calls must be at least 1")
+        if recovery_timeout < 0:
+            raise ValueError("recovery_timeout must not be negative")
+
+        self.route = route
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        if self._state == OPEN and time.monotonic() >= self._opened_at + self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._probes = 0
+            logger.info(f"Circuit half-open for {self.route}, probing")
+        return self._state
+
+    def allow(self):
+        """Let a call through, or fail it fast.
+
+        Every allowed call must be followed by `record_success`, `record_failure`
+        or `record_skipped`.
+
+        Raises:
+            VaultyCircuitOpenError: If the circuit is open, or half-open with all
+                probe slots taken
+        """
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return
+
+        self.rejected += 1
+        retry_after = max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+        raise VaultyCircuitOpenError(
+            f"Circuit open for {self.route}: endpoint is failing, not sending request",
+            route=self.route,
+            retry_after=retry_after,
+        )
+
+    def record_success(self):
+        """Record a call that got an answer from the endpoint."""
+        if self._state == HALF_OPEN:
+            logger.info(f"Circuit closed for {self.route}")
+        self._state = CLOSED
+        self._failures = 0
+        self._probes = 0
+
+    def record_failure(self):
+        """Record a call that failed because the endpoint is unhealthy."""
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != OPEN:
+                logger.warning(
+                    f"Circuit opened for {self.route} after {self._failures} failures",
+                    extra={"route": self.route, "failures": self._failures},
+                )
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+            self._probes = 0
+
+    def record_skipped(self):
+        """Release a call whose outcome says nothing about the endpoint (e.g. cancelled)."""
+        if self._state == HALF_OPEN and self._probes:
+            self._probes -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get breaker state for monitoring.
+
+        Returns:
+            Dict with state, consecutive failures and rejected calls
+        """
+        return {"state": self.state, "failures": self._failures, "rejected": self.rejected}
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers for every route of a client, created on first use.
+
+    Example:
+        >>> client = VaultyClient(api_token="vaulty_abc123...", circuit_breaker=True)
+        >>> client.http_client.circuit_breakers.stats()
+        {'GET /api/v1/projects/{project}/secrets/{key}': {'state': 'open', ...}}
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        """Initialize circuit breaker registry.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit (default: 5)
+            recovery_timeout: Seconds a circuit stays open before probing (default: 30.0)
+            half_open_max_calls: Probe requests allowed at once while half-open (default: 1)
+        """
+        # Validate once here rather than on the first request
+        CircuitBreaker("", failure_threshold, recovery_timeout, half_open_max_calls)
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, method: str, path: str) -> CircuitBreaker:
+        """Get the breaker for a request's route."""
+        route = route_template(method, path)
+        breaker = self._breakers.get(route)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                route, self.failure_threshold, self.recovery_timeout, self.half_open_max_calls
+            )
+            self._breakers[route] = breaker
+        return breaker
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get the state of every breaker, keyed by route template."""
+        return {route: breaker.stats() for route, breaker in self._breakers.items()}
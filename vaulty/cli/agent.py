@@ -0,0 +1,402 @@
+"""Local secrets agent.
+
+`vaulty agent` keeps a warm VaultyClient (connection pool, secret value cache and
+resolved project scope) alive behind a Unix domain socket, like ssh-agent. When
+VAULTY_AGENT_SOCK is set, CLI commands ask the agent instead of creating a client,
+skipping heavy imports, credential decryption and TLS handshakes.
+
+The protocol is one JSON object per line in each direction:
+
+    {"op": "ping"}                                  -> {"ok": true, "pid": 1234}
+    {"op": "project"}                               -> {"ok": true, "project": "my-project"}
+    {"op": "get", "project": "p", "key": "K"}       -> {"ok": true, "secret": {...}}
+    {"op": "get_many", "project": "p", "keys": [..]} -> {"ok": true, "secrets": {..}, "errors": {..}}
+    {"op": "invalidate", "project": "p", "key": "K"} -> {"ok": true}
+    {"op": "stop"}                                  -> {"ok": true}
+
+"get_many" takes an optional "concurrency". The project, get and get_many requests
+may carry "credentials" ({"token_sha256": ..., "base_url": ...}) taken from
+VAULTY_API_TOKEN / VAULTY_API_URL; the agent refuses them with an
+AgentCredentialsError when its own client uses different ones, and the CLI then
+fetches directly.
+
+Failures are answered with {"ok": false, "error": {"type": ..., "message": ..., ...}}.
+
+This module only imports the standard library at import time, so the client side
+stays cheap for the CLI.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import json
+import os
+import socket
+import struct
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .. import exceptions
+
+if TYPE_CHECKING:
+    from .. import VaultyClient
+
+AGENT_SOCK_ENV = "VAULTY_AGENT_SOCK"
+
+# Seconds the CLI waits for an agent response (cache misses go to the API)
+DEFAULT_AGENT_TIMEOUT = 30.0
+
+# Seconds a write command waits for the agent to drop a changed secret
+INVALIDATE_TIMEOUT = 2.0
+
+# Operations that talk to the API and so must use the caller's credentials
+_CREDENTIAL_OPS = frozenset({"project", "get", "get_many"})
+
+# Error types that are sent back to the CLI and re-raised there
+_ERROR_TYPES: dict[str, type[Exception]] = {
+    cls.__name__: cls
+    for cls in (
+        exceptions.VaultyError,
+        exceptions.VaultyAPIError,
+        exceptions.VaultyAuthenticationError,
+        exceptions.VaultyAuthorizationError,
+        exceptions.VaultyNotFoundError,
+        exceptions.VaultyValidationError,
+        exceptions.VaultyRateLimitError,
+        exceptions.VaultyTimeoutError,
+        exceptions.VaultyCircuitOpenError,
+        ValueError,
+    )
+}
+
+
+class AgentUnavailableError(Exception):
+    """The agent could not be reached (not running, stale socket, timeout)."""
+
+
+class AgentCredentialsError(AgentUnavailableError):
+    """The agent's client uses other credentials than the caller asked for."""
+
+
+def token_sha256(token: str) -> str:
+    """Hash an API token so it can be compared without sending it to the agent.
+
+    Unlike CLIConfig.token_fingerprint, this hashes the bare token only.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def encode_error(error: Exception) -> dict[str, Any]:
+    """Serialize an exception for an agent response."""
+    data: dict[str, Any] = {"type": type(error).__name__, "message": str(error)}
+    if isinstance(error, exceptions.VaultyAPIError):
+        data["status_code"] = error.status_code
+        data["detail"] = error.detail
+    if isinstance(error, exceptions.VaultyRateLimitError):
+        data["retry_after"] = error.retry_after
+    return data
+
+
+def decode_error(data: dict[str, Any]) -> Exception:
+    """Rebuild an exception from an agent response (unknown types become VaultyError)."""
+    error_type = _ERROR_TYPES.get(data.get("type", ""), exceptions.VaultyError)
+    message = data.get("message", "Agent request failed")
+    if issubclass(error_type, exceptions.VaultyRateLimitError):
+        return error_type(
+            message, data.get("status_code", 429), data.get("detail"), data.get("retry_after")
+        )
+    if issubclass(error_type, exceptions.VaultyAPIError):
+        return error_type(message, data.get("status_code", 0), data.get("detail"))
+    return error_type(message)
+
+
+class AgentClient:
+    """Blocking client for a running agent (standard library only)."""
+
+    def __init__(
+        self,
+        socket_path: str | Path,
+        timeout: float = DEFAULT_AGENT_TIMEOUT,
+        credentials: dict[str, str] | None = None,
+    ):
+        self.socket_path = str(socket_path)
+        self.timeout = timeout
+        self.credentials = credentials or {}
+
+    @classmethod
+    def from_env(cls) -> "AgentClient | None":
+        """Create a client for the agent in VAULTY_AGENT_SOCK, or None if it isn't set.
+
+        VAULTY_API_TOKEN and VAULTY_API_URL, when set, are sent along so the agent
+        only answers if its client uses the same credentials.
+        """
+        socket_path = os.getenv(AGENT_SOCK_ENV)
+        if not socket_path:
+            return None
+        credentials = {}
+        if token := os.getenv("VAULTY_API_TOKEN"):
+            credentials["token_sha256"] = token_sha256(token)
+        if base_url := os.getenv("VAULTY_API_URL"):
+            credentials["base_url"] = base_url
+        return cls(socket_path, credentials=credentials)
+
+    def request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send one request and return the successful response.
+
+        Raises:
+            AgentUnavailableError: If the agent can't be reached or answers garbage
+            AgentCredentialsError: If the agent uses other credentials than ours
+            VaultyError: (or subclass) If the agent reports an API error
+            ValueError: If the agent rejects the request
+        """
+        if self.credentials and payload.get("op") in _CREDENTIAL_OPS:
+            payload = {**payload, "credentials": self.credentials}
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(self.socket_path)
+                sock.sendall(json.dumps(payload).encode() + b"\n")
+                with sock.makefile("rb") as stream:
+                    line = stream.readline()
+            response: dict[str, Any] = json.loads(line)
+        except (OSError, ValueError) as e:
+            raise AgentUnavailableError(f"Agent at {self.socket_path} unavailable: {e}") from e
+
+        if not response.get("ok"):
+            error = response.get("error") or {}
+            if error.get("type") == AgentCredentialsError.__name__:
+                raise AgentCredentialsError(error.get("message", "Agent credentials differ"))
+            raise decode_error(error)
+        return response
+
+    def ping(self) -> int:
+        """Check the agent is alive; returns its process ID."""
+        pid: int = self.request({"op": "ping"})["pid"]
+        return pid
+
+    def project(self) -> str | None:
+        """Get the project implied by the agent's token (None for full-scope tokens)."""
+        project: str | None = self.request({"op": "project"})["project"]
+        return project
+
+    def get_value(self, project_name: str, key: str) -> dict[str, Any]:
+        """Get a secret value as a dict (the JSON form of SecretValueResponse)."""
+        secret: dict[str, Any] = self.request({"op": "get", "project": project_name, "key": key})[
+            "secret"
+        ]
+        return secret
+
+    def get_many(
+        self, project_name: str, keys: list[str], concurrency: int | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Get many secret values as dicts, keyed by secret key.
+
+        Args:
+            project_name: Project name containing the secrets
+            keys: Secret keys to retrieve
+            concurrency: Maximum number of requests the agent runs in parallel
+                (default: the agent's default)
+
+        Raises:
+            VaultyBulkError: If any key could not be fetched
+        """
+        payload: dict[str, Any] = {"op": "get_many", "project": project_name, "keys": list(keys)}
+        if concurrency is not None:
+            payload["concurrency"] = concurrency
+        response = self.request(payload)
+        if response["errors"]:
+            raise exceptions.VaultyBulkError(
+                f"Failed to fetch {len(response['errors'])} of "
+                f"{len(response['secrets']) + len(response['errors'])} secrets",
+                results=response["secrets"],
+                errors={key: decode_error(error) for key, error in response["errors"].items()},
+            )
+        secrets: dict[str, dict[str, Any]] = response["secrets"]
+        return secrets
+
+    def invalidate(self, project_name: str, key: str):
+        """Drop a secret from the agent's value cache."""
+        self.request({"op": "invalidate", "project": project_name, "key": key})
+
+    def stop(self):
+        """Ask the agent to shut down."""
+        self.request({"op": "stop"})
+
+
+def invalidate_agent_cache(project_name: str, key: str):
+    """Tell the agent in VAULTY_AGENT_SOCK, if any, that a secret was written.
+
+    Best-effort: write commands call this after changing a secret so 'vaulty get'
+    doesn't serve the old value from the agent's cache. Errors are ignored.
+    """
+    agent = AgentClient.from_env()
+    if agent is None:
+        return
+    agent.timeout = INVALIDATE_TIMEOUT
+    with contextlib.suppress(AgentUnavailableError, exceptions.VaultyError, ValueError):
+        agent.invalidate(project_name, key)
+
+
+def default_socket_path() -> Path:
+    """Create a private (0700) directory for a new agent socket.
+
+    Uses $XDG_RUNTIME_DIR when set, the system temp directory otherwise.
+    """
+    base_dir = os.getenv("XDG_RUNTIME_DIR") or None
+    socket_dir = Path(tempfile.mkdtemp(prefix="vaulty-agent-", dir=base_dir))
+    return socket_dir / f"agent.{os.getpid()}.sock"
+
+
+class AgentServer:
+    """Serves agent requests from a warm VaultyClient over a Unix socket.
+
+    Only connections from the current user are served: the socket is created
+    with 0600 permissions and, where the platform supports it, the peer's UID is
+    checked.
+    """
+
+    def __init__(self, client: "VaultyClient", socket_path: str | Path):
+        self.client = client
+        self.socket_path = Path(socket_path)
+        self._stopped = asyncio.Event()
+
+    async def serve(self, on_ready=None):
+        """Serve until `stop()` is called (or a "stop" request arrives).
+
+        Args:
+            on_ready: Optional callable invoked once the socket accepts connections
+        """
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                self._handle_connection, path=str(self.socket_path)
+            )
+        finally:
+            os.umask(old_umask)
+
+        try:
+            if on_ready is not None:
+                on_ready()
+            await self._stopped.wait()
+        finally:
+            server.close()
+            await server.wait_closed()
+            self.socket_path.unlink(missing_ok=True)
+            if self.socket_path.parent.name.startswith("vaulty-agent-"):
+                with contextlib.suppress(OSError):
+                    self.socket_path.parent.rmdir()  # Directory from default_socket_path()
+            await self.client.close()
+
+    def stop(self):
+        """Stop serving."""
+        self._stopped.set()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            if not self._peer_allowed(writer):
+                return
+            while line := await reader.readline():
+                response = await self.handle_request(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # Client went away
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _peer_allowed(writer: asyncio.StreamWriter) -> bool:
+        sock = writer.get_extra_info("socket")
+        if sock is None or not hasattr(socket, "SO_PEERCRED"):
+            return True  # Rely on the socket file permissions
+        creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        _pid, uid, _gid = struct.unpack("3i", creds)
+        return int(uid) == os.getuid()
+
+    async def handle_request(self, line: bytes) -> dict[str, Any]:
+        """Handle one raw request line and build the response."""
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise TypeError("Request must be a JSON object")
+            return await self._dispatch(request)
+        except Exception as e:
+            return {"ok": False, "error": encode_error(e)}
+
+    async def _dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        op = request.get("op")
+
+        if op in _CREDENTIAL_OPS:
+            self._check_credentials(request.get("credentials") or {})
+
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+
+        if op == "project":
+            from .utils import get_project_from_token_scope
+
+            project_info = await get_project_from_token_scope(self.client)
+            project = (project_info.get("name") or project_info.get("id")) if project_info else None
+            return {"ok": True, "project": project}
+
+        if op == "get":
+            value = await self.client.secrets.get_value(
+                _required(request, "project"), _required(request, "key")
+            )
+            return {"ok": True, "secret": value.model_dump(mode="json")}
+
+        if op == "get_many":
+            options = {}
+            if request.get("concurrency") is not None:
+                options["concurrency"] = int(request["concurrency"])
+            try:
+                values = await self.client.secrets.get_many(
+                    _required(request, "project"), _required(request, "keys"), **options
+                )
+                errors = {}
+            except exceptions.VaultyBulkError as e:
+                values, errors = e.results, e.errors
+            return {
+                "ok": True,
+                "secrets": {key: value.model_dump(mode="json") for key, value in values.items()},
+                "errors": {key: encode_error(error) for key, error in errors.items()},
+            }
+
+        if op == "invalidate":
+            if self.client.secrets.cache is not None:
+                self.client.secrets.cache.invalidate(
+                    _required(request, "project"), _required(request, "key")
+                )
+            return {"ok": True}
+
+        if op == "stop":
+            self.stop()
+            return {"ok": True}
+
+        raise ValueError(f"Unknown agent operation: {op!r}")
+
+    def _check_credentials(self, credentials: dict[str, str]):
+        """Refuse requests meant for another token or API than this agent's."""
+        http_client = self.client.http_client
+        expected_token = credentials.get("token_sha256")
+        if expected_token is not None and not (
+            http_client.api_token
+            and hmac.compare_digest(token_sha256(http_client.api_token), expected_token)
+        ):
+            raise AgentCredentialsError("VAULTY_API_TOKEN differs from the agent's token")
+
+        base_url = credentials.get("base_url")
+        if base_url is not None:
+            from .utils import normalize_base_url
+
+            if normalize_base_url(base_url) != normalize_base_url(http_client.base_url):
+                raise AgentCredentialsError("VAULTY_API_URL differs from the agent's API URL")
+
+
+def _required(request: dict[str, Any], field: str) -> Any:
+    value = request.get(field)
+    if not value:
+        raise ValueError(f"Agent request is missing '{field}'")
+    return value
@@ -1,13 +1,17 @@
-"""CLI commands."""
+"""CLI commands.
 
-from . import activities, auth, customers, health, projects, secrets, tokens
+Command modules are imported lazily by the CLI entry point (see `vaulty.cli.main`),
+so only the module of the invoked command is loaded.
+"""
 
 __all__ = [
     "activities",
+    "agent",
     "auth",
     "customers",
     "health",
     "projects",
+    "run",
     "secrets",
     "tokens",
 ]
@@ -1,12 +1,45 @@
 """Activity commands."""
 
+import csv
+import io
+import json
+import os
 import sys
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 import click
 
 from ...cli.output import OutputFormatter
 from ...cli.utils import get_client, run_async
+from ...pagination import iterate_pages
+
+# Columns of `activities export --format csv`, in ActivityResponse field order
+EXPORT_FIELDS = (
+    "id",
+    "action",
+    "method",
+    "resource_type",
+    "resource_id",
+    "customer_id",
+    "project_id",
+    "ip_address",
+    "user_agent",
+    "created_at",
+    "metadata",
+)
+
+# Export options a checkpoint was written for; --resume must not change them
+_CHECKPOINT_OPTIONS = (
+    "format",
+    "since",
+    "until",
+    "action",
+    "method",
+    "resource_id",
+    "search",
+    "page_size",
+)
 
 
 @click.group()
@@ -63,22 +96,340 @@ def list_activities(
                 search=search,
                 start_date=start_dt,
                 end_date=end_dt,
+                raw=True,
             )
         )
 
         formatter = OutputFormatter(format=format)
-        output = formatter.format_output(
-            {
-                "items": [item.dict() for item in result.items],
-                "total": result.total,
-                "page": result.page,
-                "page_size": result.page_size,
-                "total_pages": result.total_pages,
-                "has_next": result.has_next,
-                "has_previous": result.has_previous,
+        output = formatter.format_output(result.to_dict())
+        click.echo(output)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@activities_group.command("export")
+@click.option(
+    "--since", required=True, help="Export activities after this date (YYYY-MM-DD or ISO 8601)"
+)
+@click.option(
+    "--until", help="Export activities before this date (default: when the export started)"
+)
+@click.option("--out", "-o", required=True, type=click.Path(dir_okay=False), help="Output file")
+@click.option("--format", "-f", default="jsonl", type=click.Choice(["jsonl", "csv"]))
+@click.option("--action", help="Filter by action (e.g., create_secret)")
+@click.option("--method", help="Filter by HTTP method (e.g., POST)")
+@click.option("--resource-id", help="Filter by resource ID")
+@click.option("--search", help="Search term")
+@click.option("--page-size", default=100, type=click.IntRange(1, 100), help="Items per request")
+@click.option("--resume", is_flag=True, help="Continue an interrupted export from its checkpoint")
+@click.option("--token", "-t", help="API token (overrides stored credentials)")
+@click.option("--base-url", "-u", help="Base URL (overrides stored/configured URL)")
+def export_activities(
+    since,
+    until,
+    out,
+    format,
+    action,
+    method,
+    resource_id,
+    search,
+    page_size,
+    resume,
+    token,
+    base_url,
+):
+    """Export activities to a JSONL or CSV file.
+
+    Pages are written as they arrive (the next one is fetched while the current
+    one is written) and progress is checkpointed to OUT.checkpoint after every
+    page. If the export is interrupted, rerun it with --resume: it continues
+    from the created_at of the last activity written rather than from a page
+    number, so rows purged or added meanwhile don't cause gaps or duplicates.
+    The end of the time range is fixed when the export starts. Dates without a
+    timezone are taken as UTC.
+    """
+    try:
+        options = {
+            "format": format,
+            "since": _parse_utc(since).isoformat(),
+            "until": _parse_utc(until).isoformat() if until else None,
+            "action": action,
+            "method": method,
+            "resource_id": resource_id,
+            "search": search,
+            "page_size": page_size,
+        }
+        checkpoint_path = Path(f"{out}.checkpoint")
+        if resume:
+            checkpoint = _load_export_checkpoint(checkpoint_path, options)
+            click.echo(
+                f"Resuming after {checkpoint['items']} activities "
+                f"(last: {checkpoint['last_id']} at {checkpoint['last_created_at']})",
+                err=True,
+            )
+        else:
+            checkpoint = {
+                **options,
+                "until": options["until"] or datetime.now(UTC).isoformat(),
+                "offset": 0,
+                "items": 0,
+                # Keyset to resume from: the API's order ("asc"/"desc", known once two
+                # timestamps were written), the last created_at and the ids written at it
+                "order": None,
+                "last_id": None,
+                "last_created_at": None,
+                "boundary_ids": [],
             }
+
+        client = get_client(token=token, base_url=base_url)
+        checkpoint = run_async(_export_activities(client, out, checkpoint_path, checkpoint))
+
+        checkpoint_path.unlink()
+        click.echo(f"Exported {checkpoint['items']} activities to {out}", err=True)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+def _parse_utc(value):
+    """Parse an ISO 8601 date, treating dates without a timezone as UTC."""
+    parsed = datetime.fromisoformat(value)
+    return parsed.replace(tzinfo=UTC) if parsed.tzinfo is None else parsed
+
+
+def _load_export_checkpoint(path, options):
+    """Load the checkpoint of an interrupted export.
+
+    Args:
+        path: Checkpoint file
+        options: Options of the current invocation ("until" may be None)
+
+    Returns:
+        Checkpoint dict
+
+    Raises:
+        ValueError: If there is no checkpoint or it was written for other options
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except FileNotFoundError:
+        raise ValueError(f"No checkpoint found at {path}; run without --resume") from None
+
+    changed = [
+        name
+        for name in _CHECKPOINT_OPTIONS
+        if checkpoint.get(name) != options[name] and not (name == "until" and not options[name])
+    ]
+    if changed:
+        raise ValueError(
+            f"Checkpoint {path} was written with different options ({', '.join(changed)}); "
+            "rerun with the original options or without --resume"
         )
-        click.echo(output)
+    return checkpoint
+
+
+def _save_export_checkpoint(path, checkpoint):
+    """Write a checkpoint atomically, so a crash never leaves it half-written."""
+    temp_path = path.with_name(f"{path.name}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    temp_path.replace(path)
+
+
+def _encode_activities(items, format):
+    """Encode a page of raw activity dicts as JSON lines or CSV rows."""
+    if format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for item in items:
+            writer.writerow(
+                json.dumps(value) if isinstance(value, dict) else value
+                for value in (item.get(field) for field in EXPORT_FIELDS)
+            )
+        return buffer.getvalue().encode()
+    return "".join(json.dumps(item, separators=(",", ":")) + "\n" for item in items).encode()
+
+
+async def _export_activities(client, out, checkpoint_path, checkpoint):
+    """Stream activity pages into `out`, checkpointing after each page.
+
+    Only the current page and one read-ahead page are held in memory. On resume,
+    anything written after the checkpointed byte offset (a partially written
+    page) is truncated, then the time range is narrowed to start (ascending
+    order) or end (descending order) at the last written created_at, and the
+    activities already written at that timestamp are skipped.
+
+    Args:
+        client: VaultyClient instance
+        out: Output file path
+        checkpoint_path: Checkpoint file path
+        checkpoint: Checkpoint to start from (options, offset, keyset, ...)
+
+    Returns:
+        Checkpoint after the last page
+    """
+    start_date = datetime.fromisoformat(checkpoint["since"])
+    end_date = datetime.fromisoformat(checkpoint["until"])
+    order = checkpoint["order"]
+    boundary = checkpoint["last_created_at"]
+    boundary = _parse_utc(boundary) if boundary else None
+    boundary_ids = set(checkpoint["boundary_ids"])
+    if boundary is not None and order == "asc":
+        start_date = boundary
+    elif boundary is not None and order == "desc":
+        end_date = boundary
+
+    def fetch_page(page):
+        return client.activities.list(
+            page=page,
+            page_size=checkpoint["page_size"],
+            action=checkpoint["action"],
+            method=checkpoint["method"],
+            resource_id=checkpoint["resource_id"],
+            search=checkpoint["search"],
+            start_date=start_date,
+            end_date=end_date,
+            raw=True,
+        )
+
+    def already_written(item, created_at):
+        if boundary is None or created_at is None:
+            return False
+        if created_at == boundary:
+            return item.get("id") in boundary_ids
+        # Before the keyset in the export's order (filters may be inclusive)
+        if order == "asc":
+            return created_at < boundary
+        if order == "desc":
+            return created_at > boundary
+        return False
+
+    offset = checkpoint["offset"]
+    with open(out, "r+b" if offset else "wb") as f:
+        if offset:
+            if f.seek(0, os.SEEK_END) < offset:
+                raise ValueError(f"{out} is shorter than its checkpoint; run without --resume")
+            f.truncate(offset)
+            f.seek(offset)
+        elif checkpoint["format"] == "csv":
+            f.write(",".join(EXPORT_FIELDS).encode() + b"\r\n")
+
+        async for page in iterate_pages(fetch_page):
+            items = []
+            for item in page.items:
+                created_at = _parse_utc(item["created_at"]) if item.get("created_at") else None
+                if already_written(item, created_at):
+                    continue
+                items.append(item)
+                _advance_keyset(checkpoint, item, created_at)
+
+            if items:
+                f.write(_encode_activities(items, checkpoint["format"]))
+            f.flush()
+
+            checkpoint["offset"] = f.tell()
+            checkpoint["items"] += len(items)
+            _save_export_checkpoint(checkpoint_path, checkpoint)
+
+    return checkpoint
+
+
+def _advance_keyset(checkpoint, item, created_at):
+    """Move the checkpoint's keyset to an activity that is being written."""
+    checkpoint["last_id"] = item.get("id")
+    if created_at is None:
+        return
+
+    last = checkpoint["last_created_at"]
+    last = _parse_utc(last) if last else None
+    if last is not None and created_at == last:
+        checkpoint["boundary_ids"].append(item.get("id"))
+        return
+    if last is not None and checkpoint["order"] is None:
+        checkpoint["order"] = "asc" if created_at > last else "desc"
+    checkpoint["last_created_at"] = item["created_at"]
+    checkpoint["boundary_ids"] = [item.get("id")]
+
+
+@activities_group.command("tail")
+@click.option("--follow", is_flag=True, help="Keep polling for new activities until interrupted")
+@click.option("--since", help="Show activities after this date (default: one hour ago)")
+@click.option("--action", help="Filter by action (e.g., create_secret)")
+@click.option("--method", help="Filter by HTTP method (e.g., POST)")
+@click.option("--resource-id", help="Filter by resource ID")
+@click.option("--search", help="Search term")
+@click.option(
+    "--interval",
+    default=1.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="Seconds between polls while activities arrive",
+)
+@click.option(
+    "--max-interval",
+    default=30.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="Longest wait between polls when idle",
+)
+@click.option("--format", "-f", default="jsonl", type=click.Choice(["jsonl", "plain"]))
+@click.option("--token", "-t", help="API token (overrides stored credentials)")
+@click.option("--base-url", "-u", help="Base URL (overrides stored/configured URL)")
+def tail_activities(
+    follow,
+    since,
+    action,
+    method,
+    resource_id,
+    search,
+    interval,
+    max_interval,
+    format,
+    token,
+    base_url,
+):
+    """Print activities as they are recorded, oldest first.
+
+    With --follow, keeps polling from the newest activity seen (one request per
+    poll in the common case) and waits longer between polls while nothing
+    happens, up to --max-interval. Output is one line per activity, flushed
+    immediately, so it can be piped into a log forwarder.
+    """
+    try:
+        client = get_client(token=token, base_url=base_url)
+        start_date = (
+            datetime.fromisoformat(since) if since else datetime.now(UTC) - timedelta(hours=1)
+        )
+        activities = client.activities.tail(
+            start_date=start_date,
+            action=action,
+            method=method,
+            resource_id=resource_id,
+            search=search,
+            poll_interval=interval,
+            max_poll_interval=max_interval,
+            follow=follow,
+            raw=True,
+        )
+        run_async(_print_activities(activities, format))
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
+
+
+async def _print_activities(activities, format):
+    """Print each activity of an async iterator on its own line."""
+    async for activity in activities:
+        if format == "plain":
+            click.echo(
+                " ".join(
+                    str(activity.get(field) or "-")
+                    for field in ("created_at", "action", "method", "resource_type", "resource_id")
+                )
+            )
+        else:
+            click.echo(json.dumps(activity, separators=(",", ":")))
@@ -0,0 +1,119 @@
+"""Agent command."""
+
+import asyncio
+import os
+import signal
+import sys
+
+import click
+
+from ..agent import (
+    AGENT_SOCK_ENV,
+    AgentClient,
+    AgentServer,
+    AgentUnavailableError,
+    default_socket_path,
+)
+from ..utils import get_client
+
+
+@click.command("agent")
+@click.option("--socket", "-a", "socket_path", help="Socket path (default: private temp dir)")
+@click.option(
+    "--cache-ttl",
+    default=300.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="Seconds secret values are cached by the agent",
+)
+@click.option("--daemon", "-d", is_flag=True, help="Run in the background")
+@click.option("--stop", "-k", is_flag=True, help=f"Stop the agent in ${AGENT_SOCK_ENV}")
+@click.option("--token", "-t", help="API token (overrides stored credentials)")
+@click.option("--base-url", "-u", help="Base URL (overrides stored/configured URL)")
+def agent_command(socket_path, cache_ttl, daemon, stop, token, base_url):
+    """Run a local secrets agent (like ssh-agent).
+
+    The agent keeps an authenticated client, its connection pool and a secret
+    value cache alive. Commands such as 'vaulty get' use it when
+    VAULTY_AGENT_SOCK is set, which makes repeated calls much faster.
+
+    Examples:
+        eval "$(vaulty agent --daemon)"
+        vaulty get API_KEY          # served by the agent
+        vaulty agent --stop
+    """
+    if stop:
+        agent = AgentClient(socket_path) if socket_path else AgentClient.from_env()
+        if agent is None:
+            click.echo(f"Error: {AGENT_SOCK_ENV} is not set", err=True)
+            sys.exit(2)
+        try:
+            agent.stop()
+        except AgentUnavailableError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+        click.echo(f"unset {AGENT_SOCK_ENV};")
+        return
+
+    try:
+        client = get_client(token=token, base_url=base_url, secret_cache_ttl=cache_ttl)
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(2)
+
+    socket_path = socket_path or str(default_socket_path())
+    server = AgentServer(client, socket_path)
+    export_line = f"export {AGENT_SOCK_ENV}={socket_path};"
+
+    if daemon:
+        _daemonize(server, export_line)
+        return
+
+    click.echo(export_line)
+    click.echo(f"echo Agent pid {os.getpid()};", err=True)
+    _serve(server)
+
+
+def _serve(server: AgentServer, on_ready=None):
+    """Run the agent until it is stopped or receives SIGINT/SIGTERM."""
+
+    async def _main():
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, server.stop)
+        await server.serve(on_ready=on_ready)
+
+    asyncio.run(_main())
+
+
+def _daemonize(server: AgentServer, export_line: str):
+    """Fork the agent into the background; the parent prints the export line once it's ready."""
+    ready_read, ready_write = os.pipe()
+    pid = os.fork()
+
+    if pid:
+        os.close(ready_write)
+        ready = os.read(ready_read, 1)
+        os.close(ready_read)
+        if not ready:
+            click.echo("Error: Agent failed to start", err=True)
+            sys.exit(1)
+        click.echo(export_line)
+        click.echo(f"echo Agent pid {pid};")
+        return
+
+    # Child: detach from the terminal and serve
+    os.close(ready_read)
+    os.setsid()
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+
+    def _ready():
+        os.write(ready_write, b"1")
+        os.close(ready_write)
+
+    try:
+        _serve(server, on_ready=_ready)
+    finally:
+        os._exit(0)
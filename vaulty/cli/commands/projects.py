@@ -25,20 +25,10 @@ def list_projects(page, page_size, format, token, base_url):
     """List all projects."""
     try:
         client = get_client(token=token, base_url=base_url)
-        result = run_async(client.projects.list(page=page, page_size=page_size))
+        result = run_async(client.projects.list(page=page, page_size=page_size, raw=True))
 
         formatter = OutputFormatter(format=format)
-        output = formatter.format_output(
-            {
-                "items": [item.dict() for item in result.items],
-                "total": result.total,
-                "page": result.page,
-                "page_size": result.page_size,
-                "total_pages": result.total_pages,
-                "has_next": result.has_next,
-                "has_previous": result.has_previous,
-            }
-        )
+        output = formatter.format_output(result.to_dict())
         click.echo(output)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -0,0 +1,82 @@
+"""Run command."""
+
+import os
+import sys
+
+import click
+
+from ...cli.utils import fetch_secret_values, get_client, resolve_project, run_async
+
+
+@click.command(
+    "run", context_settings={"ignore_unknown_options": True, "allow_interspersed_args": False}
+)
+@click.option(
+    "--project", "-p", help="Project name (required for full scope, optional for project-scoped)"
+)
+@click.option("--key", "-k", "keys", multiple=True, help="Secret key to inject (repeatable)")
+@click.option("--match", "-m", "pattern", help="Only inject keys matching a glob (e.g. 'DB_*')")
+@click.option("--prefix", default="VAULTY_SECRET_", help="Environment variable prefix")
+@click.option(
+    "--concurrency",
+    "-c",
+    default=10,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of secrets fetched in parallel",
+)
+@click.option("--token", "-t", help="API token (overrides stored credentials)")
+@click.option("--base-url", "-u", help="Base URL (overrides stored/configured URL)")
+@click.argument("command", nargs=-1, required=True, type=click.UNPROCESSED)
+def run_command(project, keys, pattern, prefix, concurrency, token, base_url, command):
+    """Run a command with secrets injected into its environment.
+
+    Secrets are fetched concurrently and the command is exec'd directly (no
+    shell), replacing the vaulty process. Nothing is run if any secret fails
+    to load.
+
+    Examples:
+        vaulty run -- ./deploy.sh
+        vaulty run --prefix "" --match "DB_*" -- python app.py
+        vaulty run -k API_KEY -k DB_PASSWORD --project my-project -- env
+    """
+    try:
+        client = get_client(token=token, base_url=base_url)
+        project = resolve_project(project, client, required=True)
+        values, errors = run_async(_collect_secrets(client, project, keys, pattern, concurrency))
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(2)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    if errors:
+        for key, error in errors.items():
+            click.echo(f"Error: Failed to fetch secret '{key}': {error}", err=True)
+        sys.exit(1)
+
+    env = dict(os.environ)
+    env.update({f"{prefix}{key}": value for key, value in values.items()})
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        os.execvpe(command[0], list(command), env)
+    except OSError as e:
+        click.echo(f"Error: Cannot run '{command[0]}': {e.strerror or e}", err=True)
+        sys.exit(127 if isinstance(e, FileNotFoundError) else 126)
+
+
+async def _collect_secrets(client, project, keys, pattern, concurrency):
+    """Fetch the selected secret values, then close the client before exec.
+
+    Returns:
+        Tuple of (dict of key -> value, dict of key -> error)
+    """
+    try:
+        values, errors = await fetch_secret_values(client, project, keys, pattern, concurrency)
+    finally:
+        # The process is replaced by exec; close connections first
+        await client.close()
+    return {key: response.value for key, response in values.items()}, errors
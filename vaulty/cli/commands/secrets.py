@@ -8,12 +8,20 @@ from ... import (
     VaultyAPIError,
     VaultyAuthenticationError,
     VaultyAuthorizationError,
+    VaultyBulkError,
     VaultyNotFoundError,
     VaultyRateLimitError,
     VaultyValidationError,
 )
+from ...cli.agent import AgentClient, AgentUnavailableError, invalidate_agent_cache
 from ...cli.output import OutputFormatter
-from ...cli.utils import detect_cicd, get_client, get_project_from_token_scope, run_async
+from ...cli.utils import (
+    detect_cicd,
+    fetch_secret_values,
+    get_client,
+    get_project_from_token_scope,
+    run_async,
+)
 
 
 @click.group()
@@ -22,60 +30,124 @@ def secrets_group():
 
 
 @secrets_group.command("get")
-@click.argument("key")
+@click.argument("keys", nargs=-1)
 @click.option(
     "--project", "-p", help="Project name (required for full scope, optional for project-scoped)"
 )
-@click.option("--format", "-f", default=None, type=click.Choice(["json", "yaml", "plain"]))
+@click.option("--match", "-m", "pattern", help="Also get keys matching a glob (e.g. 'DB_*')")
+@click.option("--format", "-f", default=None, type=click.Choice(["json", "yaml", "plain", "env"]))
+@click.option("--prefix", default="VAULTY_SECRET_", help="Variable prefix for --format env")
+@click.option(
+    "--concurrency",
+    "-c",
+    default=10,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of secrets fetched in parallel",
+)
 @click.option("--token", "-t", help="API token (overrides stored credentials)")
 @click.option("--base-url", "-u", help="Base URL (overrides stored/configured URL)")
-def get_secret(key, project, format, token, base_url):
-    """Get secret value (decrypted).
+def get_secret(keys, project, pattern, format, prefix, concurrency, token, base_url):
+    """Get secret values (decrypted).
+
+    Several keys (and/or a --match glob) are fetched concurrently in one
+    invocation. Defaults to plain text output for CI/CD.
 
-    Defaults to plain text output for CI/CD.
+    Examples:
+        vaulty secrets get API_KEY
+        vaulty secrets get DB_HOST DB_PASSWORD --format env
+        vaulty secrets get --match "DB_*" --format json
     """
+    if not keys and not pattern:
+        click.echo("Error: Provide at least one KEY or --match", err=True)
+        sys.exit(2)
+
     # Default format based on CI/CD detection
     if format is None:
         format = "plain" if detect_cicd() else "json"
 
-    try:
-        client = get_client(token=token, base_url=base_url)
+    # A single key keeps the single-secret output (full response, plain value)
+    single = len(keys) == 1 and not pattern
+    key = keys[0] if single else ""
 
-        # Determine project name
-        # For project-scoped tokens, project is optional (auto-inferred)
-        # For full scope tokens, project is required
+    try:
+        # Try to get project from config or environment
         if not project:
-            # Try to get from config or environment
             import os
 
             project = os.getenv("VAULTY_PROJECT")
+
+        # Use the local agent when one is running (see 'vaulty agent')
+        values = None
+        errors = {}
+        agent = AgentClient.from_env() if not token and not base_url and not pattern else None
+        if agent is not None:
+            try:
+                if not project:
+                    project = agent.project()
+                    if not project:
+                        _project_required()
+                if single:
+                    values = {key: agent.get_value(project, key)}
+                else:
+                    try:
+                        values = agent.get_many(project, list(keys), concurrency=concurrency)
+                    except VaultyBulkError as e:
+                        values, errors = e.results, e.errors
+            except AgentUnavailableError:
+                values = None  # No agent listening (or other credentials): fetch directly
+
+        if values is None:
+            client = get_client(token=token, base_url=base_url)
+
+            # Determine project name
+            # For project-scoped tokens, project is optional (auto-inferred)
+            # For full scope tokens, project is required
             if not project:
                 # Try to infer from token scope (for project-scoped tokens)
                 project_info = run_async(get_project_from_token_scope(client))
                 if not project_info:
-                    click.echo(
-                        "Error: --project is required for full-scope tokens. For project-scoped tokens, project is auto-detected.",
-                        err=True,
-                    )
-                    sys.exit(2)
+                    _project_required()
                 # Use project name if available, otherwise use project ID
                 project = project_info.get("name") or project_info.get("id")
 
-        value_response = run_async(client.secrets.get_value(project_name=project, key=key))
+            if single:
+                value = run_async(client.secrets.get_value(project_name=project, key=key))
+                values = {key: value.dict()}
+            else:
+                responses, errors = run_async(
+                    fetch_secret_values(client, project, keys, pattern, concurrency)
+                )
+                values = {name: response.dict() for name, response in responses.items()}
 
         formatter = OutputFormatter(format=format)
-        click.echo(formatter.format_output(value_response.dict()))
+        if single:
+            if format == "env":
+                click.echo(formatter.format_env(values[key], prefix=prefix))
+            else:
+                click.echo(formatter.format_output(values[key]))
+        else:
+            click.echo(_format_secret_values(formatter, values, prefix))
+            if errors:
+                for name, error in errors.items():
+                    click.echo(f"Error: Failed to fetch secret '{name}': {error}", err=True)
+                sys.exit(1)
     except VaultyNotFoundError:
-        click.echo(f"Error: Secret '{key}' not found in project '{project}'", err=True)
+        # Per-key failures are reported above, so in multi-key mode the project is missing
+        if single:
+            click.echo(f"Error: Secret '{key}' not found in project '{project}'", err=True)
+        else:
+            click.echo(f"Error: Project '{project}' not found", err=True)
         sys.exit(1)
     except VaultyAuthenticationError:
         click.echo("Error: Authentication failed. Please run 'vaulty login'", err=True)
         sys.exit(1)
     except VaultyAuthorizationError:
-        click.echo(
-            f"Error: Insufficient permissions to access secret '{key}' in project '{project}'",
-            err=True,
-        )
+        if single:
+            message = f"access secret '{key}' in project '{project}'"
+        else:
+            message = f"access secrets in project '{project}'"
+        click.echo(f"Error: Insufficient permissions to {message}", err=True)
         sys.exit(1)
     except VaultyValidationError as e:
         click.echo(f"Error: Validation failed - {e.detail or str(e)}", err=True)
@@ -91,6 +163,24 @@ def get_secret(key, project, format, token, base_url):
         sys.exit(1)
 
 
+def _format_secret_values(formatter: OutputFormatter, values: dict, prefix: str) -> str:
+    """Format several secret values: a key -> value mapping, one value per line or exports."""
+    if formatter.format == "env":
+        items = [{"key": name, "value": value["value"]} for name, value in values.items()]
+        return formatter.format_env({"items": items}, prefix=prefix)
+    if formatter.format == "plain":
+        return "\n".join(str(value["value"]) for value in values.values())
+    return formatter.format_output({name: value["value"] for name, value in values.items()})
+
+
+def _project_required():
+    click.echo(
+        "Error: --project is required for full-scope tokens. For project-scoped tokens, project is auto-detected.",
+        err=True,
+    )
+    sys.exit(2)
+
+
 @secrets_group.command("list")
 @click.option(
     "--project", "-p", help="Project name (required for full scope, optional for project-scoped)"
@@ -133,21 +223,11 @@ def list_secrets(project, page, page_size, format, token, base_url):
                 project = project_info.get("name") or project_info.get("id")
 
         result = run_async(
-            client.secrets.list(project_name=project, page=page, page_size=page_size)
+            client.secrets.list(project_name=project, page=page, page_size=page_size, raw=True)
         )
 
         formatter = OutputFormatter(format=format)
-        output = formatter.format_output(
-            {
-                "items": [item.dict() for item in result.items],
-                "total": result.total,
-                "page": result.page,
-                "page_size": result.page_size,
-                "total_pages": result.total_pages,
-                "has_next": result.has_next,
-                "has_previous": result.has_previous,
-            }
-        )
+        output = formatter.format_output(result.to_dict())
         click.echo(output)
     except VaultyAuthenticationError:
         click.echo("Error: Authentication failed. Please run 'vaulty login'", err=True)
@@ -214,6 +294,7 @@ def create_secret(key, value, project, prompt, stdin, file, format, token, base_
 
         client = get_client(token=token, base_url=base_url)
         secret = run_async(client.secrets.create(project_name=project, key=key, value=value))
+        invalidate_agent_cache(project, key)
 
         formatter = OutputFormatter(format=format)
         click.echo(formatter.format_output(secret.dict()))
@@ -280,6 +361,7 @@ def update_secret(key, value, project, prompt, stdin, file, format, token, base_
 
         client = get_client(token=token, base_url=base_url)
         secret = run_async(client.secrets.update(project_name=project, key=key, value=value))
+        invalidate_agent_cache(project, key)
 
         formatter = OutputFormatter(format=format)
         click.echo(formatter.format_output(secret.dict()))
@@ -327,6 +409,7 @@ def delete_secret(key, project, token, base_url):
 
         client = get_client(token=token, base_url=base_url)
         run_async(client.secrets.delete(project_name=project, key=key))
+        invalidate_agent_cache(project, key)
         click.echo("Secret deleted successfully!")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -336,9 +419,17 @@ def delete_secret(key, project, token, base_url):
 @secrets_group.command("export")
 @click.option("--project", "-p", help="Project name")
 @click.option("--prefix", default="VAULTY_SECRET_", help="Prefix for environment variable names")
+@click.option(
+    "--concurrency",
+    "-c",
+    default=10,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of secret values fetched in parallel",
+)
 @click.option("--token", "-t", help="API token (overrides stored credentials)")
 @click.option("--base-url", "-u", help="Base URL (overrides stored/configured URL)")
-def export_secrets(project, prefix, token, base_url):
+def export_secrets(project, prefix, concurrency, token, base_url):
     """Export all secrets as environment variables (CI/CD friendly)."""
     try:
         client = get_client(token=token, base_url=base_url)
@@ -360,40 +451,37 @@ def export_secrets(project, prefix, token, base_url):
                 # Use project name if available, otherwise use project ID
                 project = project_info.get("name") or project_info.get("id")
 
-        # Fetch all secrets with pagination (API max page_size is 100)
-        all_secrets = []
-        page = 1
-        page_size = 100
-
-        while True:
-            result = run_async(
-                client.secrets.list(project_name=project, page=page, page_size=page_size)
-            )
-            all_secrets.extend(result.items)
-            if not result.has_next:
-                break
-            page += 1
-
-        result.items = all_secrets
-
-        # Get all secrets with values
-        secrets_with_values = []
-        for secret in result.items:
-            try:
-                value_response = run_async(
-                    client.secrets.get_value(project_name=project, key=secret.key)
-                )
-                secrets_with_values.append({"key": secret.key, "value": value_response.value})
-            except Exception:
-                pass
+        # List and fetch everything inside a single event loop
+        secrets_with_values, errors = run_async(_export_secret_values(client, project, concurrency))
 
         formatter = OutputFormatter(format="env")
         click.echo(formatter.format_env({"items": secrets_with_values}, prefix=prefix))
+
+        if errors:
+            for key, error in errors.items():
+                click.echo(f"Error: Failed to fetch secret '{key}': {error}", err=True)
+            sys.exit(1)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
 
+async def _export_secret_values(client, project, concurrency):
+    """Fetch all secret values of a project with bounded concurrency.
+
+    Args:
+        client: VaultyClient instance
+        project: Project name
+        concurrency: Maximum number of value requests in flight
+
+    Returns:
+        Tuple of (list of {"key", "value"} dicts in listing order, dict of key -> error)
+    """
+    values, errors = await fetch_secret_values(client, project, concurrency=concurrency)
+    secrets_with_values = [{"key": key, "value": value.value} for key, value in values.items()]
+    return secrets_with_values, errors
+
+
 @secrets_group.command("exists")
 @click.argument("key")
 @click.option("--project", "-p", help="Project name")
@@ -423,19 +511,5 @@ def exists_secret(key, project, token, base_url):
         sys.exit(1)
 
 
-# Add get_secret as standalone command (for convenience)
-@click.command("get_secret")
-@click.argument("key")
-@click.option(
-    "--project", "-p", help="Project name (required for full scope, optional for project-scoped)"
-)
-@click.option("--format", "-f", default=None, type=click.Choice(["json", "yaml", "plain"]))
-@click.option("--token", "-t", help="API token (overrides stored credentials)")
-@click.option("--base-url", "-u", help="Base URL (overrides stored/configured URL)")
-def get_secret_command(key, project, format, token, base_url):
-    """Get secret value (decrypted). Alias for 'secrets get'."""
-    get_secret(key, project, format, token, base_url)
-
-
-# Register standalone command
-secrets_group.add_command(get_secret_command, name="get_secret")
+# Add get_secret as standalone command (alias for 'secrets get')
+secrets_group.add_command(get_secret, name="get_secret")
@@ -1,15 +1,93 @@
 """CLI configuration management."""
 
 import base64
+import hashlib
 import json
 import os
+import time
 from pathlib import Path
 from typing import Any
 
-import yaml
-from cryptography.fernet import Fernet
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+# yaml and cryptography are imported where used, keeping CLI startup fast
+
+# Derived credential keys, memoized per process (PBKDF2 is deliberately slow)
+_derived_keys: dict[str, bytes] = {}
+
+
+def _derive_key(machine_id: str) -> bytes:
+    """Derive the credentials key from a machine ID using PBKDF2-HMAC-SHA256."""
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"vaulty_cli_salt",  # Fixed salt for consistency
+        iterations=100000,
+        backend=default_backend(),
+    )
+    return base64.urlsafe_b64encode(kdf.derive(machine_id.encode()))
+
+
+def _runtime_key_file(machine_id: str) -> Path | None:
+    """Get the runtime-dir file caching the derived key, or None if unavailable.
+
+    Uses $XDG_RUNTIME_DIR (per-user, usually tmpfs, cleared on logout/reboot).
+    Disabled with VAULTY_KEY_CACHE=0.
+    """
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if not runtime_dir or os.getenv("VAULTY_KEY_CACHE", "1") == "0":
+        return None
+    digest = hashlib.sha256(machine_id.encode()).hexdigest()[:32]
+    return Path(runtime_dir) / "vaulty" / f"key-{digest}"
+
+
+def _read_runtime_key(key_file: Path) -> bytes | None:
+    """Read a cached key, ignoring files not private to the current user."""
+    try:
+        stat = key_file.stat()
+        if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+            return None
+        key = key_file.read_bytes().strip()
+        # Fernet keys are 32 bytes, urlsafe base64 encoded
+        return key if len(base64.urlsafe_b64decode(key)) == 32 else None
+    except Exception:
+        return None
+
+
+def _write_runtime_key(key_file: Path, key: bytes):
+    """Write a cached key with 0600 permissions (best effort)."""
+    try:
+        key_file.parent.mkdir(mode=0o700, exist_ok=True)
+        fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+    except OSError:
+        # Cache is an optimization only
+        pass
+
+
+def _get_machine_key(machine_id: str) -> bytes:
+    """Get the credentials key for a machine ID without re-running the KDF.
+
+    Lookup order: per-process memo, runtime-dir key file, PBKDF2 derivation.
+    """
+    key = _derived_keys.get(machine_id)
+    if key is not None:
+        return key
+
+    key_file = _runtime_key_file(machine_id)
+    if key_file is not None:
+        key = _read_runtime_key(key_file)
+
+    if key is None:
+        key = _derive_key(machine_id)
+        if key_file is not None:
+            _write_runtime_key(key_file, key)
+
+    _derived_keys[machine_id] = key
+    return key
 
 
 class CLIConfig:
@@ -19,6 +97,7 @@ class CLIConfig:
         self.config_dir = Path.home() / ".vaulty"
         self.config_file = self.config_dir / "config.yaml"
         self.credentials_file = self.config_dir / "credentials.json"
+        self.scope_cache_file = self.config_dir / "scope_cache.json"
 
         # Ensure config directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -27,19 +106,7 @@ class CLIConfig:
         """Get encryption key for credentials (derived from machine ID)."""
         # Use machine-specific identifier (hostname + user)
         machine_id = f"{os.getenv('HOSTNAME', 'localhost')}-{os.getenv('USER', 'user')}"
-
-        # Derive key using PBKDF2 with SHA256 hash
-        from cryptography.hazmat.primitives import hashes
-
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b"vaulty_cli_salt",  # Fixed salt for consistency
-            iterations=100000,
-            backend=default_backend(),
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(machine_id.encode()))
-        return key
+        return _get_machine_key(machine_id)
 
     def load(self) -> dict[str, Any]:
         """Load configuration from file or environment."""
@@ -48,6 +115,8 @@ class CLIConfig:
         # Load from file
         if self.config_file.exists():
             try:
+                import yaml
+
                 with open(self.config_file) as f:
                     config = yaml.safe_load(f) or {}
             except Exception:
@@ -87,6 +156,8 @@ class CLIConfig:
             return None
 
         try:
+            from cryptography.fernet import Fernet
+
             key = self._get_encryption_key()
             fernet = Fernet(key)
 
@@ -126,6 +197,8 @@ class CLIConfig:
                 "Invalid token format. Token should start with 'vaulty_' or be a valid JWT."
             )
 
+        from cryptography.fernet import Fernet
+
         key = self._get_encryption_key()
         fernet = Fernet(key)
 
@@ -154,6 +227,8 @@ class CLIConfig:
         if not self._validate_token(token):
             raise ValueError("Invalid JWT token format.")
 
+        from cryptography.fernet import Fernet
+
         key = self._get_encryption_key()
         fernet = Fernet(key)
 
@@ -172,3 +247,87 @@ class CLIConfig:
         """Clear stored credentials."""
         if self.credentials_file.exists():
             self.credentials_file.unlink()
+        self.clear_scope_cache()
+
+    @staticmethod
+    def token_fingerprint(auth_header: str, base_url: str) -> str:
+        """Get a non-reversible fingerprint for credentials, used as a cache key.
+
+        Args:
+            auth_header: Authorization header (or raw token)
+            base_url: API base URL the token is used against
+
+        Returns:
+            Hex digest identifying the credentials
+        """
+        return hashlib.sha256(f"{base_url}\n{auth_header}".encode()).hexdigest()
+
+    def _scope_cache_ttl(self) -> float:
+        """Get token scope cache TTL in seconds (VAULTY_SCOPE_CACHE_TTL, default: 3600)."""
+        try:
+            return float(os.getenv("VAULTY_SCOPE_CACHE_TTL", "3600"))
+        except ValueError:
+            return 3600.0
+
+    def _load_scope_cache(self) -> dict[str, Any]:
+        """Load all token scope cache entries."""
+        if not self.scope_cache_file.exists():
+            return {}
+        try:
+            data = json.loads(self.scope_cache_file.read_text())
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def get_cached_scope(self, fingerprint: str) -> dict[str, Any] | None:
+        """Get the cached token scope resolution for credentials.
+
+        Args:
+            fingerprint: Credentials fingerprint from token_fingerprint()
+
+        Returns:
+            Dict with a 'project' key (project info dict, or None for full-scope
+            tokens) if a fresh entry exists, None otherwise
+        """
+        ttl = self._scope_cache_ttl()
+        if ttl <= 0:
+            return None
+
+        entry = self._load_scope_cache().get(fingerprint)
+        if not isinstance(entry, dict) or time.time() - entry.get("cached_at", 0) >= ttl:
+            return None
+        return {"project": entry.get("project")}
+
+    def save_cached_scope(self, fingerprint: str, project: dict[str, Any] | None):
+        """Cache the token scope resolution for credentials.
+
+        Expired entries are dropped on write. The file only holds fingerprints and
+        project IDs/names, never tokens.
+
+        Args:
+            fingerprint: Credentials fingerprint from token_fingerprint()
+            project: Project info dict, or None for full-scope tokens
+        """
+        ttl = self._scope_cache_ttl()
+        if ttl <= 0:
+            return
+
+        now = time.time()
+        entries = {
+            key: entry
+            for key, entry in self._load_scope_cache().items()
+            if isinstance(entry, dict) and now - entry.get("cached_at", 0) < ttl
+        }
+        entries[fingerprint] = {"project": project, "cached_at": now}
+
+        try:
+            self.scope_cache_file.write_text(json.dumps(entries))
+            self.scope_cache_file.chmod(0o600)
+        except OSError:
+            # Cache is an optimization only
+            pass
+
+    def clear_scope_cache(self):
+        """Clear cached token scope resolutions."""
+        if self.scope_cache_file.exists():
+            self.scope_cache_file.unlink()
@@ -1,29 +1,56 @@
 """CLI entry point."""
 
+import importlib
 import sys
 
 import click
 
 from .. import __version__
-from .commands import activities, auth, customers, health, projects, secrets, tokens
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are used.
+
+    Keeps startup fast: `vaulty get` doesn't pay for importing every command
+    module (and their dependencies) up front.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Command name -> "module.path:attribute"
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+            module = importlib.import_module(module_name, package=__package__)
+            return getattr(module, attribute)
+        return super().get_command(ctx, cmd_name)
+
+
+# Command groups, imported on first use
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "auth": ".commands.auth:auth_group",
+        "projects": ".commands.projects:projects_group",
+        "secrets": ".commands.secrets:secrets_group",
+        "tokens": ".commands.tokens:tokens_group",
+        "activities": ".commands.activities:activities_group",
+        "customers": ".commands.customers:customers_group",
+        "health": ".commands.health:health_group",
+        "agent": ".commands.agent:agent_command",
+        "run": ".commands.run:run_command",
+    },
+)
 @click.version_option(version=__version__)
 def cli():
     """Vaulty CLI - Manage secrets, projects, and tokens."""
 
 
-# Add command groups
-cli.add_command(auth.auth_group)
-cli.add_command(projects.projects_group)
-cli.add_command(secrets.secrets_group)
-cli.add_command(tokens.tokens_group)
-cli.add_command(activities.activities_group)
-cli.add_command(customers.customers_group)
-cli.add_command(health.health_group)
-
-
 # Convenience shortcuts for common operations
 @cli.command("login")
 @click.argument("token", required=False)
@@ -132,43 +159,79 @@ def logout_shortcut():
 
 # Convenience shortcuts for common operations
 @cli.command("get")
-@click.argument("key")
+@click.argument("keys", nargs=-1)
 @click.option(
     "--project", "-p", help="Project name (required for full scope, optional for project-scoped)"
 )
-@click.option("--format", "-f", default=None, type=click.Choice(["json", "yaml", "plain"]))
+@click.option("--match", "-m", "pattern", help="Also get keys matching a glob (e.g. 'DB_*')")
+@click.option("--format", "-f", default=None, type=click.Choice(["json", "yaml", "plain", "env"]))
+@click.option("--prefix", default="VAULTY_SECRET_", help="Variable prefix for --format env")
+@click.option(
+    "--concurrency", "-c", default=10, type=click.IntRange(min=1), help="Parallel fetches"
+)
 @click.option("--token", "-t", help="API token (overrides stored credentials)")
 @click.option("--base-url", "-u", help="Base URL (overrides stored/configured URL)")
-def get_shortcut(key, project, format, token, base_url):
-    """Get secret value (shortcut for 'secrets get').
+@click.pass_context
+def get_shortcut(ctx, keys, project, pattern, format, prefix, concurrency, token, base_url):
+    """Get secret values (shortcut for 'secrets get').
 
     Examples:
         vaulty get API_KEY
         vaulty get API_KEY --project my-project
+        vaulty get DB_HOST DB_PASSWORD --format env
+        vaulty get --match "DB_*"
     """
     from .commands.secrets import get_secret
 
-    get_secret(key, project, format, token, base_url)
+    ctx.invoke(
+        get_secret,
+        keys=keys,
+        project=project,
+        pattern=pattern,
+        format=format,
+        prefix=prefix,
+        concurrency=concurrency,
+        token=token,
+        base_url=base_url,
+    )
 
 
 @cli.command("g")
-@click.argument("key")
+@click.argument("keys", nargs=-1)
 @click.option(
     "--project", "-p", help="Project name (required for full scope, optional for project-scoped)"
 )
-@click.option("--format", "-f", default=None, type=click.Choice(["json", "yaml", "plain"]))
+@click.option("--match", "-m", "pattern", help="Also get keys matching a glob (e.g. 'DB_*')")
+@click.option("--format", "-f", default=None, type=click.Choice(["json", "yaml", "plain", "env"]))
+@click.option("--prefix", default="VAULTY_SECRET_", help="Variable prefix for --format env")
+@click.option(
+    "--concurrency", "-c", default=10, type=click.IntRange(min=1), help="Parallel fetches"
+)
 @click.option("--token", "-t", help="API token (overrides stored credentials)")
 @click.option("--base-url", "-u", help="Base URL (overrides stored/configured URL)")
-def get_ultra_short(key, project, format, token, base_url):
-    """Get secret value (ultra-short alias: 'g').
+@click.pass_context
+def get_ultra_short(ctx, keys, project, pattern, format, prefix, concurrency, token, base_url):
+    """Get secret values (ultra-short alias: 'g').
 
     Examples:
         vaulty g API_KEY
         vaulty g API_KEY --project my-project
+        vaulty g DB_HOST DB_PASSWORD --format env
+        vaulty g --match "DB_*"
     """
     from .commands.secrets import get_secret
 
-    get_secret(key, project, format, token, base_url)
+    ctx.invoke(
+        get_secret,
+        keys=keys,
+        project=project,
+        pattern=pattern,
+        format=format,
+        prefix=prefix,
+        concurrency=concurrency,
+        token=token,
+        base_url=base_url,
+    )
 
 
 @cli.command("set")
@@ -193,6 +256,7 @@ def set_shortcut(key, value, project, prompt, stdin, file, format, token, base_u
     """
     import sys
 
+    from .agent import invalidate_agent_cache
     from .output import OutputFormatter
     from .utils import get_client, get_project_from_token_scope, run_async
 
@@ -230,6 +294,7 @@ def set_shortcut(key, value, project, prompt, stdin, file, format, token, base_u
 
         client = get_client(token=token, base_url=base_url)
         secret = run_async(client.secrets.create(project_name=project, key=key, value=value))
+        invalidate_agent_cache(project, key)
 
         formatter = OutputFormatter(format=format)
         click.echo(formatter.format_output(secret.dict()))
@@ -254,6 +319,7 @@ def delete_shortcut(key, project, token, base_url):
     """
     import sys
 
+    from .agent import invalidate_agent_cache
     from .utils import get_client, get_project_from_token_scope, run_async
 
     try:
@@ -276,6 +342,7 @@ def delete_shortcut(key, project, token, base_url):
 
         client = get_client(token=token, base_url=base_url)
         run_async(client.secrets.delete(project_name=project, key=key))
+        invalidate_agent_cache(project, key)
         click.echo("Secret deleted successfully!")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -329,21 +396,11 @@ def list_shortcut(project, page, page_size, format, token, base_url):
                 project = project_info.get("name") or project_info.get("id")
 
         result = run_async(
-            client.secrets.list(project_name=project, page=page, page_size=page_size)
+            client.secrets.list(project_name=project, page=page, page_size=page_size, raw=True)
         )
 
         formatter = OutputFormatter(format=format)
-        output = formatter.format_output(
-            {
-                "items": [item.dict() for item in result.items],
-                "total": result.total,
-                "page": result.page,
-                "page_size": result.page_size,
-                "total_pages": result.total_pages,
-                "has_next": result.has_next,
-                "has_previous": result.has_previous,
-            }
-        )
+        output = formatter.format_output(result.to_dict())
         click.echo(output)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -371,6 +428,7 @@ def update_shortcut(key, value, project, prompt, stdin, file, format, token, bas
     """
     import sys
 
+    from .agent import invalidate_agent_cache
     from .output import OutputFormatter
     from .utils import get_client, get_project_from_token_scope, run_async
 
@@ -408,6 +466,7 @@ def update_shortcut(key, value, project, prompt, stdin, file, format, token, bas
 
         client = get_client(token=token, base_url=base_url)
         secret = run_async(client.secrets.update(project_name=project, key=key, value=value))
+        invalidate_agent_cache(project, key)
 
         formatter = OutputFormatter(format=format)
         click.echo(formatter.format_output(secret.dict()))
@@ -1,11 +1,13 @@
 """Output formatting for CLI."""
 
 import json
-from typing import Any
+import shlex
+from typing import TYPE_CHECKING, Any
 
-import yaml
-from rich.console import Console
-from rich.table import Table
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# yaml and rich are imported only for the formats that need them (CLI startup time)
 
 
 class OutputFormatter:
@@ -13,7 +15,16 @@ class OutputFormatter:
 
     def __init__(self, format: str = "plain"):
         self.format = format
-        self.console = Console()
+        self._console: Console | None = None
+
+    @property
+    def console(self) -> "Console":
+        """Rich console (created on first use, then reused)."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
 
     def format_output(self, data: Any) -> str:
         """Format output based on format type.
@@ -27,6 +38,8 @@ class OutputFormatter:
         if self.format == "json":
             return json.dumps(data, indent=2, default=str)
         if self.format == "yaml":
+            import yaml
+
             return yaml.dump(data, default_flow_style=False, default_style=None)
         if self.format == "table":
             return self._format_table(data)
@@ -62,6 +75,8 @@ class OutputFormatter:
 
             # Determine columns from first item
             if isinstance(items[0], dict):
+                from rich.table import Table
+
                 columns = list(items[0].keys())
                 table = Table()
 
@@ -71,9 +86,8 @@ class OutputFormatter:
                 for item in items:
                     table.add_row(*[str(item.get(col, "")) for col in columns])
 
-                console = Console()
-                with console.capture() as capture:
-                    console.print(table)
+                with self.console.capture() as capture:
+                    self.console.print(table)
                 return capture.get()
 
         return self._format_plain(data)
@@ -86,7 +100,8 @@ class OutputFormatter:
             prefix: Prefix for environment variable names
 
         Returns:
-            Environment variable export statements
+            Environment variable export statements, with values shell-quoted so the
+            output is safe to `eval`
         """
         exports = []
 
@@ -97,12 +112,12 @@ class OutputFormatter:
                     key = item["key"]
                     value = item["value"]
                     var_name = f"{prefix}{key}"
-                    exports.append(f"export {var_name}={value}")
+                    exports.append(f"export {var_name}={shlex.quote(str(value))}")
         elif isinstance(data, dict) and "key" in data and "value" in data:
             # Single secret
             key = data["key"]
             value = data["value"]
             var_name = f"{prefix}{key}"
-            exports.append(f"export {var_name}={value}")
+            exports.append(f"export {var_name}={shlex.quote(str(value))}")
 
         return "\n".join(exports)
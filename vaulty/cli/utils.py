@@ -1,24 +1,45 @@
 """CLI utilities."""
 
 import asyncio
+import fnmatch
 import os
 import sys
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
 
 import click
 
-from .. import VaultyClient
 from .config import CLIConfig
 
+if TYPE_CHECKING:
+    from .. import VaultyClient
+
+
+def normalize_base_url(base_url: str) -> str:
+    """Normalize a base URL: no trailing slash and no trailing /api.
+
+    Paths include /api/v1/... and health is at the root (/health), so the base
+    URL should be the root (http://localhost:8000), not http://localhost:8000/api.
+    """
+    base_url = base_url.rstrip("/")
+    if base_url.endswith("/api"):
+        base_url = base_url[:-4]
+    return base_url
+
 
 def get_client(
-    token: str | None = None, base_url: str | None = None, non_interactive: bool = True
-) -> VaultyClient:
+    token: str | None = None,
+    base_url: str | None = None,
+    non_interactive: bool = True,
+    **client_options,
+) -> "VaultyClient":
     """Get Vaulty client from config or parameters.
 
     Args:
         token: API token (overrides stored credentials)
         base_url: Base URL (overrides stored/configured URL)
         non_interactive: Non-interactive mode (default: True)
+        **client_options: Extra VaultyClient options (e.g. secret_cache_ttl)
 
     Returns:
         VaultyClient instance
@@ -36,13 +57,7 @@ def get_client(
     else:
         api_base_url = "https://api.vaulty.com"
 
-    # Normalize base URL - remove trailing /api if present (paths include /api/v1/...)
-    # Backend structure: Health at root (/health), API under /api/v1/...
-    # So base_url should be at root (http://localhost:8000), not http://localhost:8000/api
-    if api_base_url.endswith("/api"):
-        api_base_url = api_base_url[:-4]
-    elif api_base_url.endswith("/api/"):
-        api_base_url = api_base_url[:-5]
+    api_base_url = normalize_base_url(api_base_url)
 
     # Determine token (priority: parameter > env var > stored)
     api_token = None
@@ -66,10 +81,16 @@ def get_client(
             )
         raise ValueError("No authentication token found. Run 'vaulty login' first.")
 
-    return VaultyClient(base_url=api_base_url, api_token=api_token, jwt_token=jwt_token)
+    from .. import VaultyClient
+
+    return VaultyClient(
+        base_url=api_base_url, api_token=api_token, jwt_token=jwt_token, **client_options
+    )
 
 
-async def get_project_from_token_scope(client: VaultyClient) -> dict[str, str] | None:
+async def get_project_from_token_scope(
+    client: "VaultyClient",
+) -> dict[str, str | None] | None:
     """Extract project ID and name from token scope (for project-scoped tokens).
 
     For project-scoped tokens, extracts project ID from token scope and attempts
@@ -78,6 +99,11 @@ async def get_project_from_token_scope(client: VaultyClient) -> dict[str, str] |
 
     For full-scope tokens, returns None (project must be specified explicitly).
 
+    The result is shared with the client's `project_scope` cache, so the lookup
+    runs at most once per client and credentials. It is also cached on disk
+    (keyed by a token fingerprint, TTL from VAULTY_SCOPE_CACHE_TTL) so repeated
+    CLI invocations skip the request entirely.
+
     Args:
         client: VaultyClient instance
 
@@ -85,13 +111,36 @@ async def get_project_from_token_scope(client: VaultyClient) -> dict[str, str] |
         Dict with 'id' and 'name' keys if token is project-scoped, None otherwise.
         'name' may be None if we can't fetch it, but 'id' will always be present.
     """
+    from ..cache import ProjectScopeCache
+
+    project_scope = getattr(client, "project_scope", None)
+    if not isinstance(project_scope, ProjectScopeCache):
+        project_scope = None
+    else:
+        cached = project_scope.get(client.http_client.auth_header)
+        if cached:
+            return cached
+
+    config = None
+    fingerprint = None
+    auth_header = getattr(getattr(client, "http_client", None), "auth_header", None)
+    if isinstance(auth_header, str):
+        config = CLIConfig()
+        fingerprint = CLIConfig.token_fingerprint(auth_header, client.http_client.base_url)
+        cached_scope = config.get_cached_scope(fingerprint)
+        if cached_scope is not None:
+            project_info: dict[str, str | None] | None = cached_scope["project"]
+            if project_info and project_scope is not None:
+                project_scope.set(auth_header, project_info)
+            return project_info
+
     try:
         # Try to get project from token scope by listing tokens
         tokens_result = await client.tokens.list(page=1, page_size=1)
 
         if tokens_result.items:
             token = tokens_result.items[0]
-            scope = token.scope
+            scope = token["scope"] if isinstance(token, dict) else token.scope
 
             # Extract project ID from scope (format: project:p-xxxxx:read/write)
             if scope.startswith("project:"):
@@ -104,17 +153,65 @@ async def get_project_from_token_scope(client: VaultyClient) -> dict[str, str] |
                     # the token's project_id, it will fetch the project by ID internally
                     # So we can use the project ID as the project name in API calls
                     # This maintains the standard approach of using project_name parameter
-                    return {
+                    project_info = {
                         "id": project_id,
                         "name": project_id,  # Use ID as name - server's secrets route accepts it
                     }
-
+                    if project_scope is not None:
+                        project_scope.set(client.http_client.auth_header, project_info)
+                    if config is not None and fingerprint is not None:
+                        config.save_cached_scope(fingerprint, project_info)
+                    return project_info
+
+        # Full-scope token: remember that there is no implicit project
+        if config is not None and fingerprint is not None:
+            config.save_cached_scope(fingerprint, None)
         return None
     except Exception:
         # If tokens.list fails, return None
         return None
 
 
+async def fetch_secret_values(
+    client: "VaultyClient",
+    project: str,
+    keys: Iterable[str] = (),
+    pattern: str | None = None,
+    concurrency: int = 10,
+) -> tuple[dict, dict[str, Exception]]:
+    """Fetch the values of selected secrets concurrently.
+
+    Explicit keys are fetched without listing the project. With a glob `pattern`
+    the listed keys matching it are added; with neither, every secret is fetched.
+
+    Args:
+        client: VaultyClient instance
+        project: Project name
+        keys: Explicitly requested keys
+        pattern: Optional glob (e.g. 'DB_*') selecting listed keys
+        concurrency: Maximum number of value requests in flight
+
+    Returns:
+        Tuple of (dict of key -> SecretValueResponse in selection order,
+        dict of key -> error for keys that could not be fetched)
+    """
+    from .. import VaultyBulkError
+
+    selected = list(dict.fromkeys(keys))
+    if pattern or not selected:
+        async for secret in client.secrets.iter_all(project_name=project):
+            key = secret["key"] if isinstance(secret, dict) else secret.key
+            if pattern is None or fnmatch.fnmatchcase(key, pattern):
+                selected.append(key)
+
+    try:
+        values = await client.secrets.get_many(project, selected, concurrency=concurrency)
+        errors = {}
+    except VaultyBulkError as e:
+        values, errors = e.results, e.errors
+    return {key: values[key] for key in selected if key in values}, errors
+
+
 def run_async(coro):
     """Run async coroutine in sync context."""
     try:
@@ -140,7 +237,7 @@ def detect_cicd() -> bool:
 
 
 def resolve_project(
-    project: str | None, client: VaultyClient, required: bool = False
+    project: str | None, client: "VaultyClient", required: bool = False
 ) -> str | None:
     """Resolve project name from various sources.
 
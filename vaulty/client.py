@@ -3,7 +3,13 @@
 import os
 
 from .auth import AuthHandler
+from .cache import ProjectScopeCache, SecretCache
+from .circuit import CircuitBreakerRegistry
+from .concurrency import AdaptiveConcurrencyLimiter
+from .hedging import HedgePolicy
 from .http import HTTPClient
+from .models import CustomerSettingsResponse
+from .ratelimit import TokenBucket
 from .resources import (
     ActivityResource,
     CustomerResource,
@@ -12,7 +18,7 @@ from .resources import (
     SecretResource,
     TokenResource,
 )
-from .retry import RetryConfig
+from .retry import RetryBudget, RetryConfig
 
 
 class VaultyClient:
@@ -54,6 +60,33 @@ class VaultyClient:
         retry_backoff_factor: float = 2.0,
         rate_limit_retry: bool = True,
         api_version: str = "v1",
+        coalesce_requests: bool = True,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        secret_cache_ttl: float | None = None,
+        secret_cache_max_entries: int = 1024,
+        secret_cache_negative_ttl: float | None = 30.0,
+        secret_cache_stale_while_revalidate: float = 0.0,
+        secret_cache_stale_if_error: float = 0.0,
+        rate_limit_per_minute: float | None = None,
+        rate_limit_burst: float | None = None,
+        rate_limit_from_headers: bool = False,
+        rate_limiter: TokenBucket | None = None,
+        adaptive_concurrency: bool = False,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        request_deadline: float | None = None,
+        retry_budget_ratio: float | None = 0.2,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: bool = False,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        hedge_requests: bool = False,
+        hedge_policy: HedgePolicy | None = None,
     ):
         """Initialize Vaulty client.
 
@@ -69,6 +102,61 @@ class VaultyClient:
             retry_backoff_factor: Exponential backoff multiplier (default: 2.0)
             rate_limit_retry: Enable automatic retry on rate limit errors (default: True)
             api_version: API version string (default: "v1")
+            coalesce_requests: Share one in-flight request between identical concurrent
+                GET calls (default: True)
+            max_connections: Maximum number of pooled connections, None for no limit
+                (default: 100)
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+                (default: 20)
+            keepalive_expiry: Seconds an idle keep-alive connection is kept open
+                (default: 5.0)
+            http2: Enable HTTP/2 multiplexing. Requires the `http2` extra
+                (`pip install vaulty-client[http2]`) (default: False)
+            connect_timeout: Timeout for establishing a connection (default: timeout)
+            read_timeout: Timeout for reading a response chunk (default: timeout)
+            write_timeout: Timeout for sending a request chunk (default: timeout)
+            pool_timeout: Timeout for acquiring a pooled connection (default: timeout)
+            secret_cache_ttl: Enable the in-process secret value cache with this TTL
+                in seconds (default: None, cache disabled)
+            secret_cache_max_entries: Maximum number of cached secret values (default: 1024)
+            secret_cache_negative_ttl: TTL in seconds for cached "not found" results.
+                None or 0 disables negative caching (default: 30.0)
+            secret_cache_stale_while_revalidate: Seconds after expiry during which a
+                cached value is served immediately and refreshed in the background
+                (default: 0.0)
+            secret_cache_stale_if_error: Seconds after expiry during which a cached
+                value is served when the API is unavailable (default: 0.0)
+            rate_limit_per_minute: Pace requests client-side to this many per minute,
+                shared by all resources (default: None, no client-side limit)
+            rate_limit_burst: Maximum burst for the client-side rate limit
+                (default: one second worth of requests)
+            rate_limit_from_headers: Enable or retune the client-side rate limit from
+                X-RateLimit-* response headers (default: False)
+            rate_limiter: TokenBucket to use instead of rate_limit_per_minute, e.g. to
+                share one budget between several clients
+            adaptive_concurrency: Cap requests in flight with an AIMD limiter that grows
+                while latency stays flat and shrinks on 429/5xx/timeouts, up to
+                max_connections (default: False)
+            concurrency_limiter: AdaptiveConcurrencyLimiter to use instead of the
+                default one created by adaptive_concurrency
+            request_deadline: Seconds a single call may take in total, retries and
+                backoff sleeps included (default: None, no deadline)
+            retry_budget_ratio: Cap retries across the client at this fraction of
+                recent calls (at least 10 per 10 seconds). None disables the budget
+                (default: 0.2)
+            retry_budget: RetryBudget to use instead of retry_budget_ratio, e.g. to
+                share one budget between several clients
+            circuit_breaker: Fail fast with VaultyCircuitOpenError on routes that keep
+                failing (5 consecutive 5xx/timeouts/connection errors), probing again
+                after 30 seconds. With secret_cache_stale_if_error, cached values are
+                served meanwhile (default: False)
+            circuit_breakers: CircuitBreakerRegistry to use instead of the default one
+                created by circuit_breaker, e.g. with other thresholds
+            hedge_requests: Send a second copy of GETs that take longer than the p95
+                of recent GET latencies and use whichever answers first. Hedges are
+                taken from the retry budget (default: False)
+            hedge_policy: HedgePolicy to use instead of the default one created by
+                hedge_requests, e.g. with another percentile
 
         Note:
             If both api_token and jwt_token are provided, jwt_token takes precedence.
@@ -77,6 +165,24 @@ class VaultyClient:
         Raises:
             ValueError: If invalid configuration is provided
         """
+        if rate_limiter is None and rate_limit_per_minute is not None:
+            rate_limiter = TokenBucket.per_minute(rate_limit_per_minute, rate_limit_burst)
+
+        if concurrency_limiter is None and adaptive_concurrency:
+            max_limit = max_connections or 100
+            concurrency_limiter = AdaptiveConcurrencyLimiter(
+                initial_limit=min(10, max_limit), max_limit=max_limit
+            )
+
+        if circuit_breakers is None and circuit_breaker:
+            circuit_breakers = CircuitBreakerRegistry()
+
+        if retry_budget is None and retry_budget_ratio is not None:
+            retry_budget = RetryBudget(ratio=retry_budget_ratio)
+
+        if hedge_policy is None and hedge_requests:
+            hedge_policy = HedgePolicy(budget=retry_budget)
+
         # Create HTTP client
         self.http_client = HTTPClient(
             base_url=base_url,
@@ -84,6 +190,20 @@ class VaultyClient:
             jwt_token=jwt_token,
             timeout=timeout,
             api_version=api_version,
+            coalesce_requests=coalesce_requests,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            pool_timeout=pool_timeout,
+            rate_limiter=rate_limiter,
+            rate_limit_from_headers=rate_limit_from_headers,
+            concurrency_limiter=concurrency_limiter,
+            circuit_breakers=circuit_breakers,
+            hedge_policy=hedge_policy,
         )
 
         # Create auth handler
@@ -91,13 +211,33 @@ class VaultyClient:
 
         # Create retry config
         self.retry_config = RetryConfig(
-            max_retries=max_retries, backoff_factor=retry_backoff_factor
+            max_retries=max_retries,
+            backoff_factor=retry_backoff_factor,
+            deadline=request_deadline,
+            budget=retry_budget,
         )
 
+        # Project resolved for project-scoped tokens (shared with the CLI)
+        self.project_scope = ProjectScopeCache()
+
         # Create resource clients
         self.customers = CustomerResource(self.http_client, self.retry_config)
         self.projects = ProjectResource(self.http_client, self.retry_config)
-        self.secrets = SecretResource(self.http_client, self.retry_config)
+        secret_cache = None
+        if secret_cache_ttl is not None:
+            secret_cache = SecretCache(
+                max_entries=secret_cache_max_entries,
+                ttl=secret_cache_ttl,
+                negative_ttl=secret_cache_negative_ttl,
+                stale_while_revalidate=secret_cache_stale_while_revalidate,
+                stale_if_error=secret_cache_stale_if_error,
+            )
+        self.secrets = SecretResource(
+            self.http_client,
+            self.retry_config,
+            cache=secret_cache,
+            project_scope=self.project_scope,
+        )
         self.tokens = TokenResource(self.http_client, self.retry_config)
         self.activities = ActivityResource(self.http_client, self.retry_config)
         self.health = HealthResource(self.http_client, self.retry_config)
@@ -196,6 +336,34 @@ class VaultyClient:
             return cls(base_url=base_url, jwt_token=jwt_token)
         raise ValueError("VAULTY_API_TOKEN or VAULTY_JWT_TOKEN environment variable required")
 
+    async def apply_rate_limit_settings(self) -> CustomerSettingsResponse:
+        """Configure the client-side rate limit from the customer's settings.
+
+        Fetches the settings with `customers.get_settings()` and paces requests at
+        `rate_limit_requests_per_minute`, or removes the client-side limit if rate
+        limiting is disabled for the customer.
+
+        Returns:
+            CustomerSettingsResponse the limit was configured from
+
+        Example:
+            >>> client = VaultyClient(api_token="vaulty_abc123...")
+            >>> await client.apply_rate_limit_settings()
+            >>> await client.secrets.get_many("my-project", keys)  # paced, no 429s
+        """
+        settings = await self.customers.get_settings()
+        rate_limiter = self.http_client.rate_limiter
+
+        if not settings.rate_limit_enabled or settings.rate_limit_requests_per_minute <= 0:
+            self.http_client.rate_limiter = None
+        elif rate_limiter is not None:
+            rate_limiter.set_rate(settings.rate_limit_requests_per_minute / 60.0)
+        else:
+            self.http_client.rate_limiter = TokenBucket.per_minute(
+                settings.rate_limit_requests_per_minute
+            )
+        return settings
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
@@ -215,4 +383,5 @@ class VaultyClient:
             >>> # ... use client ...
             >>> await client.close()
         """
+        await self.secrets.cancel_revalidation()
         await self.http_client.close()
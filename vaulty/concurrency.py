@@ -0,0 +1,177 @@
+"""Adaptive concurrency limiting for Vaulty SDK."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limiter for the number of requests in flight.
+
+    The limit grows additively (about +1 per `limit` successful requests) while
+    latency stays close to the lowest latency observed, and shrinks
+    multiplicatively when latency climbs past `latency_tolerance` times that
+    baseline or the server pushes back (429, 5xx, timeouts). Bulk operations
+    can then ask for high concurrency and let the limiter find what the server
+    sustains.
+
+    At most one decrease is applied per round trip: requests started before the
+    last decrease don't shrink the limit again.
+
+    Example:
+        >>> client = VaultyClient(api_token="vaulty_abc123...", adaptive_concurrency=True)
+        >>> await client.secrets.get_many("my-project", keys, concurrency=100)
+        >>> client.http_client.concurrency_limiter.limit
+        23
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        decrease_factor: float = 0.7,
+        latency_tolerance: float = 2.0,
+        baseline_window: int = 500,
+    ):
+        """Initialize adaptive concurrency limiter.
+
+        Args:
+            initial_limit: Starting number of requests allowed in flight (default: 10)
+            min_limit: Lower bound for the limit (default: 1)
+            max_limit: Upper bound for the limit (default: 100)
+            decrease_factor: Multiplier applied to the limit on overload (default: 0.7)
+            latency_tolerance: Latency, as a multiple of the baseline, above which the
+                server is considered saturated (default: 2.0)
+            baseline_window: Samples after which the baseline latency is re-learned,
+                so it follows lasting changes (default: 500)
+
+        Raises:
+            ValueError: If the limits or factors are inconsistent
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.baseline_window = baseline_window
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._baseline_latency: float | None = None
+        self._latency: float | None = None
+        self._samples = 0
+        self._last_decrease_at = 0.0
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently in flight."""
+        return self._in_flight
+
+    async def acquire(self) -> float:
+        """Wait for a free slot.
+
+        Returns:
+            Start time to pass to `release()`
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return time.monotonic()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation: pass it on
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        return time.monotonic()
+
+    def release(self, started_at: float, overloaded: bool = False, sample: bool = True):
+        """Free a slot and adjust the limit from the request's outcome.
+
+        Args:
+            started_at: Value returned by `acquire()`
+            overloaded: The server pushed back (429, 5xx or timeout)
+            sample: Use this request to adjust the limit (False for cancelled or
+                failed requests that say nothing about server load)
+        """
+        self._in_flight -= 1
+        if overloaded:
+            self._decrease(started_at, "overload")
+        elif sample:
+            self._on_success(started_at, time.monotonic() - started_at)
+        self._wake()
+
+    def stats(self) -> dict[str, Any]:
+        """Get limiter state for monitoring.
+
+        Returns:
+            Dict with limit, in_flight, waiting, baseline/smoothed latency (seconds)
+            and the number of increases and decreases
+        """
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "baseline_latency": self._baseline_latency,
+            "latency": self._latency,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+    def _on_success(self, started_at: float, latency: float):
+        self._samples += 1
+        self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+        if self._samples % self.baseline_window == 0:
+            self._baseline_latency = self._latency
+        elif self._baseline_latency is None or latency < self._baseline_latency:
+            self._baseline_latency = latency
+
+        if self._latency > self._baseline_latency * self.latency_tolerance:
+            self._decrease(started_at, "latency")
+        elif self._in_flight + 1 >= self.limit / 2:
+            # Only grow while the current limit is actually being used
+            new_limit = min(self.max_limit, self._limit + 1 / self._limit)
+            if int(new_limit) > self.limit:
+                self.increases += 1
+            self._limit = new_limit
+
+    def _decrease(self, started_at: float, reason: str):
+        if started_at < self._last_decrease_at:
+            return
+        self._last_decrease_at = time.monotonic()
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self.decreases += 1
+        logger.debug(f"Concurrency limit decreased to {self.limit} ({reason})")
+
+    def _wake(self):
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
@@ -42,3 +42,29 @@ class VaultyRateLimitError(VaultyAPIError):
     ):
         self.retry_after = retry_after
         super().__init__(message, status_code, detail)
+
+
+class VaultyTimeoutError(VaultyError, TimeoutError):
+    """Deadline for the call (attempts and retries included) exceeded."""
+
+
+class VaultyCircuitOpenError(VaultyError):
+    """Request not sent because the endpoint's circuit breaker is open."""
+
+    def __init__(self, message: str, route: str | None = None, retry_after: float | None = None):
+        self.route = route
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class VaultyBulkError(VaultyError):
+    """One or more operations of a batch request failed.
+
+    Carries the successful results alongside the per-item errors so callers can
+    decide whether a partial result is usable.
+    """
+
+    def __init__(self, message: str, results: dict, errors: dict[str, Exception]):
+        self.results = results
+        self.errors = errors
+        super().__init__(message)
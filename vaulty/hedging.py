@@ -0,0 +1,133 @@
+"""Hedged requests for Vaulty SDK."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .retry import RetryBudget
+
+
+class HedgePolicy:
+    """When to send a second copy of a slow idempotent GET.
+
+    The hedge delay is the `percentile` of recently observed GET latencies,
+    clamped to [`min_delay`, `max_delay`]; until `min_samples` latencies are
+    known, `initial_delay` is used. Each hedge spends one retry from `budget`,
+    so hedging stops adding load when the server is struggling.
+
+    Example:
+        >>> client = VaultyClient(api_token="vaulty_abc123...", hedge_requests=True)
+        >>> await client.secrets.get_value("my-project", "API_KEY")
+        >>> client.http_client.hedge_policy.stats()
+        {'delay': 0.05, 'samples': 120, 'hedges': 6, 'hedges_won': 4, 'rejected': 0}
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.01,
+        max_delay: float = 2.0,
+        window: int = 200,
+        min_samples: int = 20,
+        budget: "RetryBudget | None" = None,
+    ):
+        """Initialize hedge policy.
+
+        Args:
+            percentile: Latency percentile after which a hedge is sent (default: 95.0)
+            initial_delay: Delay used until min_samples latencies are known (default: 0.5)
+            min_delay: Lower bound for the delay in seconds (default: 0.01)
+            max_delay: Upper bound for the delay in seconds (default: 2.0)
+            window: Number of recent latencies kept (default: 200)
+            min_samples: Latencies needed before the percentile is used (default: 20)
+            budget: RetryBudget each hedge is taken from (default: None, unlimited)
+
+        Raises:
+            ValueError: If percentile is not in (0, 100] or the delays are inconsistent
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= min_delay <= max_delay:
+            raise ValueError("delays must satisfy 0 <= min_delay <= max_delay")
+
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.budget = budget
+        self.hedges = 0
+        self.hedges_won = 0
+        self.rejected = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    def record(self, latency: float):
+        """Record the latency of a completed GET."""
+        self._latencies.append(latency)
+
+    def delay(self) -> float:
+        """Seconds to wait for a response before hedging."""
+        if len(self._latencies) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            ordered = sorted(self._latencies)
+            # Nearest-rank percentile
+            rank = math.ceil(self.percentile / 100 * len(ordered))
+            delay = ordered[max(rank, 1) - 1]
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def try_hedge(self) -> bool:
+        """Take a hedge from the budget.
+
+        Returns:
+            True if the hedge may be sent, False if the retry budget is exhausted
+        """
+        if self.budget is not None and not self.budget.try_acquire():
+            self.rejected += 1
+            return False
+        self.hedges += 1
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Get hedging counters for monitoring.
+
+        Returns:
+            Dict with the current delay, latency samples, hedges sent, hedges that
+            answered first and hedges rejected by the retry budget
+        """
+        return {
+            "delay": self.delay(),
+            "samples": len(self._latencies),
+            "hedges": self.hedges,
+            "hedges_won": self.hedges_won,
+            "rejected": self.rejected,
+        }
+
+
+class HedgeTimer:
+    """Latency of one copy of a hedged request, measured from when it is sent.
+
+    The clock starts after the copy got through the rate limiter and the
+    concurrency limiter, so time spent queued on the client doesn't look like a
+    slow server.
+    """
+
+    def __init__(self, policy: HedgePolicy):
+        self.policy = policy
+        self.sent = asyncio.Event()
+        self._sent_at: float | None = None
+
+    def start(self):
+        """Mark the copy as sent."""
+        self._sent_at = time.monotonic()
+        self.sent.set()
+
+    def record(self):
+        """Record the time since the copy was sent in the policy (once)."""
+        if self._sent_at is not None:
+            self.policy.record(time.monotonic() - self._sent_at)
+            self._sent_at = None
@@ -1,9 +1,12 @@
 """HTTP client wrapper for Vaulty API."""
 
+import asyncio
 from typing import Any
 
 import httpx
 
+from .circuit import CircuitBreaker, CircuitBreakerRegistry
+from .concurrency import AdaptiveConcurrencyLimiter
 from .exceptions import (
     VaultyAPIError,
     VaultyAuthenticationError,
@@ -12,7 +15,9 @@ from .exceptions import (
     VaultyRateLimitError,
     VaultyValidationError,
 )
+from .hedging import HedgePolicy, HedgeTimer
 from .logging import get_logger, sanitize_sensitive_data
+from .ratelimit import TokenBucket
 
 logger = get_logger(__name__)
 
@@ -27,12 +32,55 @@ class HTTPClient:
         jwt_token: str | None = None,
         timeout: float = 30.0,
         api_version: str = "v1",
+        coalesce_requests: bool = True,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        write_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        rate_limiter: TokenBucket | None = None,
+        rate_limit_from_headers: bool = False,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        hedge_policy: HedgePolicy | None = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_token = api_token
         self.jwt_token = jwt_token
         self.timeout = timeout
         self.api_version = api_version
+        self.coalesce_requests = coalesce_requests
+        self.http2 = http2
+
+        # Client-side pacing shared by every resource (None disables it). With
+        # rate_limit_from_headers, X-RateLimit-* headers create or retune the bucket.
+        self.rate_limiter = rate_limiter
+        self.rate_limit_from_headers = rate_limit_from_headers
+        # Adaptive cap on requests in flight (None disables it)
+        self.concurrency_limiter = concurrency_limiter
+        # Per-route circuit breakers (None disables them)
+        self.circuit_breakers = circuit_breakers
+        # Second copy of slow GETs (None disables hedging)
+        self.hedge_policy = hedge_policy
+
+        # Connection pool limits (None means unlimited / never expire)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+
+        # Per-phase timeouts, each falling back to the overall timeout
+        self.timeouts = httpx.Timeout(
+            timeout,
+            connect=timeout if connect_timeout is None else connect_timeout,
+            read=timeout if read_timeout is None else read_timeout,
+            write=timeout if write_timeout is None else write_timeout,
+            pool=timeout if pool_timeout is None else pool_timeout,
+        )
 
         # Determine auth header
         if api_token:
@@ -43,6 +91,8 @@ class HTTPClient:
             self.auth_header = None
 
         self._client: httpx.AsyncClient | None = None
+        # In-flight GET requests shared by identical concurrent callers
+        self._in_flight: dict[tuple, asyncio.Future[httpx.Response]] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -55,7 +105,11 @@ class HTTPClient:
                 headers["Authorization"] = self.auth_header
 
             self._client = httpx.AsyncClient(
-                base_url=self.base_url, headers=headers, timeout=self.timeout
+                base_url=self.base_url,
+                headers=headers,
+                timeout=self.timeouts,
+                limits=self.limits,
+                http2=self.http2,
             )
         return self._client
 
@@ -115,13 +169,95 @@ class HTTPClient:
         json: dict[str, Any] | None = None,
         **kwargs,
     ) -> httpx.Response:
-        """Make HTTP request."""
-        client = await self._get_client()
+        """Make HTTP request.
 
+        Identical concurrent GET requests (same path, params and credentials) are
+        coalesced when `coalesce_requests` is enabled: only the first one is sent and
+        every caller receives its response or exception. A write (any other method)
+        detaches the in-flight GETs of its path and the paths above and below it, so
+        GETs issued after the write never receive a response read before it.
+        """
         # Ensure path starts with /
         if not path.startswith("/"):
             path = "/" + path
 
+        coalesce_key = self._coalesce_key(method, path, params, json, kwargs)
+        if coalesce_key is None:
+            if method.upper() == "GET":
+                return await self._send(method, path, params=params, json=json, **kwargs)
+            self._forget_in_flight(path)
+            try:
+                return await self._send(method, path, params=params, json=json, **kwargs)
+            finally:
+                # GETs sent while the write was running may also have read the old state
+                self._forget_in_flight(path)
+
+        future = self._in_flight.get(coalesce_key)
+        if future is None:
+            future = asyncio.ensure_future(self._send(method, path, params=params))
+            self._in_flight[coalesce_key] = future
+            future.add_done_callback(lambda f: self._finish_in_flight(coalesce_key, f))
+        else:
+            logger.debug(
+                f"Joining in-flight {method} request to {path}",
+                extra={"method": method, "path": path},
+            )
+
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(future)
+
+    def _coalesce_key(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        kwargs: dict[str, Any],
+    ) -> tuple | None:
+        """Build the single-flight key for a request, or None if it must not be shared."""
+        if not self.coalesce_requests or method.upper() != "GET" or json is not None or kwargs:
+            return None
+        frozen_params = tuple(sorted(params.items())) if params else ()
+        key = (self.auth_header, path, frozen_params)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _forget_in_flight(self, path: str):
+        """Stop sharing in-flight GETs related to a written path (same credentials).
+
+        The requests keep running for the callers that already joined them.
+        """
+        for key in list(self._in_flight):
+            auth_header, in_flight_path, _params = key
+            if auth_header == self.auth_header and (
+                in_flight_path == path
+                or in_flight_path.startswith(path + "/")
+                or path.startswith(in_flight_path + "/")
+            ):
+                del self._in_flight[key]
+
+    def _finish_in_flight(self, key: tuple, future: asyncio.Future):
+        """Forget a completed in-flight request."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a single HTTP request and raise for error responses."""
+        client = await self._get_client()
+
         # Log request (sanitize sensitive data)
         logger.debug(
             f"Making {method} request to {path}",
@@ -134,8 +270,8 @@ class HTTPClient:
         )
 
         try:
-            response = await client.request(
-                method=method, url=path, params=params, json=json, **kwargs
+            response = await self._request_hedged(
+                client, method, path, params=params, json=json, **kwargs
             )
 
             logger.debug(
@@ -143,9 +279,14 @@ class HTTPClient:
                 extra={"status_code": response.status_code, "path": path},
             )
 
+            if self.rate_limit_from_headers:
+                self._update_rate_limit(response.headers)
             self._raise_for_status(response)
             return response
         except Exception as e:
+            if isinstance(e, VaultyRateLimitError) and e.retry_after and self.rate_limiter:
+                # Hold every request on this client, not just the one being retried
+                self.rate_limiter.pause(e.retry_after)
             logger.error(
                 f"Request failed: {method} {path}",
                 exc_info=True,
@@ -153,6 +294,163 @@ class HTTPClient:
             )
             raise
 
+    async def _request_hedged(
+        self, client: httpx.AsyncClient, method: str, path: str, **kwargs
+    ) -> httpx.Response:
+        """Send a request, hedging GETs that are slower than the policy's delay.
+
+        The hedge delay counts from when the request is actually sent, after the
+        rate and concurrency limiters. The first response wins and the other
+        request is cancelled. If one copy fails, the other one is still awaited.
+        """
+        policy = self.hedge_policy
+        if policy is None or method.upper() != "GET":
+            return await self._request_with_breaker(client, method, path, **kwargs)
+
+        timer = HedgeTimer(policy)
+        primary = asyncio.ensure_future(
+            self._request_with_breaker(client, method, path, timer=timer, **kwargs)
+        )
+        started = [primary]
+        pending = {primary}
+        try:
+            sent = asyncio.ensure_future(timer.sent.wait())
+            try:
+                await asyncio.wait({primary, sent}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                sent.cancel()
+
+            done, _ = await asyncio.wait(pending, timeout=policy.delay())
+            if not done and policy.try_hedge():
+                logger.debug(
+                    f"Hedging slow {method} request to {path}",
+                    extra={"method": method, "path": path},
+                )
+                hedge = asyncio.ensure_future(
+                    self._request_with_breaker(
+                        client, method, path, timer=HedgeTimer(policy), **kwargs
+                    )
+                )
+                started.append(hedge)
+                pending.add(hedge)
+
+            errors: list[BaseException] = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in started:
+                    if task not in done:
+                        continue
+                    error = task.exception()
+                    if error is None:
+                        if task is not primary:
+                            policy.hedges_won += 1
+                        return task.result()
+                    errors.append(error)
+            # Every copy failed: raise the first error
+            raise errors[0]
+        finally:
+            for task in started:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # Mark the loser's error as retrieved
+
+    async def _request_with_breaker(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        timer: HedgeTimer | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request unless the route's circuit breaker is open."""
+        if self.circuit_breakers is None:
+            return await self._request_with_limits(client, method, path, timer, **kwargs)
+
+        breaker = self.circuit_breakers.get(method, path)
+        breaker.allow()
+        try:
+            response = await self._request_with_limits(client, method, path, timer, **kwargs)
+        except BaseException as e:
+            self._record_outcome(breaker, e)
+            raise
+        self._record_outcome(breaker, None, response.status_code)
+        return response
+
+    @staticmethod
+    def _record_outcome(
+        breaker: CircuitBreaker, error: BaseException | None, status_code: int | None = None
+    ):
+        """Feed a request's outcome to its circuit breaker.
+
+        Connection errors, timeouts and 5xx responses count as failures. Other
+        responses (4xx included) show the endpoint is up. 429s and cancellations
+        say nothing about the endpoint's health.
+        """
+        if isinstance(error, httpx.TransportError) or (status_code or 0) >= 500:
+            breaker.record_failure()
+        elif error is not None or status_code == 429:
+            breaker.record_skipped()
+        else:
+            breaker.record_success()
+
+    async def _request_with_limits(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str,
+        timer: HedgeTimer | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request through the rate limiter and the concurrency limiter.
+
+        `timer` (hedged GETs) is started once both limiters let the request
+        through and records the latency of the request alone.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
+        limiter = self.concurrency_limiter
+        started_at = await limiter.acquire() if limiter is not None else 0.0
+        if timer is not None:
+            timer.start()
+        try:
+            response = await client.request(method=method, url=path, **kwargs)
+        except asyncio.CancelledError:
+            if timer is not None:
+                # A losing hedge copy: it took at least this long, keep it in the tail
+                timer.record()
+            if limiter is not None:
+                limiter.release(started_at, sample=False)
+            raise
+        except httpx.TimeoutException:
+            if limiter is not None:
+                limiter.release(started_at, overloaded=True)
+            raise
+        except BaseException:
+            if limiter is not None:
+                limiter.release(started_at, sample=False)
+            raise
+        if timer is not None:
+            timer.record()
+        if limiter is not None:
+            limiter.release(
+                started_at, overloaded=response.status_code == 429 or response.status_code >= 500
+            )
+        return response
+
+    def _update_rate_limit(self, headers: httpx.Headers):
+        """Create or retune the rate limiter from X-RateLimit-* response headers."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_headers(headers)
+            return
+
+        limit = headers.get("X-RateLimit-Limit")
+        if isinstance(limit, str) and limit.isdigit() and int(limit) > 0:
+            self.rate_limiter = TokenBucket.per_minute(int(limit))
+            self.rate_limiter.update_from_headers(headers)
+            logger.debug(f"Client-side rate limit enabled: {limit} requests per minute")
+
     async def get(
         self, path: str, params: dict[str, Any] | None = None, **kwargs
     ) -> httpx.Response:
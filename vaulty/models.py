@@ -21,6 +21,55 @@ class PaginatedResponse(BaseModel, Generic[T]):
     has_previous: bool
 
 
+class RawPage:
+    """Page of a list endpoint with items left as the API's plain dicts.
+
+    Returned by list methods called with ``raw=True``. Has the same attributes as
+    PaginatedResponse but skips model construction, for bulk paths that would
+    convert every item back to a dict anyway.
+    """
+
+    __slots__ = ("has_next", "has_previous", "items", "page", "page_size", "total", "total_pages")
+
+    def __init__(
+        self,
+        items: list[dict[str, Any]],
+        total: int,
+        page: int,
+        page_size: int,
+        total_pages: int,
+        has_next: bool,
+        has_previous: bool,
+    ):
+        self.items = items
+        self.total = total
+        self.page = page
+        self.page_size = page_size
+        self.total_pages = total_pages
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RawPage":
+        """Build a page from a decoded paginated response body."""
+        return cls(**{field: data[field] for field in cls.__slots__})
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the page as a dict, like ``PaginatedResponse.model_dump()``."""
+        return {
+            "items": self.items,
+            "total": self.total,
+            "page": self.page,
+            "page_size": self.page_size,
+            "total_pages": self.total_pages,
+            "has_next": self.has_next,
+            "has_previous": self.has_previous,
+        }
+
+    def __repr__(self) -> str:
+        return f"RawPage(page={self.page}/{self.total_pages}, items={len(self.items)})"
+
+
 # Customer Models
 class CustomerCreate(BaseModel):
     """Customer creation request."""
@@ -0,0 +1,104 @@
+"""Pagination helpers for list endpoints."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from .models import PaginatedResponse, RawPage
+from .utils import gather_with_concurrency
+
+# A page of models, or of plain dicts for list calls made with raw=True
+Page = PaginatedResponse | RawPage
+
+PageFetcher = Callable[[int], Awaitable[Page]]
+
+
+async def iterate_pages(
+    fetch_page: PageFetcher, start_page: int = 1, prefetch: bool = True
+) -> AsyncIterator[Page]:
+    """Iterate over pages of a list endpoint until `has_next` is False.
+
+    With `prefetch` enabled, the request for the next page is started as soon as
+    the current page is handed to the consumer, so network latency overlaps with
+    processing. At most one page is read ahead, keeping memory use constant.
+
+    Args:
+        fetch_page: Coroutine function returning the page with the given number
+        start_page: First page to fetch (1-indexed)
+        prefetch: Read the next page ahead while the current one is processed
+
+    Yields:
+        PaginatedResponse (or RawPage) for each page, in order
+    """
+    page_number = start_page
+    page = await fetch_page(page_number)
+
+    while True:
+        next_page: asyncio.Future[Page] | None = None
+        if prefetch and page.has_next:
+            next_page = asyncio.ensure_future(fetch_page(page_number + 1))
+
+        try:
+            yield page
+        except BaseException:
+            # Consumer stopped early (break / aclose): don't leave the read-ahead running
+            if next_page is not None and not next_page.cancel() and not next_page.cancelled():
+                next_page.exception()  # Mark a failed read-ahead as retrieved
+            raise
+
+        if not page.has_next:
+            return
+
+        page_number += 1
+        page = await next_page if next_page is not None else await fetch_page(page_number)
+
+
+async def iterate_items(
+    fetch_page: PageFetcher, start_page: int = 1, prefetch: bool = True
+) -> AsyncIterator[Any]:
+    """Iterate over the items of every page of a list endpoint.
+
+    Args:
+        fetch_page: Coroutine function returning the page with the given number
+        start_page: First page to fetch (1-indexed)
+        prefetch: Read the next page ahead while the current one is processed
+
+    Yields:
+        Items of each page, in order
+    """
+    async for page in iterate_pages(fetch_page, start_page=start_page, prefetch=prefetch):
+        for item in page.items:
+            yield item
+
+
+async def fetch_all_pages(fetch_page: PageFetcher, concurrency: int = 4) -> list[Any]:
+    """Fetch every page of a list endpoint, requesting pages concurrently.
+
+    The first page is fetched on its own to learn `total_pages`; the remaining
+    pages are independent and are requested in parallel (at most `concurrency` at
+    a time), then reassembled in page order.
+
+    Args:
+        fetch_page: Coroutine function returning the page with the given number
+        concurrency: Maximum number of page requests in flight (must be >= 1)
+
+    Returns:
+        List of all items, in page order
+
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    first_page = await fetch_page(1)
+    items = list(first_page.items)
+    if first_page.total_pages <= 1:
+        return items
+
+    pages = await gather_with_concurrency(
+        (fetch_page(page) for page in range(2, first_page.total_pages + 1)), concurrency
+    )
+    for page in pages:
+        items.extend(page.items)
+    return items
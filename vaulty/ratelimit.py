@@ -0,0 +1,165 @@
+"""Client-side rate limiting for Vaulty SDK."""
+
+import asyncio
+import time
+from collections.abc import Mapping
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Reset values above this are Unix timestamps rather than seconds from now
+_EPOCH_THRESHOLD = 1_000_000_000
+
+# Tolerance for float rounding when refilled tokens land just below a whole token
+_EPSILON = 1e-9
+
+
+class TokenBucket:
+    """Token bucket pacing requests to a sustained rate.
+
+    Every request takes one token; tokens refill continuously at `rate` per second
+    up to `capacity`, which bounds bursts. Waiters are served in FIFO order, so one
+    bucket shared by every resource and coroutine of a client paces them all.
+
+    The bucket can be retuned while in use, e.g. from the server's
+    ``X-RateLimit-*`` headers (`update_from_headers`) or customer settings.
+
+    Example:
+        >>> bucket = TokenBucket.per_minute(600)  # 10 requests/second
+        >>> client = VaultyClient(api_token="vaulty_abc123...", rate_limiter=bucket)
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second (must be > 0)
+            capacity: Maximum tokens (burst size). Defaults to one second worth of
+                tokens, at least 1.
+
+        Raises:
+            ValueError: If rate is not positive or capacity is less than 1
+        """
+        self._lock: asyncio.Lock | None = None
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self.rate = 0.0
+        self.capacity = 0.0
+        self._tokens = 0.0
+        self.set_rate(rate, capacity)
+        self._tokens = self.capacity
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, capacity: float | None = None) -> "TokenBucket":
+        """Create a bucket allowing `requests_per_minute` sustained requests."""
+        return cls(requests_per_minute / 60.0, capacity)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def set_rate(self, rate: float, capacity: float | None = None):
+        """Change the refill rate (and capacity) without losing the current state.
+
+        Args:
+            rate: Tokens added per second (must be > 0)
+            capacity: Maximum tokens; defaults to one second worth of tokens, at least 1
+
+        Raises:
+            ValueError: If rate is not positive or capacity is less than 1
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity is None:
+            capacity = max(1.0, rate)
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self._refill()
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = min(self._tokens, self.capacity)
+
+    def pause(self, seconds: float):
+        """Hold all requests for `seconds` (e.g. after a 429 with Retry-After)."""
+        self._refill()
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        # Start refilling only once the pause is over
+        self._updated_at = self._paused_until
+        self._tokens = 0.0
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until `tokens` are available and take them.
+
+        Args:
+            tokens: Number of tokens to take (default: 1)
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill()
+                if self._tokens >= tokens - _EPSILON:
+                    self._tokens = max(self._tokens - tokens, 0.0)
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def update_from_headers(self, headers: Mapping[str, str], window: float = 60.0) -> bool:
+        """Retune the bucket from ``X-RateLimit-*`` response headers.
+
+        ``X-RateLimit-Limit`` (requests per `window` seconds) sets the rate and
+        ``X-RateLimit-Remaining`` caps the local tokens, so the client never assumes
+        more budget than the server reports. When nothing remains, requests are held
+        until ``X-RateLimit-Reset`` (seconds, or a Unix timestamp).
+
+        Args:
+            headers: Response headers
+            window: Length of the server's rate limit window in seconds (default: 60)
+
+        Returns:
+            True if any rate limit header was applied
+        """
+        limit = _header_number(headers, "X-RateLimit-Limit")
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        reset = _header_number(headers, "X-RateLimit-Reset")
+
+        if limit is not None and limit > 0 and limit / window != self.rate:
+            self.set_rate(limit / window)
+            logger.debug(f"Rate limit set to {limit:g} requests per {window:g}s")
+
+        if remaining is not None:
+            self._refill()
+            self._tokens = min(self._tokens, max(remaining, 0.0))
+            if remaining <= 0 and reset is not None:
+                if reset > _EPOCH_THRESHOLD:
+                    reset -= time.time()
+                if reset > 0:
+                    self.pause(reset)
+
+        return limit is not None or remaining is not None
+
+    def _refill(self):
+        now = time.monotonic()
+        if now <= self._updated_at:
+            return
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
@@ -1,13 +1,20 @@
 """Activity resource client."""
 
-from datetime import datetime
+import asyncio
+import builtins
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Any
 
 from ..http import HTTPClient
 from ..models import (
     ActivityResponse,
     PaginatedResponse,
+    RawPage,
 )
+from ..pagination import fetch_all_pages, iterate_items
 from ..retry import RetryConfig, retry_with_backoff
+from ..serialization import decode_page
 
 
 class ActivityResource:
@@ -27,7 +34,8 @@ class ActivityResource:
         search: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
-    ) -> PaginatedResponse[ActivityResponse]:
+        raw: bool = False,
+    ) -> PaginatedResponse[ActivityResponse] | RawPage:
         """List activities with filters and pagination.
 
         Args:
@@ -39,9 +47,10 @@ class ActivityResource:
             search: Search term
             start_date: Filter activities after this date
             end_date: Filter activities before this date
+            raw: Return a RawPage of plain dicts instead of models (skips validation)
 
         Returns:
-            PaginatedResponse with activities
+            PaginatedResponse with activities (RawPage if raw)
         """
 
         async def _list():
@@ -60,26 +69,199 @@ class ActivityResource:
                 params["end_date"] = end_date.isoformat()
 
             response = await self.http_client.get("/api/v1/activities", params=params)
-            data = response.json()
-
-            # Parse datetime strings back to datetime objects
-            items = []
-            for item in data["items"]:
-                # Parse created_at
-                if isinstance(item.get("created_at"), str):
-                    item["created_at"] = datetime.fromisoformat(
-                        item["created_at"].replace("Z", "+00:00")
-                    )
-                items.append(ActivityResponse(**item))
-
-            return PaginatedResponse[ActivityResponse](
-                items=items,
-                total=data["total"],
-                page=data["page"],
-                page_size=data["page_size"],
-                total_pages=data["total_pages"],
-                has_next=data["has_next"],
-                has_previous=data["has_previous"],
-            )
+            return decode_page(response, ActivityResponse, raw)
 
         return await retry_with_backoff(_list, self.retry_config)
+
+    def iter_all(
+        self,
+        page_size: int = 100,
+        action: str | None = None,
+        method: str | None = None,
+        resource_id: str | None = None,
+        search: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        prefetch: bool = True,
+        raw: bool = False,
+    ) -> AsyncIterator[ActivityResponse | dict[str, Any]]:
+        """Iterate over all matching activities, fetching pages as needed.
+
+        Args:
+            page_size: Number of items per page (1-100)
+            action: Filter by action (e.g., "create_secret")
+            method: Filter by HTTP method (e.g., "POST")
+            resource_id: Filter by resource ID
+            search: Search term
+            start_date: Filter activities after this date
+            end_date: Filter activities before this date
+            prefetch: Fetch the next page while the current one is being consumed
+            raw: Yield plain dicts instead of models (skips validation)
+
+        Returns:
+            Async iterator of ActivityResponse (dicts if raw)
+        """
+        return iterate_items(
+            lambda page: self.list(
+                page=page,
+                page_size=page_size,
+                action=action,
+                method=method,
+                resource_id=resource_id,
+                search=search,
+                start_date=start_date,
+                end_date=end_date,
+                raw=raw,
+            ),
+            prefetch=prefetch,
+        )
+
+    async def fetch_all(
+        self,
+        concurrency: int = 4,
+        page_size: int = 100,
+        action: str | None = None,
+        method: str | None = None,
+        resource_id: str | None = None,
+        search: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        raw: bool = False,
+    ) -> builtins.list[ActivityResponse] | builtins.list[dict[str, Any]]:
+        """Fetch all matching activities, requesting the remaining pages concurrently.
+
+        The first page is fetched to learn `total_pages`; the rest are fetched in
+        parallel and reassembled in order.
+
+        Args:
+            concurrency: Maximum number of page requests in flight (default: 4)
+            page_size: Number of items per page (1-100)
+            action: Filter by action (e.g., "create_secret")
+            method: Filter by HTTP method (e.g., "POST")
+            resource_id: Filter by resource ID
+            search: Search term
+            start_date: Filter activities after this date
+            end_date: Filter activities before this date
+            raw: Return plain dicts instead of models (skips validation)
+
+        Returns:
+            List of all ActivityResponse (dicts if raw), in page order
+
+        Example:
+            >>> activities = await client.activities.fetch_all(
+            ...     concurrency=8, action="get_secret"
+            ... )
+        """
+        return await fetch_all_pages(
+            lambda page: self.list(
+                page=page,
+                page_size=page_size,
+                action=action,
+                method=method,
+                resource_id=resource_id,
+                search=search,
+                start_date=start_date,
+                end_date=end_date,
+                raw=raw,
+            ),
+            concurrency=concurrency,
+        )
+
+    async def tail(
+        self,
+        start_date: datetime | None = None,
+        action: str | None = None,
+        method: str | None = None,
+        resource_id: str | None = None,
+        search: str | None = None,
+        page_size: int = 100,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        follow: bool = True,
+        raw: bool = False,
+    ) -> AsyncIterator[ActivityResponse | dict[str, Any]]:
+        """Yield activities as they are recorded, oldest first.
+
+        Each poll lists activities from the newest `created_at` seen so far
+        (usually a single request), so nothing is re-read from the start.
+        Activities sharing that boundary timestamp are deduplicated by id. The
+        wait between polls starts at `poll_interval` and doubles while nothing
+        new arrives, up to `max_poll_interval`.
+
+        Args:
+            start_date: Yield activities after this date (default: now)
+            action: Filter by action (e.g., "create_secret")
+            method: Filter by HTTP method (e.g., "POST")
+            resource_id: Filter by resource ID
+            search: Search term
+            page_size: Number of items per page (1-100)
+            poll_interval: Seconds between polls while activities arrive (default: 1.0)
+            max_poll_interval: Longest wait between polls when idle (default: 30.0)
+            follow: Keep polling for new activities; if False, stop after one poll
+            raw: Yield plain dicts instead of models (skips validation)
+
+        Yields:
+            ActivityResponse (dicts if raw), in created_at order
+
+        Example:
+            >>> async for activity in client.activities.tail(action="get_secret"):
+            ...     forward_to_siem(activity)
+        """
+        since = _as_utc(start_date or datetime.now(UTC))
+        boundary_ids: set[str] = set()  # Already yielded activities created at `since`
+        interval = poll_interval
+
+        while True:
+            seen: set[str] = set()
+            new = []
+            async for item in self.iter_all(
+                page_size=page_size,
+                action=action,
+                method=method,
+                resource_id=resource_id,
+                search=search,
+                start_date=since,
+                raw=raw,
+            ):
+                created_at = _created_at(item) or since
+                activity_id = _field(item, "id")
+                if created_at < since or (created_at == since and activity_id in boundary_ids):
+                    continue
+                if activity_id is not None:
+                    # Pages can shift while new activities are recorded
+                    if activity_id in seen:
+                        continue
+                    seen.add(activity_id)
+                new.append((created_at, activity_id, item))
+
+            new.sort(key=lambda entry: entry[0])
+            for created_at, activity_id, item in new:
+                if created_at > since:
+                    since = created_at
+                    boundary_ids = set()
+                if activity_id is not None:
+                    boundary_ids.add(activity_id)
+                yield item
+
+            if not follow:
+                return
+            interval = poll_interval if new else min(interval * 2, max_poll_interval)
+            await asyncio.sleep(interval)
+
+
+def _field(item: ActivityResponse | dict[str, Any], name: str) -> Any:
+    """Read a field of a model or raw activity dict."""
+    return item.get(name) if isinstance(item, dict) else getattr(item, name)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC so they compare with the API's timestamps."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+
+def _created_at(item: ActivityResponse | dict[str, Any]) -> datetime | None:
+    """Get the creation time of a model or raw activity dict."""
+    created_at = _field(item, "created_at")
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at)
+    return _as_utc(created_at) if created_at is not None else None
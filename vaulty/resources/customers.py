@@ -6,6 +6,7 @@ from ..models import (
     CustomerSettingsResponse,
 )
 from ..retry import RetryConfig, retry_with_backoff
+from ..serialization import decode
 
 
 class CustomerResource:
@@ -30,7 +31,7 @@ class CustomerResource:
             response = await self.http_client.post(
                 "/api/v1/customers/register", json={"email": email, "password": password}
             )
-            return CustomerResponse(**response.json())
+            return decode(response, CustomerResponse)
 
         return await retry_with_backoff(_register, self.retry_config)
 
@@ -62,7 +63,7 @@ class CustomerResource:
 
         async def _get_current():
             response = await self.http_client.get("/api/v1/customers/me")
-            return CustomerResponse(**response.json())
+            return decode(response, CustomerResponse)
 
         return await retry_with_backoff(_get_current, self.retry_config)
 
@@ -108,7 +109,7 @@ class CustomerResource:
 
         async def _update_settings():
             response = await self.http_client.patch("/api/v1/customers/settings", json=data)
-            return CustomerSettingsResponse(**response.json())
+            return decode(response, CustomerSettingsResponse)
 
         return await retry_with_backoff(_update_settings, self.retry_config)
 
@@ -121,6 +122,6 @@ class CustomerResource:
 
         async def _get_settings():
             response = await self.http_client.get("/api/v1/customers/settings")
-            return CustomerSettingsResponse(**response.json())
+            return decode(response, CustomerSettingsResponse)
 
         return await retry_with_backoff(_get_settings, self.retry_config)
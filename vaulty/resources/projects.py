@@ -1,13 +1,19 @@
 """Project resource client."""
 
+import builtins
 import urllib.parse
+from collections.abc import AsyncIterator
+from typing import Any
 
 from ..http import HTTPClient
 from ..models import (
     PaginatedResponse,
     ProjectResponse,
+    RawPage,
 )
+from ..pagination import fetch_all_pages, iterate_items
 from ..retry import RetryConfig, retry_with_backoff
+from ..serialization import decode, decode_page
 
 
 class ProjectResource:
@@ -32,38 +38,71 @@ class ProjectResource:
             response = await self.http_client.post(
                 "/api/v1/projects", json={"name": name, "description": description}
             )
-            return ProjectResponse(**response.json())
+            return decode(response, ProjectResponse)
 
         return await retry_with_backoff(_create, self.retry_config)
 
-    async def list(self, page: int = 1, page_size: int = 50) -> PaginatedResponse[ProjectResponse]:
+    async def list(
+        self, page: int = 1, page_size: int = 50, raw: bool = False
+    ) -> PaginatedResponse[ProjectResponse] | RawPage:
         """List projects with pagination.
 
         Args:
             page: Page number (1-indexed)
             page_size: Number of items per page (1-100)
+            raw: Return a RawPage of plain dicts instead of models (skips validation)
 
         Returns:
-            PaginatedResponse with projects
+            PaginatedResponse with projects (RawPage if raw)
         """
 
         async def _list():
             response = await self.http_client.get(
                 "/api/v1/projects", params={"page": page, "page_size": page_size}
             )
-            data = response.json()
-            return PaginatedResponse[ProjectResponse](
-                items=[ProjectResponse(**item) for item in data["items"]],
-                total=data["total"],
-                page=data["page"],
-                page_size=data["page_size"],
-                total_pages=data["total_pages"],
-                has_next=data["has_next"],
-                has_previous=data["has_previous"],
-            )
+            return decode_page(response, ProjectResponse, raw)
 
         return await retry_with_backoff(_list, self.retry_config)
 
+    def iter_all(
+        self, page_size: int = 100, prefetch: bool = True, raw: bool = False
+    ) -> AsyncIterator[ProjectResponse | dict[str, Any]]:
+        """Iterate over all projects, fetching pages as needed.
+
+        Args:
+            page_size: Number of items per page (1-100)
+            prefetch: Fetch the next page while the current one is being consumed
+            raw: Yield plain dicts instead of models (skips validation)
+
+        Returns:
+            Async iterator of ProjectResponse (dicts if raw)
+
+        Example:
+            >>> async for project in client.projects.iter_all():
+            ...     print(project.name)
+        """
+        return iterate_items(
+            lambda page: self.list(page=page, page_size=page_size, raw=raw), prefetch=prefetch
+        )
+
+    async def fetch_all(
+        self, concurrency: int = 4, page_size: int = 100, raw: bool = False
+    ) -> builtins.list[ProjectResponse] | builtins.list[dict[str, Any]]:
+        """Fetch all projects, requesting the remaining pages concurrently.
+
+        Args:
+            concurrency: Maximum number of page requests in flight (default: 4)
+            page_size: Number of items per page (1-100)
+            raw: Return plain dicts instead of models (skips validation)
+
+        Returns:
+            List of all ProjectResponse (dicts if raw), in page order
+        """
+        return await fetch_all_pages(
+            lambda page: self.list(page=page, page_size=page_size, raw=raw),
+            concurrency=concurrency,
+        )
+
     async def get(self, name: str) -> ProjectResponse:
         """Get project by name.
 
@@ -78,7 +117,7 @@ class ProjectResource:
             # URL encode project name
             encoded_name = urllib.parse.quote(name, safe="")
             response = await self.http_client.get(f"/api/v1/projects/{encoded_name}")
-            return ProjectResponse(**response.json())
+            return decode(response, ProjectResponse)
 
         return await retry_with_backoff(_get, self.retry_config)
 
@@ -99,7 +138,7 @@ class ProjectResource:
                 f"/api/v1/projects/{encoded_name}",
                 json={"description": description} if description else {},
             )
-            return ProjectResponse(**response.json())
+            return decode(response, ProjectResponse)
 
         return await retry_with_backoff(_update, self.retry_config)
 
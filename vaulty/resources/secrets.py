@@ -1,22 +1,54 @@
 """Secret resource client."""
 
+import asyncio
+import builtins
 import urllib.parse
-
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+import httpx
+
+from ..cache import ProjectScopeCache, SecretCache
+from ..exceptions import (
+    VaultyAPIError,
+    VaultyAuthorizationError,
+    VaultyBulkError,
+    VaultyCircuitOpenError,
+    VaultyNotFoundError,
+    VaultyTimeoutError,
+)
 from ..http import HTTPClient
+from ..logging import get_logger
 from ..models import (
     PaginatedResponse,
+    RawPage,
     SecretResponse,
     SecretValueResponse,
 )
+from ..pagination import fetch_all_pages, iterate_items
 from ..retry import RetryConfig, retry_with_backoff
+from ..serialization import decode, decode_page
+from ..utils import gather_with_concurrency
+
+logger = get_logger(__name__)
 
 
 class SecretResource:
     """Client for secret management operations."""
 
-    def __init__(self, http_client: HTTPClient, retry_config: RetryConfig | None = None):
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        retry_config: RetryConfig | None = None,
+        cache: SecretCache | None = None,
+        project_scope: ProjectScopeCache | None = None,
+    ):
         self.http_client = http_client
         self.retry_config = retry_config
+        self.cache = cache
+        self.project_scope = project_scope
+        # Background refreshes of stale cached values, one per secret
+        self._revalidating: dict[tuple[str, str], asyncio.Task] = {}
 
     async def create(self, project_name: str, key: str, value: str) -> SecretResponse:
         """Create a new secret.
@@ -54,81 +86,153 @@ class SecretResource:
             response = await self.http_client.post(
                 f"/api/v1/projects/{encoded_name}/secrets", json={"key": key, "value": value}
             )
-            return SecretResponse(**response.json())
+            return decode(response, SecretResponse)
 
-        return await retry_with_backoff(_create, self.retry_config)
+        try:
+            return await retry_with_backoff(_create, self.retry_config)
+        finally:
+            self._invalidate(project_name, key)
 
     async def list(
-        self, project_name: str | None = None, page: int = 1, page_size: int = 50
-    ) -> PaginatedResponse[SecretResponse]:
+        self,
+        project_name: str | None = None,
+        page: int = 1,
+        page_size: int = 50,
+        raw: bool = False,
+    ) -> PaginatedResponse[SecretResponse] | RawPage:
         """List secrets in project with pagination.
 
         Args:
             project_name: Project name (required for full scope tokens, optional for project-scoped)
             page: Page number (1-indexed)
             page_size: Number of items per page (1-100)
+            raw: Return a RawPage of plain dicts instead of models (skips validation)
 
         Returns:
-            PaginatedResponse with secrets
+            PaginatedResponse with secrets (RawPage if raw)
         """
 
         async def _list():
+            scoped_url = False
             if project_name:
                 encoded_name = urllib.parse.quote(project_name, safe="")
                 url = f"/api/v1/projects/{encoded_name}/secrets"
             else:
-                # For project-scoped tokens, get project name from projects list
-                # Project-scoped tokens can list their own project
-                try:
-                    # Get projects list - for project-scoped tokens, this returns only their project
-                    projects_response = await self.http_client.get(
-                        "/api/v1/projects", params={"page": 1, "page_size": 1}
-                    )
-                    projects_data = projects_response.json()
-
-                    # Handle both list and paginated response
-                    projects_list = (
-                        projects_data
-                        if isinstance(projects_data, list)
-                        else projects_data.get("items", [])
-                    )
-
-                    if projects_list and len(projects_list) > 0:
-                        # Get project name from the first (and likely only) project
-                        project_name_from_list = projects_list[0].get("name")
-                        if project_name_from_list:
-                            encoded_name = urllib.parse.quote(project_name_from_list, safe="")
-                            url = f"/api/v1/projects/{encoded_name}/secrets"
-                        else:
-                            # Fallback: try using project ID
-                            project_id = projects_list[0].get("id")
-                            if project_id:
-                                encoded_id = urllib.parse.quote(project_id, safe="")
-                                url = f"/api/v1/projects/{encoded_id}/secrets"
-                            else:
-                                raise ValueError("Could not determine project name or ID")
-                    else:
-                        # No projects found, try fallback endpoint
-                        url = "/api/v1/secrets"
-                except Exception:
-                    # Fallback to /api/v1/secrets if project lookup fails
-                    url = "/api/v1/secrets"
+                url = await self._scoped_secrets_url()
+                scoped_url = url != "/api/v1/secrets"
+
+            try:
+                response = await self.http_client.get(
+                    url, params={"page": page, "page_size": page_size}
+                )
+            except (VaultyNotFoundError, VaultyAuthorizationError):
+                # Resolved project is gone or no longer accessible: resolve again next time
+                if scoped_url and self.project_scope is not None:
+                    self.project_scope.invalidate()
+                raise
+            return decode_page(response, SecretResponse, raw)
 
-            response = await self.http_client.get(
-                url, params={"page": page, "page_size": page_size}
+        return await retry_with_backoff(_list, self.retry_config)
+
+    async def _scoped_secrets_url(self) -> str:
+        """Resolve the secrets URL for a project-scoped token.
+
+        The resolved project is kept in `project_scope` (when set) for the current
+        credentials, so the lookup costs one round trip per client lifetime.
+        """
+        auth_header = self.http_client.auth_header
+        if self.project_scope is not None:
+            cached = self.project_scope.get(auth_header)
+            cached_name = cached and (cached["name"] or cached["id"])
+            if cached_name:
+                encoded_name = urllib.parse.quote(cached_name, safe="")
+                return f"/api/v1/projects/{encoded_name}/secrets"
+
+        # For project-scoped tokens, get project name from projects list
+        # Project-scoped tokens can list their own project
+        try:
+            # Get projects list - for project-scoped tokens, this returns only their project
+            projects_response = await self.http_client.get(
+                "/api/v1/projects", params={"page": 1, "page_size": 1}
             )
-            data = response.json()
-            return PaginatedResponse[SecretResponse](
-                items=[SecretResponse(**item) for item in data["items"]],
-                total=data["total"],
-                page=data["page"],
-                page_size=data["page_size"],
-                total_pages=data["total_pages"],
-                has_next=data["has_next"],
-                has_previous=data["has_previous"],
+            projects_data = projects_response.json()
+
+            # Handle both list and paginated response
+            projects_list = (
+                projects_data if isinstance(projects_data, list) else projects_data.get("items", [])
             )
 
-        return await retry_with_backoff(_list, self.retry_config)
+            if not projects_list:
+                # No projects found, try fallback endpoint
+                return "/api/v1/secrets"
+
+            # Get project name from the first (and likely only) project,
+            # falling back to the project ID
+            project = {"id": projects_list[0].get("id"), "name": projects_list[0].get("name")}
+            if not project["name"] and not project["id"]:
+                raise ValueError("Could not determine project name or ID")
+        except Exception:
+            # Fallback to /api/v1/secrets if project lookup fails
+            return "/api/v1/secrets"
+
+        if self.project_scope is not None:
+            self.project_scope.set(auth_header, project)
+        encoded_name = urllib.parse.quote(project["name"] or project["id"], safe="")
+        return f"/api/v1/projects/{encoded_name}/secrets"
+
+    def iter_all(
+        self,
+        project_name: str | None = None,
+        page_size: int = 100,
+        prefetch: bool = True,
+        raw: bool = False,
+    ) -> AsyncIterator[SecretResponse | dict[str, Any]]:
+        """Iterate over all secrets in a project, fetching pages as needed.
+
+        Args:
+            project_name: Project name (required for full scope tokens, optional for project-scoped)
+            page_size: Number of items per page (1-100)
+            prefetch: Fetch the next page while the current one is being consumed
+            raw: Yield plain dicts instead of models (skips validation)
+
+        Returns:
+            Async iterator of SecretResponse (dicts if raw)
+
+        Example:
+            >>> async for secret in client.secrets.iter_all(project_name="my-project"):
+            ...     print(secret.key)
+        """
+        return iterate_items(
+            lambda page: self.list(
+                project_name=project_name, page=page, page_size=page_size, raw=raw
+            ),
+            prefetch=prefetch,
+        )
+
+    async def fetch_all(
+        self,
+        project_name: str | None = None,
+        concurrency: int = 4,
+        page_size: int = 100,
+        raw: bool = False,
+    ) -> builtins.list[SecretResponse] | builtins.list[dict[str, Any]]:
+        """Fetch all secrets in a project, requesting the remaining pages concurrently.
+
+        Args:
+            project_name: Project name (required for full scope tokens, optional for project-scoped)
+            concurrency: Maximum number of page requests in flight (default: 4)
+            page_size: Number of items per page (1-100)
+            raw: Return plain dicts instead of models (skips validation)
+
+        Returns:
+            List of all SecretResponse (dicts if raw), in page order
+        """
+        return await fetch_all_pages(
+            lambda page: self.list(
+                project_name=project_name, page=page, page_size=page_size, raw=raw
+            ),
+            concurrency=concurrency,
+        )
 
     async def get(self, project_name: str, key: str) -> SecretResponse:
         """Get secret metadata (without value).
@@ -147,7 +251,7 @@ class SecretResource:
             response = await self.http_client.get(
                 f"/api/v1/projects/{encoded_name}/secrets/{encoded_key}"
             )
-            return SecretResponse(**response.json())
+            return decode(response, SecretResponse)
 
         return await retry_with_backoff(_get, self.retry_config)
 
@@ -157,6 +261,13 @@ class SecretResource:
         Retrieves the decrypted value of a secret. This is the only method that
         returns the actual secret value. Use `get()` for metadata only.
 
+        If the resource has a `cache`, fresh cached values (and cached "not found"
+        results) are served from memory without a request. Expired values are
+        still served within the cache's `stale_while_revalidate` window (and
+        refreshed in the background), and within its `stale_if_error` window when
+        the API is unavailable (5xx, 429, timeouts, connection errors, or an open
+        circuit breaker for the endpoint).
+
         Args:
             project_name: Project name containing the secret
             key: Secret key to retrieve
@@ -168,6 +279,8 @@ class SecretResource:
             VaultyNotFoundError: If secret or project doesn't exist
             VaultyAuthenticationError: If authentication fails
             VaultyAuthorizationError: If user lacks permission to read secret
+            VaultyCircuitOpenError: If the endpoint is failing and no value is within
+                the cache's stale_if_error window
             VaultyAPIError: For other API errors
 
         Example:
@@ -178,16 +291,132 @@ class SecretResource:
             >>> print(secret.value)
             secret123
         """
-
-        async def _get_value():
+        if self.cache is None:
+            return await self._fetch_value(project_name, key)
+
+        cached = self.cache.get(project_name, key)
+        if cached is not None:
+            return cached
+
+        if self.cache.stale_while_revalidate:
+            stale = self.cache.get_stale(project_name, key, self.cache.stale_while_revalidate)
+            if stale is not None:
+                self._revalidate(project_name, key)
+                return stale
+
+        try:
+            return await self._fetch_value(project_name, key)
+        except Exception as e:
+            if not self.cache.stale_if_error or not _is_unavailable(e):
+                raise
+            stale = self.cache.get_stale(project_name, key, self.cache.stale_if_error)
+            if stale is None:
+                raise
+            logger.warning(f"Serving stale cached value for {key}: {type(e).__name__}")
+            return stale
+
+    async def _fetch_value(self, project_name: str, key: str) -> SecretValueResponse:
+        """Fetch a secret value from the API and update the cache."""
+
+        async def _get_value() -> SecretValueResponse:
             encoded_name = urllib.parse.quote(project_name, safe="")
             encoded_key = urllib.parse.quote(key, safe="")
             response = await self.http_client.get(
                 f"/api/v1/projects/{encoded_name}/secrets/{encoded_key}"
             )
-            return SecretValueResponse(**response.json())
+            return decode(response, SecretValueResponse)
+
+        if self.cache is None:
+            return await retry_with_backoff(_get_value, self.retry_config)
+
+        # An update/delete finishing while this fetch runs makes its result stale
+        generation = self.cache.generation(project_name, key)
+        try:
+            value = await retry_with_backoff(_get_value, self.retry_config)
+        except VaultyNotFoundError as e:
+            self.cache.set_not_found(project_name, key, e, generation)
+            raise
+        self.cache.set(project_name, key, value, generation)
+        return value
+
+    def _revalidate(self, project_name: str, key: str):
+        """Refresh a stale cached value in the background (once per secret at a time)."""
+        cache_key = (project_name, key)
+        if cache_key in self._revalidating:
+            return
+
+        async def _refresh():
+            try:
+                await self._fetch_value(project_name, key)
+            except VaultyNotFoundError:
+                pass  # Cached as "not found" by _fetch_value
+            except Exception as e:
+                logger.warning(f"Background refresh of {key} failed: {e}")
+            finally:
+                self._revalidating.pop(cache_key, None)
+
+        self._revalidating[cache_key] = asyncio.create_task(_refresh())
+
+    async def cancel_revalidation(self):
+        """Cancel background refreshes of stale cached values (e.g. before closing)."""
+        tasks = list(self._revalidating.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_many(
+        self, project_name: str, keys: Iterable[str], concurrency: int = 10
+    ) -> dict[str, SecretValueResponse]:
+        """Get many secret values (decrypted) in parallel.
+
+        Requests are issued concurrently over the shared HTTP connection pool, with
+        at most `concurrency` in flight. Each key is retried independently.
+
+        Args:
+            project_name: Project name containing the secrets
+            keys: Secret keys to retrieve (duplicates are fetched once)
+            concurrency: Maximum number of requests in flight (default: 10)
+
+        Returns:
+            Dict mapping each key to its SecretValueResponse, in the order given
+
+        Raises:
+            VaultyBulkError: If any key could not be fetched. `results` holds the
+                values that were fetched and `errors` maps failed keys to exceptions.
+            ValueError: If concurrency is less than 1
 
-        return await retry_with_backoff(_get_value, self.retry_config)
+        Example:
+            >>> secrets = await client.secrets.get_many(
+            ...     project_name="my-project",
+            ...     keys=["API_KEY", "DB_PASSWORD"],
+            ... )
+            >>> print(secrets["API_KEY"].value)
+            secret123
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        responses = await gather_with_concurrency(
+            (self.get_value(project_name, key) for key in unique_keys),
+            concurrency,
+            return_exceptions=True,
+        )
+
+        results: dict[str, SecretValueResponse] = {}
+        errors: dict[str, Exception] = {}
+        for key, response in zip(unique_keys, responses, strict=True):
+            if isinstance(response, Exception):
+                errors[key] = response
+            elif isinstance(response, BaseException):
+                raise response
+            else:
+                results[key] = response
+
+        if errors:
+            raise VaultyBulkError(
+                f"Failed to fetch {len(errors)} of {len(unique_keys)} secrets",
+                results=results,
+                errors=errors,
+            )
+        return results
 
     async def update(self, project_name: str, key: str, value: str) -> SecretResponse:
         """Update secret value.
@@ -207,9 +436,12 @@ class SecretResource:
             response = await self.http_client.patch(
                 f"/api/v1/projects/{encoded_name}/secrets/{encoded_key}", json={"value": value}
             )
-            return SecretResponse(**response.json())
+            return decode(response, SecretResponse)
 
-        return await retry_with_backoff(_update, self.retry_config)
+        try:
+            return await retry_with_backoff(_update, self.retry_config)
+        finally:
+            self._invalidate(project_name, key)
 
     async def delete(self, project_name: str, key: str) -> None:
         """Delete secret.
@@ -224,4 +456,19 @@ class SecretResource:
             encoded_key = urllib.parse.quote(key, safe="")
             await self.http_client.delete(f"/api/v1/projects/{encoded_name}/secrets/{encoded_key}")
 
-        await retry_with_backoff(_delete, self.retry_config)
+        try:
+            await retry_with_backoff(_delete, self.retry_config)
+        finally:
+            self._invalidate(project_name, key)
+
+    def _invalidate(self, project_name: str, key: str):
+        """Drop a cached value after a write through this client."""
+        if self.cache is not None:
+            self.cache.invalidate(project_name, key)
+
+
+def _is_unavailable(error: Exception) -> bool:
+    """Whether an error means the API couldn't answer (as opposed to refusing)."""
+    if isinstance(error, VaultyAPIError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, (VaultyCircuitOpenError, VaultyTimeoutError, httpx.TransportError))
@@ -1,11 +1,18 @@
 """Token resource client."""
 
+import builtins
+from collections.abc import AsyncIterator
+from typing import Any
+
 from ..http import HTTPClient
 from ..models import (
     PaginatedResponse,
+    RawPage,
     TokenResponse,
 )
+from ..pagination import fetch_all_pages, iterate_items
 from ..retry import RetryConfig, retry_with_backoff
+from ..serialization import decode, decode_json
 
 
 class TokenResource:
@@ -37,35 +44,44 @@ class TokenResource:
                 data["password"] = password
 
             response = await self.http_client.post("/api/v1/tokens", json=data)
-            return TokenResponse(**response.json())
+            return decode(response, TokenResponse)
 
         return await retry_with_backoff(_create, self.retry_config)
 
-    async def list(self, page: int = 1, page_size: int = 50) -> PaginatedResponse[TokenResponse]:
+    async def list(
+        self, page: int = 1, page_size: int = 50, raw: bool = False
+    ) -> PaginatedResponse[TokenResponse] | RawPage:
         """List tokens with pagination.
 
         Args:
             page: Page number (1-indexed)
             page_size: Number of items per page (1-100)
+            raw: Return a RawPage of plain dicts instead of models (skips validation)
 
         Returns:
-            PaginatedResponse with tokens
+            PaginatedResponse with tokens (RawPage if raw)
         """
 
         async def _list():
             response = await self.http_client.get(
                 "/api/v1/tokens", params={"page": page, "page_size": page_size}
             )
-            data = response.json()
+            if raw:
+                data = decode_json(response)
+            else:
+                data = decode(
+                    response, PaginatedResponse[TokenResponse] | builtins.list[TokenResponse]
+                )
 
             # Handle both paginated response and direct list
-            if isinstance(data, list):
-                # Direct list response
-                items = [TokenResponse(**item) for item in data]
-                total = len(items)
+            if isinstance(data, builtins.list):
+                # Direct list response: the server ignored pagination, so slice the
+                # requested page out of the full list
+                total = len(data)
                 total_pages = 1 if total <= page_size else (total + page_size - 1) // page_size
-                return PaginatedResponse[TokenResponse](
-                    items=items,
+                page_type = RawPage if raw else PaginatedResponse[TokenResponse]
+                return page_type(
+                    items=data[(page - 1) * page_size : page * page_size],
                     total=total,
                     page=page,
                     page_size=page_size,
@@ -73,19 +89,45 @@ class TokenResource:
                     has_next=page < total_pages,
                     has_previous=page > 1,
                 )
-            # Paginated response
-            return PaginatedResponse[TokenResponse](
-                items=[TokenResponse(**item) for item in data["items"]],
-                total=data["total"],
-                page=data["page"],
-                page_size=data["page_size"],
-                total_pages=data["total_pages"],
-                has_next=data["has_next"],
-                has_previous=data["has_previous"],
-            )
+            return RawPage.from_dict(data) if raw else data
 
         return await retry_with_backoff(_list, self.retry_config)
 
+    def iter_all(
+        self, page_size: int = 100, prefetch: bool = True, raw: bool = False
+    ) -> AsyncIterator[TokenResponse | dict[str, Any]]:
+        """Iterate over all tokens, fetching pages as needed.
+
+        Args:
+            page_size: Number of items per page (1-100)
+            prefetch: Fetch the next page while the current one is being consumed
+            raw: Yield plain dicts instead of models (skips validation)
+
+        Returns:
+            Async iterator of TokenResponse (dicts if raw)
+        """
+        return iterate_items(
+            lambda page: self.list(page=page, page_size=page_size, raw=raw), prefetch=prefetch
+        )
+
+    async def fetch_all(
+        self, concurrency: int = 4, page_size: int = 100, raw: bool = False
+    ) -> builtins.list[TokenResponse] | builtins.list[dict[str, Any]]:
+        """Fetch all tokens, requesting the remaining pages concurrently.
+
+        Args:
+            concurrency: Maximum number of page requests in flight (default: 4)
+            page_size: Number of items per page (1-100)
+            raw: Return plain dicts instead of models (skips validation)
+
+        Returns:
+            List of all TokenResponse (dicts if raw), in page order
+        """
+        return await fetch_all_pages(
+            lambda page: self.list(page=page, page_size=page_size, raw=raw),
+            concurrency=concurrency,
+        )
+
     async def delete(self, token_id: str) -> None:
         """Delete token.
 
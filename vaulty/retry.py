@@ -2,15 +2,109 @@
 
 import asyncio
 import random
-from collections.abc import Callable
-from typing import TypeVar
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
 
-from .exceptions import VaultyAPIError, VaultyRateLimitError
+from .exceptions import (
+    VaultyAPIError,
+    VaultyCircuitOpenError,
+    VaultyRateLimitError,
+    VaultyTimeoutError,
+)
 from .logging import get_logger
 
 logger = get_logger(__name__)
 T = TypeVar("T")
 
+# Absolute time.monotonic() deadline set by `deadline()` for the current context
+_deadline: ContextVar[float | None] = ContextVar("vaulty_deadline", default=None)
+
+
+class RetryBudget:
+    """Client-wide cap on retries, as a fraction of recent requests.
+
+    Within a sliding `window` of seconds, retries are allowed while they stay
+    below `ratio` times the number of calls, with a floor of `min_retries` so
+    low-traffic clients can still retry. During an outage this keeps retries
+    from multiplying load on the server: the budget runs dry and calls fail fast.
+
+    Example:
+        >>> budget = RetryBudget(ratio=0.1)
+        >>> client = VaultyClient(api_token="vaulty_abc123...", retry_budget=budget)
+        >>> budget.stats()
+        {'requests': 120, 'retries': 4, 'rejected': 0, 'available': 8}
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0):
+        """Initialize retry budget.
+
+        Args:
+            ratio: Retries allowed per call in the window (default: 0.2)
+            min_retries: Retries always allowed per window (default: 10)
+            window: Sliding window length in seconds (default: 10.0)
+
+        Raises:
+            ValueError: If ratio, min_retries or window is negative or window is zero
+        """
+        if ratio < 0 or min_retries < 0 or window <= 0:
+            raise ValueError("ratio and min_retries must be >= 0 and window > 0")
+
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self.rejected = 0
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    def record_request(self):
+        """Record a call (first attempt)."""
+        self._requests.append(time.monotonic())
+
+    def can_retry(self) -> bool:
+        """Check whether a retry would fit in the budget, without spending it."""
+        self._expire()
+        return len(self._retries) < self._allowed()
+
+    def try_acquire(self) -> bool:
+        """Spend one retry from the budget.
+
+        Returns:
+            True if the retry may proceed, False if the budget is exhausted
+        """
+        if not self.can_retry():
+            self.rejected += 1
+            return False
+        self._retries.append(time.monotonic())
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Get budget counters for monitoring.
+
+        Returns:
+            Dict with requests and retries in the window, rejected retries (total)
+            and retries still available
+        """
+        self._expire()
+        return {
+            "requests": len(self._requests),
+            "retries": len(self._retries),
+            "rejected": self.rejected,
+            "available": max(0, self._allowed() - len(self._retries)),
+        }
+
+    def _allowed(self) -> int:
+        return max(self.min_retries, int(len(self._requests) * self.ratio))
+
+    def _expire(self):
+        cutoff = time.monotonic() - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
 
 class RetryConfig:
     """Configuration for retry behavior."""
@@ -22,19 +116,101 @@ class RetryConfig:
         max_delay: float = 60.0,
         backoff_factor: float = 2.0,
         jitter: bool = True,
+        deadline: float | None = None,
+        budget: RetryBudget | None = None,
     ):
         self.max_retries = max_retries
         self.initial_delay = initial_delay
         self.max_delay = max_delay
         self.backoff_factor = backoff_factor
         self.jitter = jitter
+        # Seconds a call may take in total, attempts and sleeps included
+        self.deadline = deadline
+        # Shared retry budget (None: every call may use all of max_retries)
+        self.budget = budget
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Bound the total time of every Vaulty call made in the block.
+
+    The deadline covers attempts and retry sleeps and propagates to tasks created
+    inside the block (e.g. by `get_many`). Nested deadlines keep the earliest one.
+
+    Args:
+        seconds: Time budget for the block
+
+    Raises:
+        VaultyTimeoutError: From calls still running when the deadline passes
+
+    Example:
+        >>> with deadline(5.0):
+        ...     secrets = await client.secrets.get_many("my-project", keys)
+    """
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires_at if current is None else min(current, expires_at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def get_deadline() -> float | None:
+    """Get the `time.monotonic()` deadline of the current context, if any."""
+    return _deadline.get()
+
+
+def _call_deadline(config: RetryConfig) -> float | None:
+    """Earliest of the context deadline and the per-call deadline."""
+    expires_at = _deadline.get()
+    if config.deadline is not None:
+        call_expires_at = time.monotonic() + config.deadline
+        expires_at = call_expires_at if expires_at is None else min(expires_at, call_expires_at)
+    return expires_at
+
+
+async def _attempt(
+    func: Callable[..., Awaitable[T]], expires_at: float | None, *args, **kwargs
+) -> T:
+    """Run one attempt, cut short at the deadline."""
+    if expires_at is None:
+        return await func(*args, **kwargs)
+
+    remaining = expires_at - time.monotonic()
+    if remaining <= 0:
+        raise VaultyTimeoutError("Deadline exceeded before the request was sent")
+
+    timeout = asyncio.timeout(remaining)
+    try:
+        async with timeout:
+            return await func(*args, **kwargs)
+    except TimeoutError as e:
+        if timeout.expired():
+            raise VaultyTimeoutError(f"Deadline exceeded after {remaining:.2f}s") from e
+        raise
+
+
+def _may_retry(config: RetryConfig, expires_at: float | None, delay: float) -> bool:
+    """Check the deadline and retry budget before sleeping for a retry."""
+    if expires_at is not None and time.monotonic() + delay >= expires_at:
+        logger.warning(f"Not retrying: a {delay:.2f}s backoff would pass the deadline")
+        return False
+    if config.budget is not None and not config.budget.try_acquire():
+        logger.warning("Not retrying: retry budget exhausted")
+        return False
+    return True
 
 
 async def retry_with_backoff(
-    func: Callable[..., T], config: RetryConfig = None, *args, **kwargs
+    func: Callable[..., Awaitable[T]], config: RetryConfig | None = None, *args, **kwargs
 ) -> T:
     """Retry a function with exponential backoff.
 
+    Retries stop early, re-raising the last error, when the next backoff would
+    pass the deadline (`config.deadline` or an enclosing `deadline()` block) or
+    the shared retry budget is exhausted.
+
     Args:
         func: Async function to retry
         config: Retry configuration
@@ -46,15 +222,24 @@ async def retry_with_backoff(
 
     Raises:
         VaultyAPIError: If all retries fail
+        VaultyTimeoutError: If the deadline passes during an attempt
+        VaultyCircuitOpenError: If the endpoint's circuit breaker is open (not retried)
     """
     if config is None:
         config = RetryConfig()
 
+    expires_at = _call_deadline(config)
+    if config.budget is not None:
+        config.budget.record_request()
+
     last_exception = None
 
     for attempt in range(config.max_retries + 1):
         try:
-            return await func(*args, **kwargs)
+            return await _attempt(func, expires_at, *args, **kwargs)
+        except (VaultyTimeoutError, VaultyCircuitOpenError):
+            # Out of time, or the endpoint is known to be failing: retrying won't help
+            raise
         except VaultyRateLimitError as e:
             # Handle rate limit errors specially
             last_exception = e
@@ -68,6 +253,8 @@ async def retry_with_backoff(
                 delay = min(delay, config.max_delay)
                 if config.jitter:
                     delay += random.uniform(0, delay * 0.1)
+                if not _may_retry(config, expires_at, delay):
+                    raise
                 logger.info(
                     f"Rate limit hit, retrying in {delay:.2f}s (attempt {attempt + 1}/{config.max_retries + 1})",
                     extra={
@@ -88,6 +275,8 @@ async def retry_with_backoff(
                 delay = min(delay, config.max_delay)
                 if config.jitter:
                     delay += random.uniform(0, delay * 0.1)
+                if not _may_retry(config, expires_at, delay):
+                    raise
                 logger.warning(
                     f"Server error {e.status_code}, retrying in {delay:.2f}s (attempt {attempt + 1}/{config.max_retries + 1})",
                     extra={"attempt": attempt + 1, "status_code": e.status_code, "delay": delay},
@@ -103,6 +292,8 @@ async def retry_with_backoff(
                 delay = min(delay, config.max_delay)
                 if config.jitter:
                     delay += random.uniform(0, delay * 0.1)
+                if not _may_retry(config, expires_at, delay):
+                    raise
                 logger.warning(
                     f"Request failed: {type(e).__name__}, retrying in {delay:.2f}s (attempt {attempt + 1}/{config.max_retries + 1})",
                     exc_info=True,
@@ -0,0 +1,154 @@
+"""Response decoding for Vaulty SDK."""
+
+import functools
+import json
+import os
+from collections.abc import Callable
+from typing import Any, TypeVar, overload
+
+from pydantic import TypeAdapter
+
+from .logging import get_logger
+from .models import PaginatedResponse, RawPage
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+JSON_BACKEND_ENV = "VAULTY_JSON_BACKEND"
+
+# "pydantic" validates straight from bytes (pydantic-core's JSON parser); "orjson"
+# and "msgspec" parse with that library first, then validate the Python objects.
+JSON_BACKENDS = ("pydantic", "orjson", "msgspec")
+
+
+class _Backend:
+    """JSON backend in use (module-wide)."""
+
+    name = "pydantic"
+    loads: Callable[[bytes], Any] = staticmethod(json.loads)
+
+
+@functools.cache
+def type_adapter(type_: Any) -> TypeAdapter:
+    """Get the (cached) TypeAdapter for a type, e.g. ``PaginatedResponse[SecretResponse]``."""
+    return TypeAdapter(type_)
+
+
+def set_json_backend(name: str):
+    """Select the JSON parser used to decode responses.
+
+    Args:
+        name: "pydantic" (default), "orjson" (`pip install vaulty-client[orjson]`)
+            or "msgspec" (`pip install vaulty-client[msgspec]`)
+
+    Raises:
+        ValueError: If the backend is unknown or its package is not installed
+    """
+    parse: Callable[[bytes], Any]
+    if name == "pydantic":
+        parse = json.loads
+    elif name == "orjson":
+        try:
+            import orjson
+        except ImportError as e:
+            raise ValueError(
+                "orjson backend requires orjson: pip install vaulty-client[orjson]"
+            ) from e
+        parse = orjson.loads
+    elif name == "msgspec":
+        try:
+            import msgspec
+        except ImportError as e:
+            raise ValueError(
+                "msgspec backend requires msgspec: pip install vaulty-client[msgspec]"
+            ) from e
+        parse = msgspec.json.decode
+    else:
+        raise ValueError(f"Unknown JSON backend {name!r}, expected one of {JSON_BACKENDS}")
+
+    _Backend.name = name
+    _Backend.loads = staticmethod(parse)
+
+
+def get_json_backend() -> str:
+    """Get the name of the JSON backend in use."""
+    return _Backend.name
+
+
+@overload
+def decode(response: Any, type_: type[T]) -> T: ...
+
+
+@overload
+def decode(response: Any, type_: Any) -> Any: ...
+
+
+def decode(response: Any, type_: Any) -> Any:
+    """Decode a response body into `type_` in one validation pass.
+
+    Args:
+        response: httpx.Response (anything with ``json()`` is accepted, e.g. mocks)
+        type_: Model or type to validate, e.g. ``PaginatedResponse[ActivityResponse]``
+            (unions such as ``Model | list[Model]`` are accepted too)
+
+    Returns:
+        Validated instance of `type_`
+
+    Raises:
+        pydantic.ValidationError: If the body doesn't match `type_`
+    """
+    adapter = type_adapter(type_)
+    content = getattr(response, "content", None)
+    if not isinstance(content, bytes):
+        return adapter.validate_python(response.json())
+    if _Backend.name == "pydantic":
+        return adapter.validate_json(content)
+    return adapter.validate_python(_Backend.loads(content))
+
+
+def decode_json(response: Any) -> Any:
+    """Parse a response body into plain Python objects, without validation.
+
+    Args:
+        response: httpx.Response (anything with ``json()`` is accepted, e.g. mocks)
+
+    Returns:
+        Decoded JSON (dicts, lists, strings, ...)
+    """
+    content = getattr(response, "content", None)
+    if not isinstance(content, bytes):
+        return response.json()
+    return _Backend.loads(content)
+
+
+def decode_page(
+    response: Any, item_type: type[T], raw: bool = False
+) -> PaginatedResponse[T] | RawPage:
+    """Decode a paginated response body.
+
+    Args:
+        response: httpx.Response
+        item_type: Model of the page items, e.g. SecretResponse
+        raw: Return a RawPage of plain dicts instead of validated models
+
+    Returns:
+        PaginatedResponse[item_type], or RawPage if raw is True
+    """
+    if raw:
+        return RawPage.from_dict(decode_json(response))
+    return decode(response, PaginatedResponse[item_type])  # type: ignore[valid-type]
+
+
+def _configure_from_env():
+    """Apply VAULTY_JSON_BACKEND; a bad value must not break ``import vaulty``."""
+    name = os.getenv(JSON_BACKEND_ENV)
+    if not name:
+        return
+    try:
+        set_json_backend(name)
+    except ValueError as e:
+        logger.warning(f"Ignoring {JSON_BACKEND_ENV}={name!r}, using the pydantic backend: {e}")
+
+
+_configure_from_env()
@@ -0,0 +1,172 @@
+"""Synchronous facade over VaultyClient."""
+
+import asyncio
+import functools
+import threading
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterator
+from typing import Any, TypeVar
+
+from .client import VaultyClient
+
+T = TypeVar("T")
+
+# Resource attributes of VaultyClient mirrored by SyncVaultyClient
+_RESOURCES = ("auth", "customers", "projects", "secrets", "tokens", "activities", "health")
+
+
+class _LoopThread:
+    """Event loop running forever in a daemon thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="vaulty-sync-loop", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the loop and block until it completes."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("SyncVaultyClient can't be called from its own event loop")
+        if self.loop.is_closed():
+            coro.close()
+            raise RuntimeError("SyncVaultyClient is closed")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def stop(self):
+        """Stop the loop and wait for the thread to exit."""
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class _SyncIterator(Iterator[T]):
+    """Blocking iterator over an async iterator running on the loop thread."""
+
+    def __init__(self, iterator: AsyncIterator[T], runner: _LoopThread):
+        self._iterator = iterator
+        self._runner = runner
+
+    def __iter__(self) -> "_SyncIterator[T]":
+        return self
+
+    def __next__(self) -> T:
+        try:
+            return self._runner.run(self._anext())
+        except StopAsyncIteration:
+            raise StopIteration from None
+
+    async def _anext(self) -> T:
+        # __anext__ is only guaranteed to return an awaitable; the loop needs a coroutine
+        return await self._iterator.__anext__()
+
+    def close(self):
+        """Stop iterating early and release the async iterator."""
+        aclose = getattr(self._iterator, "aclose", None)
+        if aclose is not None:
+            self._runner.run(aclose())
+
+
+def _blocking(method: Callable[..., Any], runner: _LoopThread) -> Callable[..., Any]:
+    """Wrap an async method (or one returning an async iterator) to block instead."""
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        result = method(*args, **kwargs)
+        if asyncio.iscoroutine(result):
+            return runner.run(result)
+        if isinstance(result, AsyncIterator):
+            return _SyncIterator(result, runner)
+        return result
+
+    return wrapper
+
+
+class _SyncProxy:
+    """Blocking view of a resource: async methods become regular methods."""
+
+    def __init__(self, target: Any, runner: _LoopThread):
+        self._target = target
+        self._runner = runner
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        if callable(value):
+            return _blocking(value, self._runner)
+        return value
+
+    def __repr__(self) -> str:
+        return f"<sync {self._target!r}>"
+
+
+class SyncVaultyClient:
+    """Thread-safe synchronous client for Vaulty API.
+
+    Mirrors `VaultyClient`: every resource method takes the same arguments and
+    returns the same models, but blocks instead of returning a coroutine, and
+    `iter_all()` returns a regular iterator. Calls run on one long-lived event
+    loop in a background thread, so the connection pool (and the secret cache)
+    is kept between calls instead of being rebuilt by `asyncio.run()` each time.
+    The client can be shared by threads; their calls run concurrently on the loop.
+
+    Must not be used from code already running on an event loop; use
+    `VaultyClient` there.
+
+    Example:
+        >>> with SyncVaultyClient(api_token="vaulty_abc123...") as client:
+        ...     secret = client.secrets.get_value("my-project", "API_KEY")
+        ...     for activity in client.activities.iter_all(action="create_secret"):
+        ...         print(activity.action)
+    """
+
+    def __init__(self, client: VaultyClient | None = None, **kwargs):
+        """Initialize sync client.
+
+        Args:
+            client: VaultyClient to wrap. When omitted, one is created from kwargs.
+            **kwargs: VaultyClient arguments (api_token, base_url, secret_cache_ttl, ...)
+        """
+        self._client = client if client is not None else VaultyClient(**kwargs)
+        self._runner = _LoopThread()
+        for name in _RESOURCES:
+            setattr(self, name, _SyncProxy(getattr(self._client, name), self._runner))
+
+    @classmethod
+    def from_config(cls) -> "SyncVaultyClient":
+        """Load client from configuration file (see `VaultyClient.from_config`)."""
+        return cls(VaultyClient.from_config())
+
+    @classmethod
+    def from_env(cls) -> "SyncVaultyClient":
+        """Load client from environment variables (see `VaultyClient.from_env`)."""
+        return cls(VaultyClient.from_env())
+
+    @property
+    def async_client(self) -> VaultyClient:
+        """The wrapped VaultyClient (only use it on the client's own loop)."""
+        return self._client
+
+    def __getattr__(self, name: str) -> Any:
+        # Client-level methods (e.g. apply_rate_limit_settings) and attributes
+        value = getattr(self._client, name)
+        if callable(value):
+            return _blocking(value, self._runner)
+        return value
+
+    def __enter__(self) -> "SyncVaultyClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close HTTP connections and stop the background loop."""
+        if self._runner.loop.is_closed():
+            return
+        try:
+            self._runner.run(self._client.close())
+        finally:
+            self._runner.stop()
@@ -0,0 +1,37 @@
+"""Shared helpers for Vaulty SDK."""
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_with_concurrency(
+    aws: Iterable[Awaitable[T]], concurrency: int, return_exceptions: bool = False
+) -> list[Any]:
+    """Await awaitables with at most `concurrency` of them running at once.
+
+    Results are returned in the same order as the input, like `asyncio.gather`.
+
+    Args:
+        aws: Awaitables to run
+        concurrency: Maximum number of awaitables in flight (must be >= 1)
+        return_exceptions: Return exceptions as results instead of raising the first one
+
+    Returns:
+        List of results in input order
+
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(_run(aw) for aw in aws), return_exceptions=return_exceptions)